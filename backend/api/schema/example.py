@@ -2,8 +2,12 @@ from django.conf import settings
 from drf_spectacular.extensions import OpenApiViewExtension
 from drf_spectacular.utils import (
     extend_schema,
+    extend_schema_field,
     extend_schema_view,
+    inline_serializer,
 )
+from rest_framework import serializers
+from apps.example.serializers import CollectionSerializer
 
 
 # Fix settings
@@ -33,6 +37,26 @@ Google Api Guide - [요청 유효성 검사](https://cloud.google.com/apis/desig
 
 자세한 구현 방식은 ValidateOnlyGenericViewSetMixin을 살펴보기 바랍니다.
 
+### \- Read Mask
+Google Api Guide - [부분 응답](https://cloud.google.com/apis/design/design_patterns?hl=ko)을 참고하였습니다.
+
+해당 기능은 조회 작업에서 필요한 필드만을 응답받고자 할 때 사용됩니다.
+
+해당 기능을 지원하는 endpoint는 read_mask query parameter를 허용합니다.
+
+쿼리 스트링에 read_mask=id,title과 같이 콤마(,)로 구분된 필드가 전달되면, 해당 필드만 응답에 포함되며 데이터베이스에서도 해당 컬럼만 조회합니다.
+
+자세한 구현 방식은 ReadMaskGenericViewSetMixin을 살펴보기 바랍니다.
+
+### \- ETag
+조회 응답에는 ETag 헤더가 포함됩니다.
+
+조회 요청의 If-None-Match 헤더에 이전에 응답받은 ETag를 전달하면, 리소스가 변경되지 않았을 경우 본문 없이 304 Response를 반환합니다.
+
+수정 요청의 If-Match 헤더에 ETag를 전달하면, 그 사이 리소스가 변경되었을 경우 수정하지 않고 412 Response를 반환합니다.
+
+자세한 구현 방식은 ConditionalRequestMixin을 살펴보기 바랍니다.
+
 ### \- Custom Method
 Google Api Guide - [커스텀 메서드](https://cloud.google.com/apis/design/custom_methods?hl=ko)를 참고하였습니다.
 
@@ -41,8 +65,14 @@ Google Api Guide - [커스텀 메서드](https://cloud.google.com/apis/design/cu
 | Endpoint | Description |
 | --- | --- |
 | collections:batchGet | 리소스 식별자 목록을 활용하여 리소스 일괄 가져오기 |
+| collections:batchCreate | 리소스 목록을 하나의 트랜잭션으로 일괄 생성하기 |
+| collections:batchUpdate | 리소스 목록을 하나의 트랜잭션으로 일괄 수정하기 |
+| collections:batchDelete | 리소스 식별자 목록을 활용하여 리소스 일괄 삭제하기 |
 | collections:search | 기존 collection get과는 다른 방식으로 리소스 가져오기  |
+| collections:export | 필터링된 전체 리소스를 NDJSON 또는 JSON으로 스트리밍하기 |
+| collections/\{collection_pk\}/nested-collections:export | 필터링된 전체 리소스를 NDJSON 또는 JSON으로 스트리밍하기 |
 | collections/\{collection_pk\}/nested-collections/\{pk\}:move| 리소스의 위치 변경에 사용되는 엔드포인트 |
+| collections/\{collection_pk\}/nested-collections:batchMove | 리소스 식별자 목록을 활용하여 리소스의 위치를 일괄 변경하기 |
 
 자세한 구현 방식은 CustomMethodMixin, custom_routes를 살펴보기 바랍니다.
 
@@ -118,11 +148,80 @@ collection_destroy_schema = extend_schema(
 
 collection_batch_get_description = """
 pk를 활용하여 일괄적으로 리소스들을 가져옵니다.
+
+- 결과는 valueList에 전달된 순서를 따르며, 중복된 pk는 한 번만 반환됩니다.
+- 존재하지 않는 pk의 자리는 null로 채워집니다.
+- 페이지네이션이 적용되지 않으며 응답은 results만을 포함합니다.
 """
+# ListField는 child가 serializer라면 nullable을 표시하지 않으므로 필드로 감싼다.
+@extend_schema_field(CollectionSerializer)
+class NullableCollectionField(serializers.DictField):
+    pass
+
+
 collection_batch_get_schema = extend_schema(
     description=collection_batch_get_description,
     summary="컬렉션 일괄 목록",
     tags=["collection"],
+    responses=inline_serializer(
+        "CollectionBatchGetResponse",
+        fields={
+            "results": serializers.ListField(
+                child=NullableCollectionField(allow_null=True)
+            )
+        },
+    ),
+)
+
+collection_batch_create_description = """
+resources에 전달된 리소스 목록을 하나의 트랜잭션으로 일괄 생성합니다.
+
+- 하나의 리소스라도 유효하지 않다면 아무것도 생성되지 않으며, 400 Response는 요청된 순서대로 리소스별 에러를 포함합니다.
+- 한 번에 최대 1000개의 리소스를 생성할 수 있습니다.
+- validate_only=true가 전달되면 유효성 검사만을 수행합니다.
+"""
+collection_batch_create_schema = extend_schema(
+    description=collection_batch_create_description,
+    summary="컬렉션 일괄 생성",
+    tags=["collection"],
+    request=inline_serializer(
+        "CollectionBatchCreateRequest",
+        fields={"resources": serializers.ListField(child=serializers.DictField())},
+    ),
+)
+
+collection_batch_update_description = """
+resources에 전달된 리소스 목록을 하나의 트랜잭션으로 일괄 수정합니다.
+
+- 각 리소스는 id를 포함해야 하며, 전달된 필드만 수정됩니다.
+- 존재하지 않는 id가 포함되어 있다면 404 Response를 반환합니다.
+- validate_only=true가 전달되면 유효성 검사만을 수행합니다.
+"""
+collection_batch_update_schema = extend_schema(
+    description=collection_batch_update_description,
+    summary="컬렉션 일괄 수정",
+    tags=["collection"],
+    request=inline_serializer(
+        "CollectionBatchUpdateRequest",
+        fields={"resources": serializers.ListField(child=serializers.DictField())},
+    ),
+)
+
+collection_batch_delete_description = """
+valueList에 전달된 pk 목록에 해당하는 리소스를 일괄 삭제합니다.
+
+- 존재하지 않는 pk가 포함되어 있다면 아무것도 삭제되지 않으며 404 Response를 반환합니다.
+- validate_only=true가 전달되면 리소스의 존재 여부만 확인합니다.
+"""
+collection_batch_delete_schema = extend_schema(
+    description=collection_batch_delete_description,
+    summary="컬렉션 일괄 삭제",
+    tags=["collection"],
+    request=inline_serializer(
+        "CollectionBatchDeleteRequest",
+        fields={"valueList": serializers.ListField(child=serializers.IntegerField())},
+    ),
+    responses={204: None},
 )
 
 collection_search_description = """
@@ -134,6 +233,19 @@ collection_search_schema = extend_schema(
     tags=["collection"],
 )
 
+collection_export_description = """
+페이지네이션 없이 필터링된 전체 리소스를 스트리밍합니다.
+
+exportFormat=ndjson(default)일 경우 한 줄에 하나의 리소스를, exportFormat=json일 경우 리소스 배열을 반환합니다.
+
+search와 동일한 필터 및 정렬 기능을 제공합니다.
+"""
+collection_export_schema = extend_schema(
+    description=collection_export_description,
+    summary="컬렉션 내보내기",
+    tags=["collection"],
+)
+
 
 class FixCollectionViewSet(OpenApiViewExtension):
     target_class = "apps.example.views.CollectionViewSet"
@@ -146,7 +258,11 @@ class FixCollectionViewSet(OpenApiViewExtension):
             partial_update=collection_partial_update_schema,
             destroy=collection_destroy_schema,
             batch_get=collection_batch_get_schema,
+            batch_create=collection_batch_create_schema,
+            batch_update=collection_batch_update_schema,
+            batch_delete=collection_batch_delete_schema,
             search=collection_search_schema,
+            export=collection_export_schema,
         )(self.target_class)
         return FixedViewSet
 
@@ -204,6 +320,9 @@ nested_collection_move_description = """
 리소스의 이동 작업(url의 변동)은 put이나 patch가 아닌 별도의 엔드포인트로 처리합니다.
 
 해당 리소스를 다른 상위 리소스로 이동합니다.
+
+- 이동할 상위 리소스에 같은 title의 리소스가 있다면 400 Response를 반환합니다.
+- validate_only=true가 전달되면 이동할 수 있는지만 확인합니다.
 """
 nested_collection_move_schema = extend_schema(
     description=nested_collection_move_description,
@@ -211,6 +330,38 @@ nested_collection_move_schema = extend_schema(
     tags=["nested collection"],
 )
 
+nested_collection_batch_move_description = """
+valueList에 전달된 pk 목록에 해당하는 리소스를 parent로 일괄 이동합니다.
+
+- 하나의 리소스라도 이동할 수 없다면 아무것도 이동하지 않습니다.
+- 존재하지 않는 pk가 포함되어 있다면 404, parent에 같은 title의 리소스가 있다면 400 Response를 반환합니다.
+- 한 번에 최대 1000개의 리소스를 이동할 수 있습니다.
+- validate_only=true가 전달되면 이동할 수 있는지만 확인합니다.
+"""
+nested_collection_batch_move_schema = extend_schema(
+    description=nested_collection_batch_move_description,
+    summary="중첩 컬렉션 일괄 이동",
+    tags=["nested collection"],
+    request=inline_serializer(
+        "NestedCollectionBatchMoveRequest",
+        fields={
+            "valueList": serializers.ListField(child=serializers.IntegerField()),
+            "parent": serializers.IntegerField(),
+        },
+    ),
+)
+
+nested_collection_export_description = """
+페이지네이션 없이 필터링된 전체 리소스를 스트리밍합니다.
+
+exportFormat=ndjson(default)일 경우 한 줄에 하나의 리소스를, exportFormat=json일 경우 리소스 배열을 반환합니다.
+"""
+nested_collection_export_schema = extend_schema(
+    description=nested_collection_export_description,
+    summary="중첩 컬렉션 내보내기",
+    tags=["nested collection"],
+)
+
 
 class FixCollectionViewSet(OpenApiViewExtension):
     target_class = "apps.example.views.NestedCollectionViewSet"
@@ -223,6 +374,8 @@ class FixCollectionViewSet(OpenApiViewExtension):
             partial_update=nested_collection_partial_update_schema,
             destroy=nested_collection_destroy_schema,
             move=nested_collection_move_schema,
+            batch_move=nested_collection_batch_move_schema,
+            export=nested_collection_export_schema,
         )(self.target_class)
         return FixedViewSet
 
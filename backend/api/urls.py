@@ -1,5 +1,6 @@
 from django.urls import register_converter
 from utils.drf_custom import routers
+from utils.drf_custom.resolvers import compile_urlpatterns
 from apps.example import views
 from .converters import VersionConverter
 
@@ -33,11 +34,14 @@ nested_resource_router.register(
 
 # API URL Build
 # =============================================================================
-urlpatterns = [
-    *collections_router.urls,
-    *nested_collections_router.urls,
-    *nested_resource_router.urls,
-]
+# 모든 router의 pattern을 첫 토큰 단위의 정규식으로 합쳐 resolve한다. (utils.drf_custom.resolvers)
+urlpatterns = compile_urlpatterns(
+    [
+        *collections_router.urls,
+        *nested_collections_router.urls,
+        *nested_resource_router.urls,
+    ]
+)
 
 
 # Load Drf Spectacular Schemas
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ExampleConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.example"
+
+    def ready(self):
+        from utils.drf_custom.cache import track_model_changes
+
+        track_model_changes(*self.get_models())
@@ -1,4 +1,4 @@
-from utils.drf_custom.filterset import FilterSet
+from utils.drf_custom.filterset import FilterSet, TrigramContainsFilter
 from .models import Collection, NestedCollection, NestedResource
 
 # from utils.drf_custom.filterset import django_filters as filters  # use write (has hint)
@@ -12,9 +12,8 @@ class NumberRangeFilter(filters.BaseRangeFilter, filters.NumberFilter):
 class CollectionFilter(FilterSet):
 
     title = filters.CharFilter(help_text="title과 일치하는 Collection을 조회합니다.")
-    title__contains = filters.CharFilter(
+    title__contains = TrigramContainsFilter(
         field_name="title",
-        lookup_expr="icontains",
         help_text="title 내에 문자열이 포함된 Collection을 조회합니다.",
     )
 
@@ -0,0 +1,74 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+from utils.db.bulk import bulk_insert
+from utils.drf_custom.cache import model_changed
+from ...models import Collection, NestedCollection, NestedResource
+
+
+class Command(BaseCommand):
+    help = "벤치마크, 개발 환경에서 사용할 예제 데이터를 대량으로 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--collections",
+            type=int,
+            default=1000,
+            help="생성할 Collection의 수",
+        )
+        parser.add_argument(
+            "--nested-collections",
+            type=int,
+            default=0,
+            help="Collection마다 생성할 NestedCollection의 수",
+        )
+        parser.add_argument(
+            "--nested-resources",
+            action="store_true",
+            help="Collection마다 NestedResource를 생성합니다.",
+        )
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        started_at = time.perf_counter()
+        batch_size = options["batch_size"]
+        with transaction.atomic():
+            # 기존 데이터와 title이 겹치지 않도록 이어서 생성한다.
+            offset = Collection.objects.count()
+            last_pk = Collection.objects.aggregate(last_pk=Max("pk"))["last_pk"] or 0
+            rows = (
+                (f"[{offset + i}] Collection",) for i in range(options["collections"])
+            )
+            counts = {}
+            counts[Collection] = bulk_insert(
+                Collection, ["title"], rows, batch_size=batch_size
+            )
+            parent_ids = Collection.objects.filter(pk__gt=last_pk).order_by("pk")
+            parent_ids = list(parent_ids.values_list("pk", flat=True))
+            nested_collections = options["nested_collections"]
+            if nested_collections:
+                rows = (
+                    (parent_id, f"[{i}] N-Collection")
+                    for parent_id in parent_ids
+                    for i in range(nested_collections)
+                )
+                counts[NestedCollection] = bulk_insert(
+                    NestedCollection, ["parent", "title"], rows, batch_size=batch_size
+                )
+            if options["nested_resources"]:
+                rows = (
+                    (parent_id, f"{parent_id}의 중첩된 리소스") for parent_id in parent_ids
+                )
+                counts[NestedResource] = bulk_insert(
+                    NestedResource, ["parent", "title"], rows, batch_size=batch_size
+                )
+        # bulk_insert는 signal을 발생시키지 않으므로 model version을 직접 증가시킨다.
+        for model in counts:
+            model_changed(model)
+        elapsed = time.perf_counter() - started_at
+        for model, count in counts.items():
+            self.stdout.write(f"{model._meta.label}: {count:,}")
+        self.stdout.write(
+            self.style.SUCCESS(f"{sum(counts.values()):,} rows in {elapsed:.2f}s")
+        )
@@ -0,0 +1,20 @@
+from django.db import migrations
+from utils.drf_custom.lookups import TrigramExtension, create_trigram_index
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행될 수 없다.
+    atomic = False
+
+    dependencies = [
+        ("example", "0002_alter_collection_title"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(
+            *create_trigram_index(
+                "example.Collection", "title", "example_collection_title_trgm"
+            )
+        ),
+    ]
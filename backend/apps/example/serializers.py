@@ -1,32 +1,40 @@
-from django.shortcuts import get_object_or_404
 from rest_framework import serializers
+from utils.drf_custom.serializers import (
+    BulkListSerializer,
+    FastReadSerializerMixin,
+    UniqueConflictSerializerMixin,
+)
 from .models import Collection, NestedCollection, NestedResource
 
 
-class CollectionSerializer(serializers.ModelSerializer):
+class CollectionSerializer(FastReadSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Collection
         fields = "__all__"
+        list_serializer_class = BulkListSerializer
 
 
-class NestedCollectionSerializer(serializers.ModelSerializer):
+class NestedCollectionSerializer(
+    UniqueConflictSerializerMixin, FastReadSerializerMixin, serializers.ModelSerializer
+):
+    unique_conflict_errors = {
+        ("parent", "title"): {
+            "title": "collection에 이미 해당 title의 nested collection 리소스가 존재합니다."
+        }
+    }
+
     class Meta:
         model = NestedCollection
         fields = "__all__"
         read_only_fields = ["parent"]
 
-    def validate(self, attrs):
-        collection_pk: str = self.context["view"].kwargs["collection_pk"]
-        collection = get_object_or_404(Collection, pk=collection_pk)
-        if NestedCollection.objects.filter(
-            parent=collection, title=attrs["title"]
-        ).exists():
-            raise serializers.ValidationError(
-                detail={
-                    "title": "collection에 이미 해당 title의 nested collection 리소스가 존재합니다."
-                }
-            )
-        return attrs
+    def get_unique_conflict_values(self, attrs):
+        # 생성의 parent는 perform_create에서 전달되므로 validate_only에서는 Path 변수로 확인한다.
+        values = super().get_unique_conflict_values(attrs)
+        if "parent" not in values:
+            view = self.context["view"]
+            values["parent"] = view.get_path_variable_object("collection_pk")
+        return values
 
 
 class MoveNestedCollectionSerializer(serializers.ModelSerializer):
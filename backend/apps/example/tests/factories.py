@@ -1,15 +1,16 @@
 import factory
+from utils.testing.factories import BulkDjangoModelFactory
 from ..models import Collection, NestedCollection, NestedResource
 
 
-class CollectionFactory(factory.django.DjangoModelFactory):
+class CollectionFactory(BulkDjangoModelFactory):
     title = factory.Sequence(lambda n: f"[{n}] Collection")
 
     class Meta:
         model = Collection
 
 
-class NestedCollectionFactory(factory.django.DjangoModelFactory):
+class NestedCollectionFactory(BulkDjangoModelFactory):
     parent = factory.SubFactory(CollectionFactory)
     title = factory.Sequence(lambda n: f"[{n}] N-Collection")
 
@@ -17,7 +18,7 @@ class NestedCollectionFactory(factory.django.DjangoModelFactory):
         model = NestedCollection
 
 
-class NestedResourceFactory(factory.django.DjangoModelFactory):
+class NestedResourceFactory(BulkDjangoModelFactory):
     parent = factory.SubFactory(CollectionFactory)
     title = factory.Sequence(lambda n: f"[{n}] N-Resource")
 
@@ -0,0 +1,177 @@
+import asyncio
+import json
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIHandler
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from utils.drf_custom import mixins, routers
+from utils.drf_custom.viewsets import AsyncViewSetMixin
+from utils.metrics.middleware import get_registry
+from utils.metrics.registry import empty_stats
+from ..models import NestedCollection
+from ..views import CollectionViewSet, NestedCollectionViewSet
+from .factories import CollectionFactory, NestedCollectionFactory
+
+
+# AsyncGenericViewSet의 동작을 확인하기 위한 테스트 전용 ViewSet, URL conf
+# =============================================================================
+class AsyncNestedCollectionViewSet(
+    mixins.AsyncCreateModelMixin,
+    mixins.AsyncListModelMixin,
+    mixins.AsyncRetrieveModelMixin,
+    mixins.AsyncPartialUpdateModelMixin,
+    mixins.AsyncDestroyModelMixin,
+    AsyncViewSetMixin,
+    NestedCollectionViewSet,
+):
+    pass
+
+
+collections_router = routers.CustomSimpleRouter()
+collections_router.trailing_slash = "/?"
+collections_router.register(
+    "collections", CollectionViewSet, basename="async-collection"
+)
+nested_collections_router = routers.CustomNestedSimpleRouter(
+    collections_router, "collections", lookup="collection"
+)
+nested_collections_router.register(
+    "nested-collections",
+    AsyncNestedCollectionViewSet,
+    basename="async-nested-collection",
+)
+urlpatterns = [*collections_router.urls, *nested_collections_router.urls]
+
+
+class AsyncViewSetMixinTestCase(SimpleTestCase):
+    def test_as_view(self):
+        # AsyncViewSetMixin을 사용한 ViewSet만 async view로 처리된다.
+        view = AsyncNestedCollectionViewSet.as_view({"get": "list"})
+        self.assertTrue(asyncio.iscoroutinefunction(view))
+        view = NestedCollectionViewSet.as_view({"get": "list"})
+        self.assertFalse(asyncio.iscoroutinefunction(view))
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncNestedCollectionViewSetTestCase(TransactionTestCase):
+    # sync 작업이 테스트 스레드가 아닌 스레드(config.asgi의 요청 스레드, ThreadIterator)에서 실행되므로
+    # 다른 스레드에서도 데이터를 조회할 수 있도록 TransactionTestCase를 사용한다.
+    def setUp(self) -> None:
+        self.nested_collection = NestedCollectionFactory()
+        self.collection = self.nested_collection.parent
+        self.other_collection = CollectionFactory()
+
+    # Django 3.2의 AsyncClient는 multipart 요청 본문을 읽지 못하므로 json으로 요청한다.
+    def get_url(self, name, collection_pk, **kwargs):
+        return reverse(name, kwargs={"collection_pk": collection_pk, **kwargs})
+
+    async def test_list(self):
+        url = self.get_url("async-nested-collection-list", "-")
+        key = ("async-nested-collection-list", "GET")
+        before = get_registry().snapshot().get(key, empty_stats())
+        response = await self.async_client.get(url)
+        after = get_registry().snapshot()[key]
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"][0]["id"], self.nested_collection.id)
+        # 요청 스레드에서 실행된 쿼리도 기록된다.
+        self.assertGreater(after["queries"] - before["queries"], 0)
+
+    async def test_create(self):
+        url = self.get_url("async-nested-collection-list", self.collection.pk)
+        response = await self.async_client.post(
+            url, {"title": "비동기 생성"}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["parent"], self.collection.pk)
+        response = await self.async_client.post(
+            f"{url}?validate_only=true",
+            {"title": "검사만 수행"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        url = self.get_url("async-nested-collection-list", "-")
+        response = await self.async_client.post(
+            url, {"title": "와일드카드"}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        titles = await sync_to_async(
+            lambda: set(NestedCollection.objects.values_list("title", flat=True))
+        )()
+        self.assertIn("비동기 생성", titles)
+        self.assertNotIn("검사만 수행", titles)
+
+    async def test_move(self):
+        url = self.get_url(
+            "async-nested-collection-move",
+            self.collection.pk,
+            pk=self.nested_collection.pk,
+        )
+        data = {"parent": self.other_collection.pk}
+        response = await self.async_client.post(
+            url, data, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["parent"], self.other_collection.pk)
+        url = self.get_url(
+            "async-nested-collection-detail", "-", pk=self.nested_collection.pk
+        )
+        response = await self.async_client.get(url)
+        self.assertEqual(response.json()["parent"], self.other_collection.pk)
+
+    async def test_destroy(self):
+        url = self.get_url(
+            "async-nested-collection-detail",
+            self.collection.pk,
+            pk=self.nested_collection.pk,
+        )
+        response = await self.async_client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def asgi_request(self, application, path, query_string=b""):
+        # AsyncClient는 스트리밍 응답을 별도의 스레드에서 순회하므로
+        # ASGI application을 직접 호출하여 event loop에서 본문을 순회한다.
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query_string,
+            "headers": [],
+        }
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await application(scope, receive, send)
+        body = b"".join(message.get("body", b"") for message in messages[1:])
+        return messages[0]["status"], body
+
+    async def test_export(self):
+        await sync_to_async(NestedCollectionFactory)(parent=self.collection)
+        url = self.get_url("async-nested-collection-export", self.collection.pk)
+        status_code, body = await self.asgi_request(
+            ASGIHandler(), url, b"exportFormat=json"
+        )
+        self.assertEqual(status_code, status.HTTP_200_OK)
+        self.assertEqual(len(json.loads(body)), 2)
+
+    async def test_thread_sensitive_context(self):
+        # config.asgi는 요청마다 별도의 스레드에서 sync 작업을 실행한다.
+        # 쿼리 측정(MetricsMiddleware)은 해당 스레드의 연결에 등록되어야 한다.
+        from config.asgi import application
+
+        url = self.get_url("async-nested-collection-list", self.collection.pk)
+        key = ("async-nested-collection-list", "GET")
+        for _ in range(2):
+            before = get_registry().snapshot().get(key, empty_stats())
+            status_code, body = await self.asgi_request(application, url)
+            after = get_registry().snapshot()[key]
+            self.assertEqual(status_code, status.HTTP_200_OK)
+            self.assertEqual(json.loads(body)["count"], 1)
+            self.assertGreater(after["queries"] - before["queries"], 0)
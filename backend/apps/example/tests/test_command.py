@@ -0,0 +1,25 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from ..models import Collection, NestedCollection, NestedResource
+
+
+class SeedCommandTestCase(TestCase):
+    def test_seed(self):
+        Collection.objects.create(title="[0] Collection")
+        call_command(
+            "seed",
+            collections=20,
+            nested_collections=3,
+            nested_resources=True,
+            stdout=StringIO(),
+        )
+        self.assertEqual(Collection.objects.count(), 21)
+        self.assertEqual(NestedCollection.objects.count(), 60)
+        self.assertEqual(NestedResource.objects.count(), 20)
+        # 기존 데이터의 title과 겹치지 않도록 이어서 생성한다.
+        self.assertEqual(Collection.objects.filter(title="[0] Collection").count(), 1)
+        self.assertTrue(Collection.objects.filter(title="[20] Collection").exists())
+        collection = Collection.objects.get(title="[1] Collection")
+        self.assertEqual(collection.nestedcollection_set.count(), 3)
+        self.assertTrue(NestedResource.objects.filter(parent=collection).exists())
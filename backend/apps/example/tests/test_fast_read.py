@@ -0,0 +1,162 @@
+from unittest import mock
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from utils.drf_custom.cache import get_cache, get_response_cache
+from utils.drf_custom.serializers import FastReadSerializerMixin
+from .factories import CollectionFactory, NestedCollectionFactory
+from ..models import Collection, NestedCollection
+from ..serializers import CollectionSerializer, NestedCollectionSerializer
+from ..views import CollectionViewSet, NestedCollectionViewSet
+
+
+class ConvertedCollectionSerializer(
+    FastReadSerializerMixin, serializers.ModelSerializer
+):
+    # 모델 필드와 타입이 다른 필드는 to_representation으로 변환한다.
+    id = serializers.CharField()
+    title = serializers.ReadOnlyField()
+
+    class Meta:
+        model = Collection
+        fields = ["id", "title"]
+
+
+class MethodFieldSerializer(FastReadSerializerMixin, serializers.ModelSerializer):
+    upper_title = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Collection
+        fields = ["id", "upper_title"]
+
+    def get_upper_title(self, obj):
+        return obj.title.upper()
+
+
+class SuffixField(serializers.CharField):
+    # context에 따라 결과가 달라지는 필드
+    def to_representation(self, value):
+        return f"{value}{self.context['suffix']}"
+
+
+class ContextCollectionSerializer(FastReadSerializerMixin, serializers.ModelSerializer):
+    title = SuffixField()
+
+    class Meta:
+        model = Collection
+        fields = ["id", "title"]
+
+
+class CustomRepresentationSerializer(CollectionSerializer):
+    def to_representation(self, instance):
+        return {"custom": super().to_representation(instance)}
+
+
+class FastReadSerializerTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.collections = CollectionFactory.bulk_create_batch(3, title="한글 제목")
+        NestedCollectionFactory.bulk_create_batch(3, parent=cls.collections[0])
+
+    def assertSameContent(self, serializer_class, queryset):
+        expected = serializer_class(queryset, many=True).data
+        serializer = serializer_class(many=True)
+        read_plan = serializer.child.get_read_plan()
+        self.assertIsNotNone(read_plan)
+        serializer.instance = list(queryset.values_list(*read_plan.columns))
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(serializer.data), renderer.render(expected))
+
+    def test_to_representation(self):
+        self.assertSameContent(CollectionSerializer, Collection.objects.all())
+        self.assertSameContent(
+            NestedCollectionSerializer, NestedCollection.objects.all()
+        )
+        self.assertSameContent(ConvertedCollectionSerializer, Collection.objects.all())
+
+    def test_read_plan(self):
+        read_plan = NestedCollectionSerializer().get_read_plan()
+        self.assertEqual(read_plan.columns, ("id", "title", "parent_id"))
+        # serializer class와 필드 구성이 같다면 읽을 컬럼을 재사용한다.
+        self.assertIs(
+            NestedCollectionSerializer().get_read_plan().columns, read_plan.columns
+        )
+        serializer = NestedCollectionSerializer()
+        serializer.fields.pop("parent")
+        self.assertEqual(serializer.get_read_plan().columns, ("id", "title"))
+
+    def test_context(self):
+        # 변환 함수는 처음 생성된 serializer가 아닌 현재 serializer의 필드를 사용한다.
+        row = (1, "제목")
+        for suffix in ("-a", "-b"):
+            serializer = ContextCollectionSerializer(context={"suffix": suffix})
+            self.assertEqual(
+                serializer.to_representation(row), {"id": 1, "title": f"제목{suffix}"}
+            )
+
+    def test_unsupported(self):
+        self.assertIsNone(MethodFieldSerializer().get_read_plan())
+        self.assertIsNone(CustomRepresentationSerializer().get_read_plan())
+
+
+class FastReadViewSetTestCase(APITestCase):
+    # fast_read_actions의 응답은 모델 인스턴스로 직렬화한 응답과 같아야 한다.
+    @classmethod
+    def setUpTestData(cls):
+        cls.collections = CollectionFactory.bulk_create_batch(5)
+        for collection in cls.collections[:3]:
+            NestedCollectionFactory.bulk_create_batch(3, parent=collection)
+
+    def setUp(self) -> None:
+        get_cache().clear()
+        get_response_cache().clear()
+
+    def get_contents(self, viewset, url, params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        get_response_cache().clear()
+        with mock.patch.object(viewset, "fast_read_actions", []):
+            expected = self.client.get(url, params)
+        return response.content, expected.content
+
+    def assertSameContent(self, viewset, url, params=None):
+        content, expected = self.get_contents(viewset, url, params)
+        self.assertEqual(content, expected)
+
+    def test_collection(self):
+        value_list = [self.collections[2].pk, 99999, self.collections[0].pk]
+        cases = [
+            ("collection-list", {"ordering": "title desc"}),
+            ("collection-list", {"read_mask": "title", "pageSize": 2, "page": 2}),
+            ("collection-batch-get", {"valueList": ",".join(map(str, value_list))}),
+            ("collection-search", {"title__contains": "Collection"}),
+        ]
+        for name, params in cases:
+            with self.subTest(name=name, params=params):
+                self.assertSameContent(CollectionViewSet, reverse(name), params)
+
+    def test_nested_collection(self):
+        for collection_pk in [self.collections[0].pk, "-"]:
+            url = reverse(
+                "nested-collection-list", kwargs={"collection_pk": collection_pk}
+            )
+            with self.subTest(collection_pk=collection_pk):
+                self.assertSameContent(NestedCollectionViewSet, url)
+                self.assertSameContent(
+                    NestedCollectionViewSet, url, {"read_mask": "parent"}
+                )
+
+    def test_without_instances(self):
+        urls = [
+            reverse("collection-list"),
+            reverse("nested-collection-list", kwargs={"collection_pk": "-"}),
+        ]
+        for url in urls:
+            with mock.patch.object(Collection, "from_db", side_effect=AssertionError):
+                with mock.patch.object(
+                    NestedCollection, "from_db", side_effect=AssertionError
+                ):
+                    response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
@@ -0,0 +1,111 @@
+from unittest import mock
+from django.apps import apps
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from utils.drf_custom.filters import OrderingFilterBackend, parse_ordering
+from utils.drf_custom.lookups import create_trigram_index
+from .factories import CollectionFactory
+from ..models import Collection
+from ..views import CollectionViewSet
+
+
+class OrderingFilterBackendTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for title in ["b", "a", "b", "a"]:
+            CollectionFactory(title=title)
+
+    def get_view(self, params, **initkwargs):
+        view = CollectionViewSet(action="list", **initkwargs)
+        view.request = Request(APIRequestFactory().get("/", params))
+        return view
+
+    def filter(self, params, **initkwargs):
+        view = self.get_view(params, **initkwargs)
+        queryset = Collection.objects.all()
+        return OrderingFilterBackend().filter_queryset(view.request, queryset, view)
+
+    def test_ordering(self):
+        queryset = self.filter({"ordering": "title desc, unknown, id"})
+        self.assertEqual(queryset.query.order_by, ("-title", "id"))
+        queryset = self.filter({"ordering": "unknown"})
+        self.assertEqual(queryset.query.order_by, ())
+
+    def test_desc_ordering(self):
+        # "field desc"는 "-field"로 변환되며 허용된 값으로 판단되어야 한다.
+        view = self.get_view({})
+        fields = OrderingFilterBackend().remove_invalid_fields(
+            Collection.objects.all(), ["-title", "title", "-unknown", "-id"], view, None
+        )
+        self.assertEqual(fields, ["-title", "title", "-id"])
+        url = reverse("collection-list")
+        response = self.client.get(url, {"ordering": "title desc"})
+        titles = [item["title"] for item in response.data["results"]]
+        self.assertEqual(titles, ["b", "b", "a", "a"])
+
+    def test_tiebreaker(self):
+        # 마지막 정렬 값과 같은 방향으로 tiebreaker가 추가된다.
+        queryset = self.filter({"ordering": "title desc"})
+        self.assertEqual(queryset.query.order_by, ("-title", "-id"))
+        expected = list(
+            Collection.objects.order_by("-title", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual([collection.id for collection in queryset], expected)
+        queryset = self.filter({"ordering": "title"}, ordering_tiebreaker=None)
+        self.assertEqual(queryset.query.order_by, ("title",))
+
+    def test_config_per_view_class(self):
+        backend = OrderingFilterBackend()
+        config = backend.get_ordering_config(self.get_view({}))
+        self.assertIs(backend.get_ordering_config(self.get_view({})), config)
+        self.assertEqual(
+            config.valid_terms, frozenset(["id", "-id", "title", "-title"])
+        )
+        parse_ordering.cache_clear()
+        self.filter({"ordering": "title desc"})
+        self.filter({"ordering": "title desc"})
+        self.assertEqual(parse_ordering.cache_info().hits, 1)
+        # as_view(initkwargs) 등으로 설정이 달라지면 설정별로 계산한다.
+        view = self.get_view({}, ordering_fields=["id"])
+        self.assertEqual(
+            backend.get_ordering_config(view).valid_terms, frozenset(["id", "-id"])
+        )
+        self.assertIs(backend.get_ordering_config(self.get_view({})), config)
+        # 요청을 처리하는 중에 view class를 변경하지 않는다.
+        self.assertNotIn("_ordering_config", vars(CollectionViewSet))
+
+    def test_list(self):
+        url = reverse("collection-list")
+        response = self.client.get(url, {"ordering": "title"})
+        titles = [item["title"] for item in response.data["results"]]
+        self.assertEqual(titles, ["a", "a", "b", "b"])
+        ids = [item["id"] for item in response.data["results"]]
+        self.assertLess(ids[0], ids[1])
+
+
+class TrigramIndexMigrationTestCase(SimpleTestCase):
+    def migrate(self, row):
+        # pg_index 조회 결과(row)에 따라 실행되는 SQL
+        schema_editor = mock.MagicMock()
+        schema_editor.connection.vendor = "postgresql"
+        schema_editor.quote_name = lambda name: f'"{name}"'
+        cursor = schema_editor.connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = row
+        forwards, _ = create_trigram_index("example.Collection", "title", "trgm")
+        forwards(apps, schema_editor)
+        return [call.args[0] for call in schema_editor.execute.call_args_list]
+
+    def test_create(self):
+        create_sql = (
+            'CREATE INDEX CONCURRENTLY "trgm" ON "example_collection" '
+            'USING gin ("title" gin_trgm_ops)'
+        )
+        self.assertEqual(self.migrate(None), [create_sql])
+        self.assertEqual(self.migrate((True,)), [])
+        # CONCURRENTLY 생성이 실패하여 남은 INVALID 인덱스는 다시 생성한다.
+        self.assertEqual(
+            self.migrate((False,)),
+            ['DROP INDEX CONCURRENTLY "trgm"', create_sql],
+        )
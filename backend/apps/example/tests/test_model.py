@@ -1,5 +1,6 @@
 from django.test import TestCase
 from django.db import models
+from utils.drf_custom.cache import get_object_version
 from ..models import Collection, NestedCollection, NestedResource
 
 
@@ -19,6 +20,20 @@ class CollectionTestCase(TestCase):
         title_field_max_length = collection._meta.get_field("title").max_length
         self.assertEqual(title_field_max_length, 20)
 
+    # drf_custom.cache
+    def test_object_version(self):
+        collection = Collection.objects.first()
+        version = get_object_version(Collection, collection.pk)
+        self.assertEqual(get_object_version(Collection, str(collection.pk)), version)
+        with self.captureOnCommitCallbacks(execute=True):
+            collection.save()
+            changed_version = get_object_version(Collection, collection.pk)
+            self.assertNotEqual(changed_version, version)
+        # commit 이후에도 한 번 더 변경된다.
+        self.assertNotEqual(
+            get_object_version(Collection, collection.pk), changed_version
+        )
+
 
 class NestedCollectionTestCase(TestCase):
     @classmethod
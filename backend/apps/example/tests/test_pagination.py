@@ -0,0 +1,180 @@
+import json
+from unittest import skipUnless
+from urllib import parse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.pagination import Cursor
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from utils.drf_custom.pagination import SmallCursorPagination
+from .factories import CollectionFactory
+from ..models import Collection
+from ..views import CollectionViewSet
+
+
+class CursorPaginationTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.collections = [
+            CollectionFactory(title=f"{index % 3}번 제목") for index in range(7)
+        ]
+
+    def setUp(self) -> None:
+        self.view = CollectionViewSet.as_view(
+            {"get": "list"}, pagination_class=SmallCursorPagination
+        )
+        self.url = reverse("collection-list")
+
+    def get(self, params):
+        request = APIRequestFactory().get(self.url, params)
+        return self.view(request).render()
+
+    def get_page_token(self, link):
+        query = parse.parse_qs(parse.urlparse(link).query)
+        return query[SmallCursorPagination.cursor_query_param][0]
+
+    def walk(self, params):
+        pages = []
+        response = self.get(params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.data)
+            if response.data["next"] is None:
+                return pages
+            token = self.get_page_token(response.data["next"])
+            response = self.get({**params, "pageToken": token})
+
+    def test_response_shape(self):
+        response = self.get({})
+        self.assertEqual(
+            list(response.data), ["count", "count_exact", "next", "previous", "results"]
+        )
+        self.assertEqual(response.data["count"], len(self.collections))
+
+    def test_count_first_page_only(self):
+        # 이후의 페이지에서는 COUNT를 실행하지 않고 count를 응답하지 않는다.
+        response = self.get({"pageSize": 3})
+        token = self.get_page_token(response.data["next"])
+        with CaptureQueriesContext(connection) as context:
+            response = self.get({"pageSize": 3, "pageToken": token})
+        self.assertEqual(list(response.data), ["next", "previous", "results"])
+        self.assertEqual(len(context), 1)
+        self.assertNotIn("COUNT", context[0]["sql"])
+
+    def test_walk_default_ordering(self):
+        pages = self.walk({"pageSize": 3})
+        results = [item["id"] for page in pages for item in page["results"]]
+        expected = sorted(
+            (collection.id for collection in self.collections), reverse=True
+        )
+        self.assertEqual(results, expected)
+        self.assertEqual(len(pages), 3)
+
+    def test_walk_ordering_with_tiebreaker(self):
+        pages = self.walk({"pageSize": 2, "ordering": "title desc"})
+        results = [
+            (item["title"], item["id"]) for page in pages for item in page["results"]
+        ]
+        expected = sorted(
+            ((collection.title, collection.id) for collection in self.collections),
+            reverse=True,
+        )
+        self.assertEqual(results, expected)
+
+    def test_previous(self):
+        first = self.get({"pageSize": 3})
+        token = self.get_page_token(first.data["next"])
+        second = self.get({"pageSize": 3, "pageToken": token})
+        token = self.get_page_token(second.data["previous"])
+        previous = self.get({"pageSize": 3, "pageToken": token})
+        self.assertEqual(previous.data["results"], first.data["results"])
+        self.assertIsNone(previous.data["previous"])
+
+    def test_invalid_page_token(self):
+        response = self.get({"pageToken": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_forged_position(self):
+        # 정렬 필드의 형식으로 변환할 수 없는 position은 404로 응답한다.
+        pagination = SmallCursorPagination()
+        for position, ordering in [
+            (["abc"], {}),
+            ([{"a": 1}], {}),
+            ([None], {}),
+            ([[1], 1], {"ordering": "title"}),
+        ]:
+            with self.subTest(position=position):
+                cursor = Cursor(offset=0, reverse=False, position=json.dumps(position))
+                pagination.base_url = self.url
+                token = self.get_page_token(pagination.encode_cursor(cursor))
+                response = self.get({**ordering, "pageToken": token})
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        # 숫자 문자열은 정렬 필드의 형식으로 변환된다.
+        cursor = Cursor(offset=0, reverse=False, position=json.dumps(["999999"]))
+        token = self.get_page_token(pagination.encode_cursor(cursor))
+        response = self.get({"pageSize": 3, "pageToken": token})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 3)
+
+    def test_nullable_ordering(self):
+        # NULL이 될 수 있는 필드(역방향 OneToOne 관계)로는 정렬할 수 없다.
+        request = APIRequestFactory().get(self.url)
+        pagination = SmallCursorPagination()
+        for ordering in ["child__title", "-child__id"]:
+            with self.subTest(ordering=ordering):
+                queryset = Collection.objects.order_by(ordering)
+                with self.assertRaises(AssertionError):
+                    pagination.paginate_queryset(queryset, Request(request))
+        queryset = Collection.objects.order_by("title")
+        page = pagination.paginate_queryset(queryset, Request(request))
+        self.assertEqual(len(page), 7)
+
+
+class CountPaginationTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.collections = CollectionFactory.create_batch(3)
+
+    def test_count_exact(self):
+        url = reverse("collection-list")
+        response = self.client.get(url)
+        self.assertEqual(response.data["count"], len(self.collections))
+        self.assertEqual(response.data["count_exact"], True)
+
+    def test_cached_count(self):
+        url = reverse("collection-list")
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.data["count"], len(self.collections))
+        self.assertFalse(any("COUNT" in query["sql"] for query in context))
+
+    def test_cached_count_invalidation(self):
+        url = reverse("collection-list")
+        self.client.get(url)
+        self.client.post(url, {"title": "새로운 제목"})
+        response = self.client.get(url)
+        self.assertEqual(response.data["count"], len(self.collections) + 1)
+        self.client.delete(
+            reverse(
+                "collection-detail", kwargs={"pk": response.data["results"][0]["id"]}
+            )
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.data["count"], len(self.collections))
+
+    def test_cached_count_per_filter(self):
+        url = reverse("collection-search")
+        response = self.client.get(url, {"title": self.collections[0].title})
+        self.assertEqual(response.data["count"], 1)
+        response = self.client.get(url)
+        self.assertEqual(response.data["count"], len(self.collections))
+
+    @skipUnless(connection.vendor == "postgresql", "planner estimates require postgres")
+    def test_estimated_count(self):
+        url = reverse("collection-list")
+        view = CollectionViewSet.as_view({"get": "list"}, count_estimate_threshold=0)
+        response = view(APIRequestFactory().get(url))
+        self.assertEqual(response.data["count_exact"], False)
@@ -0,0 +1,107 @@
+from pathlib import Path
+from unittest import mock
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from utils.drf_custom.cache import get_cache, get_response_cache
+from utils.testing.queries import QueryBaselineMixin
+from .factories import (
+    CollectionFactory,
+    NestedCollectionFactory,
+    NestedResourceFactory,
+)
+from ..views import CollectionViewSet
+
+
+class QueryCountTestCase(QueryBaselineMixin, APITestCase):
+    # 엔드포인트마다 실행되는 쿼리 수를 기준 파일과 비교한다.
+    # 결과가 여러 개인 경우 N+1 쿼리가 드러나도록 상위 리소스마다 여러 개의 하위 리소스를 생성한다.
+    query_baseline_file = Path(__file__).parent / "query_baselines.json"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.collections = CollectionFactory.bulk_create_batch(3)
+        for collection in cls.collections:
+            NestedCollectionFactory.bulk_create_batch(3, parent=collection)
+        cls.nested_resource = NestedResourceFactory(parent=cls.collections[0])
+
+    def setUp(self) -> None:
+        # 다른 테스트의 응답 캐시, 모델 version이 쿼리 수에 영향을 주지 않도록 한다.
+        get_cache().clear()
+        get_response_cache().clear()
+        # count 추정(pg_class.reltuples, EXPLAIN)은 PostgreSQL에서만 실행되므로
+        # 기록되는 쿼리가 데이터베이스에 따라 달라지지 않도록 추정을 사용하지 않는다.
+        patcher = mock.patch.object(CollectionViewSet, "count_estimate_threshold", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_collection_list(self):
+        url = reverse("collection-list")
+        with self.assertQueryBaseline("collection-list"):
+            response = self.client.get(url, {"ordering": "title desc"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_collection_batch_get(self):
+        url = reverse("collection-batch-get")
+        value_list = ",".join(str(collection.pk) for collection in self.collections)
+        with self.assertQueryBaseline("collection-batch-get"):
+            response = self.client.get(url, {"valueList": value_list})
+        self.assertEqual(len(response.data["results"]), 3)
+
+    def test_collection_search(self):
+        url = reverse("collection-search")
+        with self.assertQueryBaseline("collection-search"):
+            response = self.client.get(url, {"title__contains": "Collection"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_nested_collection_list(self):
+        url = reverse(
+            "nested-collection-list", kwargs={"collection_pk": self.collections[0].pk}
+        )
+        with self.assertQueryBaseline("nested-collection-list"):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_nested_collection_list_wildcard(self):
+        url = reverse("nested-collection-list", kwargs={"collection_pk": "-"})
+        with self.assertQueryBaseline("nested-collection-list (wildcard)"):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data["results"]), 9)
+
+    def test_nested_collection_move(self):
+        nested_collection = self.collections[0].nestedcollection_set.first()
+        url = reverse(
+            "nested-collection-move",
+            kwargs={
+                "collection_pk": self.collections[0].pk,
+                "pk": nested_collection.pk,
+            },
+        )
+        data = {"parent": self.collections[1].pk}
+        with self.assertQueryBaseline("nested-collection-move"):
+            response = self.client.post(url, data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_nested_collection_batch_move(self):
+        url = reverse(
+            "nested-collection-batch-move",
+            kwargs={"collection_pk": self.collections[0].pk},
+        )
+        value_list = list(
+            self.collections[0].nestedcollection_set.values_list("pk", flat=True)
+        )
+        data = {"valueList": value_list, "parent": self.collections[2].pk}
+        with self.assertQueryBaseline("nested-collection-batch-move"):
+            response = self.client.post(url, data, format="json")
+        self.assertEqual(len(response.data["results"]), 3)
+
+    def test_nested_resource(self):
+        url = reverse(
+            "nested-resource-detail", kwargs={"collection_pk": self.collections[0].pk}
+        )
+        with self.assertQueryBaseline("nested-resource-detail"):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with self.assertQueryBaseline("nested-resource-partial-update"):
+            response = self.client.patch(url, {"title": "수정된 제목"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,128 @@
+import datetime
+import decimal
+import io
+import json
+import uuid
+from unittest import mock
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework import parsers as rest_parsers
+from rest_framework import renderers as rest_renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APITestCase
+from utils.drf_custom import renderers
+from utils.drf_custom.parsers import JSONParser
+from utils.drf_custom.renderers import JSONRenderer
+from .factories import CollectionFactory
+
+
+class JSONRendererTestCase(SimpleTestCase):
+    data = {
+        "title": '한글 제목  \n\t"\\/',
+        "control": "\x00\x1f\x7f",
+        "decimal": decimal.Decimal("1.10"),
+        "datetime": datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc),
+        "date": datetime.date(2021, 1, 1),
+        "time": datetime.time(1, 2, 3, 456789),
+        "timedelta": datetime.timedelta(seconds=3),
+        "uuid": uuid.UUID(int=1),
+        "lazy": gettext_lazy("번역"),
+        "list": [1, (2, 3), None, True, 1.5],
+    }
+
+    def assertSameContent(self, data, accepted_media_type=None, renderer_context=None):
+        expected = rest_renderers.JSONRenderer().render(
+            data, accepted_media_type, renderer_context
+        )
+        content = JSONRenderer().render(data, accepted_media_type, renderer_context)
+        self.assertIsInstance(content, bytes)
+        self.assertEqual(content, expected)
+
+    def test_render(self):
+        self.assertSameContent(self.data)
+        self.assertSameContent([self.data, self.data])
+        self.assertEqual(JSONRenderer().render(None), b"")
+
+    def test_fallback(self):
+        # orjson이 직렬화할 수 없는 값, 들여쓰기는 표준 라이브러리 json으로 직렬화한다.
+        self.assertSameContent({"big": 2 ** 70, **self.data})
+        self.assertSameContent(self.data, "application/json; indent=4")
+        self.assertSameContent(self.data, renderer_context={"indent": 2})
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertSameContent(self.data)
+        with self.assertRaises(TypeError):
+            JSONRenderer().render({"object": object()})
+
+    def test_non_finite(self):
+        # orjson은 NaN, Infinity를 null로 직렬화하므로 DRF의 JSONRenderer와 같이 처리한다.
+        for value in [
+            float("nan"),
+            float("inf"),
+            -float("inf"),
+            decimal.Decimal("NaN"),
+        ]:
+            with self.subTest(value=value):
+                data = {"list": [None, {"value": value}]}
+                with self.assertRaises(ValueError) as expected:
+                    rest_renderers.JSONRenderer().render(data)
+                with self.assertRaisesMessage(ValueError, str(expected.exception)):
+                    JSONRenderer().render(data)
+                renderer = JSONRenderer()
+                renderer.strict = False
+                expected_renderer = rest_renderers.JSONRenderer()
+                expected_renderer.strict = False
+                self.assertEqual(renderer.render(data), expected_renderer.render(data))
+
+    def test_differences(self):
+        # 지수 표기 float는 orjson 형식으로 직렬화되어 DRF와 바이트 단위로 다르지만 값은 같다.
+        data = {"values": [1e16, 1e-7, 1.7976931348623157e308]}
+        expected = rest_renderers.JSONRenderer().render(data)
+        content = JSONRenderer().render(data)
+        if renderers.orjson is not None:
+            self.assertEqual(content, b'{"values":[1e16,1e-7,1.7976931348623157e308]}')
+        self.assertEqual(expected, b'{"values":[1e+16,1e-07,1.7976931348623157e+308]}')
+        self.assertEqual(json.loads(content), json.loads(expected))
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertSameContent(data)
+        # str이 아닌 dict key는 표준 라이브러리 json으로 다시 직렬화하므로 DRF와 같다.
+        self.assertSameContent({2: "int", True: "bool", None: "none", 1.5: "float"})
+
+
+class JSONParserTestCase(SimpleTestCase):
+    def parse(self, parser, content):
+        return parser.parse(io.BytesIO(content), parser_context={})
+
+    def assertSameResult(self, content):
+        expected = self.parse(rest_parsers.JSONParser(), content)
+        self.assertEqual(self.parse(JSONParser(), content), expected)
+
+    def test_parse(self):
+        self.assertSameResult('{"title": "한글 제목", "list": [1, 1.5, null]}'.encode())
+        self.assertSameResult(b'{"big": 1180591620717411303424}')
+
+    def test_error(self):
+        # 오류 메시지는 DRF의 JSONParser와 동일하다.
+        for content in [b'{"title": }', b'{"value": NaN}', b""]:
+            with self.subTest(content=content):
+                with self.assertRaises(ParseError) as expected:
+                    self.parse(rest_parsers.JSONParser(), content)
+                with self.assertRaisesMessage(ParseError, str(expected.exception)):
+                    self.parse(JSONParser(), content)
+
+
+class JSONRendererAPITestCase(APITestCase):
+    def test_api(self):
+        CollectionFactory.bulk_create_batch(3, title="한글 제목")
+        response = self.client.get(reverse("collection-list"))
+        self.assertIsInstance(response.accepted_renderer, JSONRenderer)
+        self.assertEqual(
+            response.content,
+            rest_renderers.JSONRenderer().render(response.data),
+        )
+        response = self.client.post(
+            reverse("collection-list"),
+            '{"title": "새 제목"}'.encode(),
+            content_type="application/json",
+        )
+        self.assertEqual(response.data["title"], "새 제목")
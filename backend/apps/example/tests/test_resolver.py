@@ -0,0 +1,99 @@
+from django.test import SimpleTestCase
+from django.urls import Resolver404, get_resolver, include, path, re_path, reverse
+from django.urls.resolvers import RegexPattern, URLResolver
+from api.urls import urlpatterns as api_urlpatterns
+from utils.drf_custom.resolvers import (
+    CompiledURLResolver,
+    get_literal_prefix,
+    get_pattern_token,
+)
+
+
+def view(request, *args, **kwargs):
+    pass
+
+
+class CompiledURLResolverTestCase(SimpleTestCase):
+    def setUp(self) -> None:
+        self.compiled = api_urlpatterns[0]
+        # 같은 pattern을 Django의 방식으로 resolve하는 resolver
+        self.linear = URLResolver(RegexPattern(r"^"), self.compiled.url_patterns)
+
+    def assertSameMatch(self, path):
+        expected = self.linear.resolve(path)
+        match = self.compiled.resolve(path)
+        self.assertEqual(match.func, expected.func)
+        self.assertEqual(match.args, expected.args)
+        self.assertEqual(match.kwargs, expected.kwargs)
+        self.assertEqual(match.url_name, expected.url_name)
+        self.assertEqual(match.route, expected.route)
+
+    def test_resolve(self):
+        paths = [
+            "collections",
+            "collections/",
+            "collections:batchGet",
+            "collections:batchCreate/",
+            "collections/1",
+            "collections/1/",
+            "collections:search",
+            "collections/-/nested-collections",
+            "collections/1/nested-collections:export",
+            "collections/1/nested-collections/2",
+            "collections/1/nested-collections/2:move",
+            "collections/1/nested-singleton",
+            "collections/1/nested-singleton/",
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertSameMatch(path)
+
+    def test_not_found(self):
+        for path in ["", "unknown", "collections/1/unknown", "collections/1:unknown"]:
+            with self.subTest(path=path):
+                with self.assertRaises(Resolver404):
+                    self.linear.resolve(path)
+                with self.assertRaises(Resolver404):
+                    self.compiled.resolve(path)
+
+    def test_root_resolver(self):
+        # reverse와 전체 urlconf의 resolve는 기존과 동일하다.
+        url = reverse("nested-collection-move", kwargs={"collection_pk": 1, "pk": 2})
+        match = get_resolver().resolve(url)
+        self.assertEqual(match.url_name, "nested-collection-move")
+        self.assertEqual(match.kwargs, {"collection_pk": "1", "pk": "2"})
+
+    def test_pattern_order(self):
+        # 앞서 등록된 pattern이 우선한다. 첫 토큰을 알 수 없는 pattern도 등록 순서를 따른다.
+        url_patterns = [
+            re_path(r"^items/(?P<pk>[0-9]+)$", view, name="number"),
+            re_path(r"^(?P<prefix>[a-z]+)/(?P<pk>[a-z]+)$", view, name="any"),
+            re_path(r"^items/(?P<pk>[a-z0-9]+)$", view, name="item"),
+            path("paths/<int:pk>", view, name="path"),
+            re_path(r"^paths/(?P<pk>.+)$", view, name="after-path"),
+            re_path(r"^nested/", include([path("<int:pk>", view, name="nested")])),
+        ]
+        resolver = CompiledURLResolver(url_patterns)
+        linear = URLResolver(RegexPattern(r"^"), url_patterns)
+        self.assertEqual(resolver.resolve("items/1").url_name, "number")
+        self.assertEqual(resolver.resolve("items/a").url_name, "any")
+        self.assertEqual(resolver.resolve("items/a1").url_name, "item")
+        match = resolver.resolve("paths/1")
+        self.assertEqual((match.url_name, match.kwargs), ("path", {"pk": 1}))
+        self.assertEqual(resolver.resolve("paths/1a").url_name, "after-path")
+        match = resolver.resolve("nested/1")
+        expected = linear.resolve("nested/1")
+        self.assertEqual(match.url_name, "nested")
+        self.assertEqual(match.route, expected.route)
+
+    def test_pattern_token(self):
+        self.assertEqual(get_literal_prefix(r"^collections/?$"), ("collections", "/?$"))
+        self.assertEqual(get_pattern_token(r"^collections/?$"), "collections")
+        self.assertEqual(get_pattern_token(r"^collections:batchGet/?$"), "collections")
+        self.assertEqual(
+            get_pattern_token(r"^nested\-items/(?P<pk>\d+)$"), "nested-items"
+        )
+        self.assertEqual(get_pattern_token(r"^$"), "")
+        self.assertIsNone(get_pattern_token(r"^items?/$"))
+        self.assertIsNone(get_pattern_token(r"^items(?P<pk>\d+)$"))
+        self.assertIsNone(get_pattern_token(r"^(?P<prefix>\w+)/$"))
@@ -0,0 +1,108 @@
+import gzip
+import tempfile
+from pathlib import Path
+from unittest import mock
+from django.conf import settings
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from utils.drf_custom.views import CachedSpectacularAPIView
+
+
+class CachedSpectacularAPIViewTestCase(TestCase):
+    def setUp(self) -> None:
+        CachedSpectacularAPIView._schema_artifacts.clear()
+        self.url = reverse("schema")
+
+    def tearDown(self) -> None:
+        CachedSpectacularAPIView._schema_artifacts.clear()
+
+    def test_generate_once(self):
+        generator_class = CachedSpectacularAPIView.generator_class
+        with mock.patch.object(
+            CachedSpectacularAPIView, "generator_class", wraps=generator_class
+        ) as generator:
+            res_1 = self.client.get(self.url)
+            res_2 = self.client.get(self.url)
+        self.assertEqual(res_1.status_code, status.HTTP_200_OK)
+        self.assertEqual(generator.call_count, 1)
+        self.assertEqual(res_1.content, res_2.content)
+        self.assertIn(b"/collections:batchGet", res_1.content)
+
+    def test_component_description(self):
+        # serializer mixin의 docstring이 스키마의 description으로 노출되지 않는다.
+        res = self.client.get(self.url, {"format": "json"})
+        schemas = res.json()["components"]["schemas"]
+        for name in [
+            "Collection",
+            "CollectionRequest",
+            "PatchedCollectionRequest",
+            "NestedCollection",
+            "NestedCollectionRequest",
+            "PatchedNestedCollectionRequest",
+        ]:
+            with self.subTest(name=name):
+                self.assertNotIn("description", schemas[name])
+
+    def test_batch_get_response(self):
+        # 존재하지 않는 pk의 자리는 null이다.
+        res = self.client.get(self.url, {"format": "json"})
+        schemas = res.json()["components"]["schemas"]
+        results = schemas["CollectionBatchGetResponse"]["properties"]["results"]
+        self.assertEqual(
+            results["items"],
+            {"allOf": [{"$ref": "#/components/schemas/Collection"}], "nullable": True},
+        )
+
+    def test_count_exact(self):
+        # count_estimate_threshold가 지정된 view의 응답에만 count_exact가 포함된다.
+        res = self.client.get(self.url, {"format": "json"})
+        schemas = res.json()["components"]["schemas"]
+        self.assertIn("count_exact", schemas["PaginatedCollectionList"]["properties"])
+        self.assertNotIn(
+            "count_exact", schemas["PaginatedNestedCollectionList"]["properties"]
+        )
+
+    def test_format(self):
+        res_yaml = self.client.get(self.url)
+        res_json = self.client.get(self.url, {"format": "json"})
+        self.assertTrue(
+            res_yaml["Content-Type"].startswith("application/vnd.oai.openapi")
+        )
+        self.assertEqual(res_json["Content-Type"], "application/vnd.oai.openapi+json")
+        self.assertNotEqual(res_yaml["ETag"], res_json["ETag"])
+
+    def test_etag(self):
+        res = self.client.get(self.url)
+        etag = res["ETag"]
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res.content, b"")
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH='"other"')
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=f"W/{etag}")
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_gzip(self):
+        res = self.client.get(self.url)
+        gzip_res = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(gzip_res["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(gzip_res.content), res.content)
+        self.assertEqual(gzip_res["ETag"], res["ETag"])
+        self.assertIn("Accept-Encoding", gzip_res["Vary"])
+        self.assertIn("Accept-Encoding", res["Vary"])
+        for accept_encoding in ["gzip;q=0", "deflate, gzip; q=0.0", "identity"]:
+            res = self.client.get(self.url, HTTP_ACCEPT_ENCODING=accept_encoding)
+            self.assertNotIn("Content-Encoding", res)
+            self.assertIn("Accept-Encoding", res["Vary"])
+        for accept_encoding in ["GZIP;q=0.5", "*", "identity;q=1, *;q=0.1"]:
+            res = self.client.get(self.url, HTTP_ACCEPT_ENCODING=accept_encoding)
+            self.assertEqual(res["Content-Encoding"], "gzip")
+
+    def test_schema_file(self):
+        with tempfile.TemporaryDirectory() as schema_dir:
+            path = Path(schema_dir) / f"{settings.API_VERSION}.yaml"
+            path.write_bytes(b"openapi: 3.0.3\n")
+            with mock.patch.object(CachedSpectacularAPIView, "schema_dir", schema_dir):
+                res = self.client.get(self.url)
+        self.assertEqual(res.content, b"openapi: 3.0.3\n")
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from django.test import TestCase
+from ..models import Collection
 from .factories import CollectionFactory, NestedCollectionFactory, NestedResourceFactory
 from ..serializers import (
     CollectionSerializer,
@@ -41,6 +42,9 @@ class NestedCollectionSerializerTestCase(TestCase):
         class ViewObj:
             kwargs: dict
 
+            def get_path_variable_object(self, lookup_url_kwarg):
+                return Collection.objects.get(pk=self.kwargs[lookup_url_kwarg])
+
         data = {"title": "Title"}
         view_obj = ViewObj(kwargs={"collection_pk": collection.id})
         serializer = NestedCollectionSerializer(data=data, context={"view": view_obj})
@@ -0,0 +1,182 @@
+import threading
+from unittest import mock
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import serializers, status
+from rest_framework.test import APITestCase
+from utils.drf_custom import serializers as drf_custom_serializers
+from utils.drf_custom.serializers import (
+    ValidateOnlySerializerMixin,
+    get_validate_only_serializer_class,
+)
+from utils.drf_custom.viewsets import ValidateOnlyGenericViewSetMixin
+from .factories import CollectionFactory
+from ..models import Collection
+from ..serializers import (
+    CollectionSerializer,
+    MoveNestedCollectionSerializer,
+    NestedCollectionSerializer,
+)
+from ..views import CollectionViewSet
+
+
+def create_serializer_class():
+    # 다른 app에 같은 이름의 serializer가 있는 경우
+    class CollectionSerializer(serializers.ModelSerializer):
+        class Meta:
+            model = Collection
+            fields = ["id"]
+
+    return CollectionSerializer
+
+
+class ValidateOnlySerializerRegistryTestCase(SimpleTestCase):
+    def test_keyed_by_class(self):
+        serializer_class = create_serializer_class()
+        self.assertEqual(serializer_class.__name__, CollectionSerializer.__name__)
+        validate_only_class = get_validate_only_serializer_class(serializer_class)
+        self.assertIsNot(
+            validate_only_class,
+            get_validate_only_serializer_class(CollectionSerializer),
+        )
+        self.assertTrue(issubclass(validate_only_class, serializer_class))
+        self.assertTrue(issubclass(validate_only_class, ValidateOnlySerializerMixin))
+        self.assertEqual(
+            validate_only_class.__name__, "ValidateOnlyCollectionSerializer"
+        )
+        self.assertIs(
+            get_validate_only_serializer_class(serializer_class), validate_only_class
+        )
+
+    def test_validate_only_serializer_class(self):
+        serializer_class = get_validate_only_serializer_class(CollectionSerializer)
+        self.assertIs(
+            get_validate_only_serializer_class(serializer_class), serializer_class
+        )
+
+    def test_concurrent(self):
+        serializer_class = create_serializer_class()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def target():
+            barrier.wait()
+            results.append(get_validate_only_serializer_class(serializer_class))
+
+        threads = [threading.Thread(target=target) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 8)
+        self.assertEqual(len(set(results)), 1)
+
+    def test_prepared_on_as_view(self):
+        # URL conf를 불러올 때 validate_only_actions의 serializer class가 생성된다.
+        reverse("collection-list")
+        registry = drf_custom_serializers._validate_only_serializer_classes
+        for serializer_class in [
+            CollectionSerializer,
+            NestedCollectionSerializer,
+            MoveNestedCollectionSerializer,
+        ]:
+            self.assertIn(serializer_class, registry)
+
+    def test_prepare_only_routed_actions(self):
+        serializer_class = create_serializer_class()
+        registry = drf_custom_serializers._validate_only_serializer_classes
+        view_class = type(
+            "ViewSet",
+            (CollectionViewSet,),
+            {"serializer_class": serializer_class},
+        )
+        view_class.as_view({"get": "list"})
+        self.assertNotIn(serializer_class, registry)
+        view_class.as_view({"post": "create"})
+        self.assertIn(serializer_class, registry)
+
+    def test_prepare_request_dependent_serializer_class(self):
+        # 요청에 의존하는 get_serializer_class는 URL conf를 불러올 때 실패하지 않고 첫 요청에서 생성된다.
+        serializer_class = create_serializer_class()
+        registry = drf_custom_serializers._validate_only_serializer_classes
+
+        def get_serializer_class(view):
+            view.request.user
+            return serializer_class
+
+        view_class = type(
+            "ViewSet",
+            (CollectionViewSet,),
+            {"serializer_class": property(get_serializer_class)},
+        )
+        view_class.as_view({"post": "create"})
+        self.assertNotIn(serializer_class, registry)
+        view = view_class()
+        view.request = mock.Mock()
+        view.action = "create"
+        with mock.patch.object(ValidateOnlyGenericViewSetMixin, "validate_only", True):
+            validate_only_class = view.get_serializer_class()
+        self.assertIs(registry[serializer_class], validate_only_class)
+
+    def test_prepare_errors(self):
+        # actions가 없다면 미리 생성하지 않는다.
+        CollectionViewSet.prepare_validate_only_serializer_classes(None, {})
+        CollectionViewSet.prepare_validate_only_serializer_classes({}, {})
+
+        # 요청이 없어서 발생한 오류가 아니라면 그대로 발생한다.
+        def get_serializer_class(view):
+            return view.unknown_attribute
+
+        view_class = type(
+            "ViewSet",
+            (CollectionViewSet,),
+            {"serializer_class": property(get_serializer_class)},
+        )
+        with self.assertRaises(AttributeError):
+            view_class.as_view({"post": "create"})
+
+
+class ValidateOnlyRequestTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.collections = CollectionFactory.bulk_create_batch(3)
+
+    def test_no_class_creation_on_request(self):
+        url = reverse("collection-list")
+        with mock.patch.object(
+            drf_custom_serializers,
+            "_validate_only_serializer_classes_lock",
+        ) as lock:
+            response = self.client.post(f"{url}?validate_only=true", {"title": "제목"})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        lock.__enter__.assert_not_called()
+
+    def test_batch_without_exception(self):
+        # 대량 요청의 validate_only는 PerformValidateOnly를 거치지 않고 응답한다.
+        handle_exception = ValidateOnlyGenericViewSetMixin.handle_exception
+        resources = [{"title": f"제목 {i}"} for i in range(100)]
+        value_list = [collection.id for collection in self.collections]
+        requests = [
+            ("collection-batch-create", {"resources": resources}),
+            (
+                "collection-batch-update",
+                {"resources": [{"id": pk, "title": "제목"} for pk in value_list]},
+            ),
+            ("collection-batch-delete", {"valueList": value_list}),
+        ]
+        with mock.patch.object(
+            ValidateOnlyGenericViewSetMixin,
+            "handle_exception",
+            autospec=True,
+            side_effect=handle_exception,
+        ) as mocked:
+            for name, data in requests:
+                with self.subTest(name=name):
+                    response = self.client.post(
+                        f"{reverse(name)}?validate_only=true", data, format="json"
+                    )
+                    self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+                    self.assertEqual(response.content, b"")
+        mocked.assert_not_called()
+        self.assertEqual(Collection.objects.count(), 3)
+        self.assertFalse(Collection.objects.filter(title="제목").exists())
@@ -1,15 +1,41 @@
+import json
+import threading
+from unittest import mock
+from django.contrib.auth.models import User
+from django.db import connection, connections
+from django.test import TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.permissions import BasePermission
+from rest_framework.test import APIClient, APITestCase
+from utils.drf_custom.cache import get_cache, get_response_cache
+from utils.metrics.middleware import get_registry
+from ..models import Collection, NestedCollection, NestedResource
+from ..views import CollectionViewSet
 from .factories import CollectionFactory, NestedCollectionFactory, NestedResourceFactory
 
 
-class CollectionViewSetTestCase(APITestCase):
+class ObjectPermission(BasePermission):
+    def has_object_permission(self, request, view, obj):
+        return False
+
+
+class ExampleAPITestCase(APITestCase):
+    # setUpTestData의 객체는 테스트마다 다시 생성되지 않으므로(rollback)
+    # 이전 테스트에서 변경된 model, object version과 응답 캐시가 남지 않도록 초기화한다.
     def setUp(self) -> None:
-        self.collection = CollectionFactory()
-        self.collections = CollectionFactory.create_batch(10)
-        self.valid_data = {"title": "유효한 값"}
-        self.invalid_data = {"title": "유효하지 않은 값, 스무 글자 이상 기록할 수 없습니다."}
+        get_cache().clear()
+        get_response_cache().clear()
+
+
+class CollectionViewSetTestCase(ExampleAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.collection = CollectionFactory()
+        cls.collections = CollectionFactory.bulk_create_batch(10)
+        cls.valid_data = {"title": "유효한 값"}
+        cls.invalid_data = {"title": "유효하지 않은 값, 스무 글자 이상 기록할 수 없습니다."}
 
     def test_list(self):
         url = reverse("collection-list")
@@ -55,6 +81,71 @@ class CollectionViewSetTestCase(APITestCase):
             response.data, {"id": self.collection.id, "title": self.collection.title}
         )
 
+    def test_retrieve_cache(self):
+        url = reverse("collection-detail", kwargs={"pk": self.collection.id})
+        self.client.get(url)
+        before = get_registry().snapshot()[("collection-detail", "GET")]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        after = get_registry().snapshot()[("collection-detail", "GET")]
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertEqual(response.data["title"], self.collection.title)
+        self.assertEqual(after["cache_hits"] - before["cache_hits"], 1)
+        # 다른 객체의 변경은 캐시를 무효화하지 않는다.
+        self.collections[0].save()
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+        self.assertEqual(len(context.captured_queries), 0)
+        self.client.patch(url, {"title": "바뀐 제목"})
+        response = self.client.get(url)
+        self.assertEqual(response.data["title"], "바뀐 제목")
+        self.client.delete(url)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_retrieve_cache_per_user(self):
+        # get_queryset이 요청한 사용자에 의존할 수 있으므로 사용자마다 캐시한다.
+        url = reverse("collection-detail", kwargs={"pk": self.collection.id})
+        self.client.get(url)
+        user = User.objects.create_user("user")
+        self.client.force_authenticate(user)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+        self.assertGreater(len(context.captured_queries), 0)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_retrieve_cache_object_permission(self):
+        with self.assertRaisesMessage(AssertionError, "has_object_permission"):
+            CollectionViewSet.as_view(
+                {"get": "retrieve"}, permission_classes=[ObjectPermission]
+            )
+        # 요청마다 반환되는 권한에 객체 단위 권한이 있다면 캐시를 사용하지 않는다.
+        url = reverse("collection-detail", kwargs={"pk": self.collection.id})
+        self.client.get(url)
+        with mock.patch.object(
+            CollectionViewSet, "get_permissions", return_value=[ObjectPermission()]
+        ):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_retrieve_read_mask(self):
+        url = reverse("collection-detail", kwargs={"pk": self.collection.id})
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, {"read_mask": "id"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"id": self.collection.id})
+        self.assertNotIn('"title"', context.captured_queries[-1]["sql"])
+
+    def test_list_read_mask(self):
+        url = reverse("collection-list")
+        response = self.client.get(url, {"read_mask": "title"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data["results"][0]), ["title"])
+        response = self.client.get(url, {"read_mask": "title,unknown"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_partial_update(self):
         url = reverse("collection-detail", kwargs={"pk": self.collection.id})
         update_data = {"title": "바뀐 제목"}
@@ -69,6 +160,83 @@ class CollectionViewSetTestCase(APITestCase):
         response = self.client.patch(f"{url}?validate_only=true", self.invalid_data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_retrieve_etag(self):
+        url = reverse("collection-detail", kwargs={"pk": self.collection.id})
+        response = self.client.get(url)
+        etag = response["ETag"]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(len(context.captured_queries), 0)
+        # 다른 객체의 변경은 영향을 주지 않는다.
+        self.client.patch(
+            reverse("collection-detail", kwargs={"pk": self.collections[0].id}),
+            self.valid_data,
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.client.patch(url, self.valid_data)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_retrieve_etag_weak_comparison(self):
+        url = reverse("collection-detail", kwargs={"pk": self.collection.id})
+        etag = self.client.get(url)["ETag"]
+        for if_none_match in [f"W/{etag}", f'"other", W/{etag}', "*"]:
+            with self.subTest(if_none_match=if_none_match):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=if_none_match)
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(response["ETag"], etag)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='W/"other"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # "*"는 존재하지 않는 리소스와 일치하지 않는다.
+        url = reverse("collection-detail", kwargs={"pk": 0})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_retrieve_etag_read_mask(self):
+        url = reverse("collection-detail", kwargs={"pk": self.collection.id})
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, {"read_mask": "id"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_etag(self):
+        url = reverse("collection-list")
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.client.post(url, self.valid_data)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_partial_update_if_match(self):
+        url = reverse("collection-detail", kwargs={"pk": self.collection.id})
+        etag = self.client.get(url, {"read_mask": "id"})["ETag"]
+        response = self.client.patch(url, {"title": "첫 번째 수정"}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        response = self.client.patch(url, {"title": "두 번째 수정"}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.collection.refresh_from_db()
+        self.assertEqual(self.collection.title, "첫 번째 수정")
+        response = self.client.patch(url, {"title": "두 번째 수정"}, HTTP_IF_MATCH="*")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_batch_update_changes_etag(self):
+        url = reverse("collection-detail", kwargs={"pk": self.collection.id})
+        etag = self.client.get(url)["ETag"]
+        self.client.post(
+            reverse("collection-batch-update"),
+            {"resources": [{"id": self.collection.id, "title": "바뀐 제목"}]},
+            format="json",
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_delete(self):
         url = reverse("collection-detail", kwargs={"pk": self.collection.id})
         res = self.client.delete(url)
@@ -83,15 +251,124 @@ class CollectionViewSetTestCase(APITestCase):
         results_ids = [collection["id"] for collection in res.data["results"]]
         self.assertEqual(set(results_ids).issubset(set(collection_pk_list)), True)
 
-    def test_batch_get_ordering(self):
-        collection_pk_list = [collection.id for collection in self.collections]
+    def test_batch_get_request_order(self):
+        collection_pk_list = [collection.id for collection in self.collections][::-1]
         valueList = ",".join(str(pk) for pk in collection_pk_list)
         url = reverse("collection-batch-get")
-        res_1 = self.client.get(f"{url}?valueList={valueList}&ordering=id")
-        res_2 = self.client.get(f"{url}?valueList={valueList}&ordering=id desc")
-        self.assertEqual(res_1.status_code, status.HTTP_200_OK)
-        self.assertEqual(res_2.status_code, status.HTTP_200_OK)
-        self.assertNotEqual(res_1.data["results"], res_2.data["results"])
+        res = self.client.get(f"{url}?valueList={valueList}")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        results_ids = [collection["id"] for collection in res.data["results"]]
+        self.assertEqual(results_ids, collection_pk_list)
+
+    def test_batch_get_duplicated_and_not_found(self):
+        pk_1, pk_2 = self.collections[0].id, self.collections[1].id
+        missing_pk = max(collection.id for collection in self.collections) + 1
+        url = reverse("collection-batch-get")
+        res = self.client.get(f"{url}?valueList={pk_2},{missing_pk},{pk_2},{pk_1}")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(res.data.keys()), ["results"])
+        results = res.data["results"]
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["id"], pk_2)
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2]["id"], pk_1)
+
+    def test_batch_get_single_query(self):
+        valueList = ",".join(str(collection.id) for collection in self.collections)
+        url = reverse("collection-batch-get")
+        with CaptureQueriesContext(connection) as context:
+            res = self.client.get(f"{url}?valueList={valueList}")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertNotIn("COUNT", context.captured_queries[0]["sql"])
+
+    def test_batch_create(self):
+        url = reverse("collection-batch-create")
+        resources = [{"title": f"일괄 생성 {i}"} for i in range(3)]
+        response = self.client.post(url, {"resources": resources}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        results = response.data["results"]
+        self.assertEqual(
+            [result["title"] for result in results], [r["title"] for r in resources]
+        )
+        self.assertEqual(
+            NestedResource.objects.filter(
+                parent__in=[result["id"] for result in results]
+            ).count(),
+            3,
+        )
+
+    def test_batch_create_validate_only(self):
+        url = reverse("collection-batch-create")
+        count = Collection.objects.count()
+        resources = [self.valid_data, self.valid_data]
+        response = self.client.post(
+            f"{url}?validate_only=true", {"resources": resources}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        resources = [self.valid_data, self.invalid_data]
+        response = self.client.post(
+            f"{url}?validate_only=true", {"resources": resources}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("title", response.data[1])
+        self.assertEqual(Collection.objects.count(), count)
+
+    def test_batch_create_invalid_body(self):
+        url = reverse("collection-batch-create")
+        response = self.client.post(url, {"resources": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        resources = [self.valid_data] * 1001
+        response = self.client.post(url, {"resources": resources}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_update(self):
+        url = reverse("collection-batch-update")
+        collection_1, collection_2 = self.collections[:2]
+        resources = [
+            {"id": collection_2.id, "title": "두 번째"},
+            {"id": collection_1.id, "title": "첫 번째"},
+        ]
+        response = self.client.post(url, {"resources": resources}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], resources)
+        collection_1.refresh_from_db()
+        self.assertEqual(collection_1.title, "첫 번째")
+
+    def test_batch_update_validate_only(self):
+        url = reverse("collection-batch-update")
+        resources = [{"id": self.collection.id, "title": "바뀐 제목"}]
+        response = self.client.post(
+            f"{url}?validate_only=true", {"resources": resources}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.collection.refresh_from_db()
+        self.assertNotEqual(self.collection.title, "바뀐 제목")
+
+    def test_batch_update_not_found(self):
+        url = reverse("collection-batch-update")
+        missing_pk = max(collection.id for collection in self.collections) + 1
+        resources = [{"id": missing_pk, "title": "바뀐 제목"}]
+        response = self.client.post(url, {"resources": resources}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        resources = [{"id": self.collection.id}, {"id": self.collection.id}]
+        response = self.client.post(url, {"resources": resources}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_delete(self):
+        url = reverse("collection-batch-delete")
+        value_list = [collection.id for collection in self.collections[:3]]
+        response = self.client.post(
+            f"{url}?validate_only=true", {"valueList": value_list}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(Collection.objects.filter(id__in=value_list).count(), 3)
+        response = self.client.post(url, {"valueList": value_list}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(Collection.objects.filter(id__in=value_list).count(), 0)
+        response = self.client.post(url, {"valueList": value_list}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_search(self):
         url = reverse("collection-search")
@@ -115,16 +392,66 @@ class CollectionViewSetTestCase(APITestCase):
         res = self.client.get(f"{url}?title__contains=포함여부")
         self.assertEqual(res.data["results"][0]["id"], collection_2.id)
 
+    def test_search_filtering_contains(self):
+        collection_1 = CollectionFactory(title="Trigram Search")
+        collection_2 = CollectionFactory(title="100% 포함")
+        url = reverse("collection-search")
+        res = self.client.get(url, {"title__contains": "gram sea"})
+        self.assertEqual([r["id"] for r in res.data["results"]], [collection_1.id])
+        res = self.client.get(url, {"title__contains": "0%"})
+        self.assertEqual([r["id"] for r in res.data["results"]], [collection_2.id])
+        if connection.vendor == "postgresql":
+            with CaptureQueriesContext(connection) as context:
+                self.client.get(url, {"title__contains": "gram"})
+            self.assertIn("ILIKE", context.captured_queries[-1]["sql"])
+
+    def test_export(self):
+        url = reverse("collection-export")
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res["Content-Type"], "application/x-ndjson")
+        lines = b"".join(res.streaming_content).decode().splitlines()
+        results = [json.loads(line) for line in lines]
+        self.assertEqual(len(results), len(self.collections) + 1)
+        self.assertEqual(
+            results[0],
+            {"id": self.collections[-1].id, "title": self.collections[-1].title},
+        )
 
-class NestedCollectionViewSetTestCase(APITestCase):
-    def setUp(self) -> None:
-        self.some_parent = CollectionFactory()
-        self.nested_collection = NestedCollectionFactory()
-        self.nested_collections = NestedCollectionFactory.create_batch(10)
-        self.valid_data = {"title": "유효한 제목입니다."}
-        self.invalid_data = {"title": "유효하지 않은 임의의 길이를 지닌 제목입니다."}
-        self.move_valid_data = {"parent": self.some_parent.pk}
-        self.move_invalid_data = {"parent": 99999}
+    def test_export_json(self):
+        url = reverse("collection-export")
+        res = self.client.get(url, {"exportFormat": "json", "ordering": "id"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        results = json.loads(b"".join(res.streaming_content))
+        self.assertEqual(results[0]["id"], self.collection.id)
+        res = self.client.get(url, {"exportFormat": "xml"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_filtering(self):
+        url = reverse("collection-export")
+        res = self.client.get(url, {"title": self.collection.title})
+        results = b"".join(res.streaming_content).decode().splitlines()
+        self.assertEqual(
+            results,
+            [
+                json.dumps(
+                    {"id": self.collection.id, "title": self.collection.title},
+                    ensure_ascii=False,
+                )
+            ],
+        )
+
+
+class NestedCollectionViewSetTestCase(ExampleAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.some_parent = CollectionFactory()
+        cls.nested_collection = NestedCollectionFactory()
+        cls.nested_collections = NestedCollectionFactory.bulk_create_batch(10)
+        cls.valid_data = {"title": "유효한 제목입니다."}
+        cls.invalid_data = {"title": "유효하지 않은 임의의 길이를 지닌 제목입니다."}
+        cls.move_valid_data = {"parent": cls.some_parent.pk}
+        cls.move_invalid_data = {"parent": 99999}
 
     def test_list(self):
         url = reverse(
@@ -169,6 +496,23 @@ class NestedCollectionViewSetTestCase(APITestCase):
         res = self.client.post(url, self.invalid_data)
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_create_parent_query(self):
+        url = reverse(
+            "nested-collection-list", kwargs={"collection_pk": self.some_parent.id}
+        )
+        with CaptureQueriesContext(connection) as context:
+            res = self.client.post(url, self.valid_data)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        parent_queries = [
+            query
+            for query in context.captured_queries
+            if 'FROM "example_collection"' in query["sql"]
+        ]
+        self.assertEqual(len(parent_queries), 1)
+        url = reverse("nested-collection-list", kwargs={"collection_pk": 99999})
+        res = self.client.post(url, self.valid_data)
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_create_validate_only(self):
         url = reverse(
             "nested-collection-list", kwargs={"collection_pk": self.some_parent.id}
@@ -178,6 +522,63 @@ class NestedCollectionViewSetTestCase(APITestCase):
         res = self.client.post(f"{url}?validate_only=true", self.invalid_data)
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_create_duplicated_title(self):
+        url = reverse(
+            "nested-collection-list", kwargs={"collection_pk": self.some_parent.id}
+        )
+        with CaptureQueriesContext(connection) as context:
+            res = self.client.post(url, self.valid_data)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        # 중복 여부를 미리 조회하지 않는다.
+        self.assertFalse(
+            any(
+                query["sql"].startswith("SELECT")
+                and 'FROM "example_nestedcollection"' in query["sql"]
+                for query in context.captured_queries
+            )
+        )
+        expected = {"title": ["collection에 이미 해당 title의 nested collection 리소스가 존재합니다."]}
+        res = self.client.post(url, self.valid_data)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.json(), expected)
+        res = self.client.post(f"{url}?validate_only=true", self.valid_data)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.json(), expected)
+        self.assertEqual(
+            NestedCollection.objects.filter(
+                parent=self.some_parent, title=self.valid_data["title"]
+            ).count(),
+            1,
+        )
+        # 같은 title을 다른 collection에는 생성할 수 있다.
+        url = reverse(
+            "nested-collection-list",
+            kwargs={"collection_pk": self.nested_collection.parent.id},
+        )
+        res = self.client.post(url, self.valid_data)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+    def test_partial_update_duplicated_title(self):
+        other = NestedCollectionFactory(parent=self.nested_collection.parent)
+        url = reverse(
+            "nested-collection-detail",
+            kwargs={
+                "collection_pk": self.nested_collection.parent.pk,
+                "pk": self.nested_collection.pk,
+            },
+        )
+        res = self.client.patch(url, {"title": other.title})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("title", res.json())
+        res = self.client.patch(f"{url}?validate_only=true", {"title": other.title})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        # 자기 자신의 title은 중복이 아니다.
+        data = {"title": self.nested_collection.title}
+        res = self.client.patch(url, data)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        res = self.client.patch(f"{url}?validate_only=true", data)
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+
     def test_retrieve(self):
         url = reverse(
             "nested-collection-detail",
@@ -208,6 +609,15 @@ class NestedCollectionViewSetTestCase(APITestCase):
         res_2 = self.client.get(url_2)
         self.assertEqual(res_1.data, res_2.data)
 
+    def test_list_wildcard_read_mask(self):
+        url = reverse("nested-collection-list", kwargs={"collection_pk": "-"})
+        res = self.client.get(url, {"read_mask": "id,title"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(res.data["results"][0]), ["id", "title"])
+        res = self.client.get(url, {"read_mask": "parent"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(res.data["results"][0]), ["parent"])
+
     def test_partial_update(self):
         url = reverse(
             "nested-collection-detail",
@@ -257,6 +667,138 @@ class NestedCollectionViewSetTestCase(APITestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertNotEqual(origin_parent_id, res.data["parent"])
 
+    def test_move_conflict(self):
+        parent = self.nested_collection.parent
+        NestedCollectionFactory(
+            parent=self.some_parent, title=self.nested_collection.title
+        )
+        url = reverse(
+            "nested-collection-move",
+            kwargs={"collection_pk": parent.id, "pk": self.nested_collection.id},
+        )
+        for path in [url, f"{url}?validate_only=true"]:
+            with self.subTest(path=path):
+                res = self.client.post(path, self.move_valid_data)
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn("parent", res.json())
+        self.nested_collection.refresh_from_db()
+        self.assertEqual(self.nested_collection.parent_id, parent.id)
+
+    def test_move_not_found(self):
+        # 다른 collection의 하위 리소스는 이동할 수 없다.
+        for collection_pk, pk in [
+            (self.some_parent.id, self.nested_collection.id),
+            (self.nested_collection.parent.id, 99999),
+        ]:
+            url = reverse(
+                "nested-collection-move",
+                kwargs={"collection_pk": collection_pk, "pk": pk},
+            )
+            with self.subTest(url=url):
+                res = self.client.post(url, self.move_valid_data)
+                self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_batch_move(self):
+        source = CollectionFactory()
+        nested_collections = NestedCollectionFactory.bulk_create_batch(3, parent=source)
+        url = reverse(
+            "nested-collection-batch-move", kwargs={"collection_pk": source.id}
+        )
+        value_list = [nested_collections[2].id, nested_collections[0].id]
+        data = {"valueList": value_list, **self.move_valid_data}
+        with CaptureQueriesContext(connection) as context:
+            res = self.client.post(url, data, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([result["id"] for result in res.data["results"]], value_list)
+        self.assertEqual(
+            {result["parent"] for result in res.data["results"]}, {self.some_parent.id}
+        )
+        # 하위 리소스를 조회하지 않고 하나의 UPDATE 문으로 이동한다.
+        self.assertEqual(
+            [
+                query["sql"].split(" ")[0]
+                for query in context.captured_queries
+                if 'FROM "example_nestedcollection"' in query["sql"]
+                or query["sql"].startswith('UPDATE "example_nestedcollection"')
+            ],
+            ["UPDATE"],
+        )
+        self.assertEqual(
+            set(self.some_parent.nestedcollection_set.values_list("id", flat=True)),
+            set(value_list),
+        )
+
+    def test_batch_move_failure(self):
+        source = CollectionFactory()
+        nested_collections = NestedCollectionFactory.bulk_create_batch(2, parent=source)
+        NestedCollectionFactory(
+            parent=self.some_parent, title=nested_collections[1].title
+        )
+        url = reverse(
+            "nested-collection-batch-move", kwargs={"collection_pk": source.id}
+        )
+        value_list = [collection.id for collection in nested_collections]
+        cases = [
+            (
+                {"valueList": value_list, **self.move_valid_data},
+                status.HTTP_400_BAD_REQUEST,
+            ),
+            (
+                {"valueList": [value_list[0], 99999], **self.move_valid_data},
+                status.HTTP_404_NOT_FOUND,
+            ),
+            (
+                {"valueList": [value_list[0], value_list[0]], **self.move_valid_data},
+                status.HTTP_400_BAD_REQUEST,
+            ),
+            (
+                {"valueList": value_list, **self.move_invalid_data},
+                status.HTTP_400_BAD_REQUEST,
+            ),
+            ({"valueList": [], **self.move_valid_data}, status.HTTP_400_BAD_REQUEST),
+        ]
+        for data, status_code in cases:
+            with self.subTest(data=data):
+                res = self.client.post(url, data, format="json")
+                self.assertEqual(res.status_code, status_code)
+        # 하나라도 이동할 수 없다면 아무것도 이동하지 않는다.
+        self.assertEqual(source.nestedcollection_set.count(), 2)
+
+    def test_batch_move_validate_only(self):
+        source = CollectionFactory()
+        nested_collections = NestedCollectionFactory.bulk_create_batch(2, parent=source)
+        url = reverse(
+            "nested-collection-batch-move", kwargs={"collection_pk": source.id}
+        )
+        data = {
+            "valueList": [collection.id for collection in nested_collections],
+            **self.move_valid_data,
+        }
+        res = self.client.post(f"{url}?validate_only=true", data, format="json")
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(source.nestedcollection_set.count(), 2)
+        NestedCollectionFactory(
+            parent=self.some_parent, title=nested_collections[0].title
+        )
+        res = self.client.post(f"{url}?validate_only=true", data, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_wildcard(self):
+        url = reverse("nested-collection-export", kwargs={"collection_pk": "-"})
+        res = self.client.get(url, {"exportFormat": "json"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        results = json.loads(b"".join(res.streaming_content))
+        self.assertEqual(len(results), len(self.nested_collections) + 1)
+        url = reverse(
+            "nested-collection-export",
+            kwargs={"collection_pk": self.nested_collection.parent.pk},
+        )
+        res = self.client.get(url, {"exportFormat": "json"})
+        results = json.loads(b"".join(res.streaming_content))
+        self.assertEqual(
+            [result["id"] for result in results], [self.nested_collection.id]
+        )
+
     def test_move_validate_only(self):
         url = reverse(
             "nested-collection-move",
@@ -277,12 +819,55 @@ class NestedCollectionViewSetTestCase(APITestCase):
         self.assertEqual(origin_parent_id, self.nested_collection.parent.pk)
 
 
-class NestedResourceViewSetTestCase(APITestCase):
+class NestedCollectionUniqueConflictTestCase(TransactionTestCase):
+    # 트랜잭션 밖(autocommit)에서 unique 제약조건 위반이 처리되는지 확인한다.
     def setUp(self) -> None:
-        self.nested_resource = NestedResourceFactory()
-        self.collection = self.nested_resource.parent
-        self.validate_data = {"title": "유효한 값입니다."}
-        self.invalidate_data = {"title": "유효하지 않은 길의의 제목입니다. (20글자)"}
+        self.collection = CollectionFactory()
+        self.url = reverse(
+            "nested-collection-list", kwargs={"collection_pk": self.collection.pk}
+        )
+
+    def test_create_duplicated_title(self):
+        client = APIClient()
+        res = client.post(self.url, {"title": "중복"})
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        res = client.post(self.url, {"title": "중복"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("title", res.json())
+        self.assertEqual(NestedCollection.objects.count(), 1)
+
+    @skipUnlessDBFeature("test_db_allows_multiple_connections")
+    def test_concurrent_create(self):
+        # 같은 title을 동시에 생성하면 하나만 저장되고 나머지는 400으로 응답한다.
+        count = 8
+        barrier = threading.Barrier(count)
+        status_codes = []
+
+        def post():
+            try:
+                barrier.wait()
+                res = APIClient().post(self.url, {"title": "동시 생성"})
+                status_codes.append(res.status_code)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=post) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(status_codes.count(status.HTTP_201_CREATED), 1)
+        self.assertEqual(status_codes.count(status.HTTP_400_BAD_REQUEST), count - 1)
+        self.assertEqual(NestedCollection.objects.filter(title="동시 생성").count(), 1)
+
+
+class NestedResourceViewSetTestCase(ExampleAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.nested_resource = NestedResourceFactory()
+        cls.collection = cls.nested_resource.parent
+        cls.validate_data = {"title": "유효한 값입니다."}
+        cls.invalidate_data = {"title": "유효하지 않은 길의의 제목입니다. (20글자)"}
 
     def test_created(self):
         collection_url = reverse("collection-list")
@@ -297,6 +882,31 @@ class NestedResourceViewSetTestCase(APITestCase):
     def test_retrieve(self):
         pass
 
+    def test_retrieve_etag(self):
+        url = reverse(
+            "nested-resource-detail", kwargs={"collection_pk": self.collection.pk}
+        )
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        response = self.client.patch(url, self.validate_data, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_cache(self):
+        url = reverse(
+            "nested-resource-detail", kwargs={"collection_pk": self.collection.pk}
+        )
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertEqual(response.data["title"], self.nested_resource.title)
+        self.client.patch(url, self.validate_data)
+        response = self.client.get(url)
+        self.assertEqual(response.data["title"], self.validate_data["title"])
+
     def test_partial_update(self):
         pass
 
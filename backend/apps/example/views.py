@@ -1,6 +1,14 @@
-from django.shortcuts import get_object_or_404
+from django.core import exceptions as django_exceptions
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef
+from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from utils.db.update import update_returning
 from utils.drf_custom import mixins
+from utils.drf_custom.cache import model_changed, objects_changed
+from utils.drf_custom.exceptions import PreconditionFailed
 from utils.drf_custom.viewsets import GenericViewSet
 from utils.drf_custom.filters import (
     OrderingFilterBackend,
@@ -25,44 +33,89 @@ class CollectionViewSet(
     mixins.RetrieveModelMixin,
     mixins.PartialUpdateModelMixin,
     mixins.DestroyModelMixin,
+    mixins.BatchGetModelMixin,
+    mixins.BatchCreateModelMixin,
+    mixins.BatchUpdateModelMixin,
+    mixins.BatchDeleteModelMixin,
+    mixins.ExportModelMixin,
+    mixins.ConditionalRequestMixin,
     GenericViewSet,
 ):
     # Attributes
     queryset = Collection.objects.all()
     serializer_class = CollectionSerializer
 
-    validate_only_actions = ["create", "partial_update"]
+    validate_only_actions = [
+        "create",
+        "partial_update",
+        "batch_create",
+        "batch_update",
+        "batch_delete",
+    ]
+    read_mask_actions = ["list", "retrieve", "batch_get", "search", "export"]
+    fast_read_actions = ["list", "batch_get", "search"]
+    etag_actions = ["list", "retrieve", "batch_get", "search"]
+    etag_precondition_actions = ["partial_update"]
+    retrieve_cache_timeout = 60 * 5
 
     @property
     def filter_backends(self):
         map = {
             "list": [OrderingFilterBackend],
-            "batch_get": [OrderingFilterBackend, BatchGetFilterBackend],
+            "batch_get": [BatchGetFilterBackend],
             "search": [OrderingFilterBackend, DjangoFilterBackend],
+            "export": [OrderingFilterBackend, DjangoFilterBackend],
         }
         if self.action in map:
             return map[self.action]
         return []
 
     ordering_fields = ["id", "title"]
+    ordering_tiebreaker = "id"
     batch_get_value_regex = "^[0-9]+$"
     filterset_class = CollectionFilter
 
     pagination_class = SmallPageNumberPagination
+    count_estimate_threshold = 100000
+    count_cache_timeout = 60
 
     # Actions
     @action(methods=["get"], detail=False, url_path="batchGet")
     def batch_get(self, request, *args, **kwargs):
-        return self.list(request, *args, **kwargs)
+        return super().batch_get(request, *args, **kwargs)
+
+    @action(methods=["post"], detail=False, url_path="batchCreate")
+    def batch_create(self, request, *args, **kwargs):
+        return super().batch_create(request, *args, **kwargs)
+
+    @action(methods=["post"], detail=False, url_path="batchUpdate")
+    def batch_update(self, request, *args, **kwargs):
+        return super().batch_update(request, *args, **kwargs)
+
+    @action(methods=["post"], detail=False, url_path="batchDelete")
+    def batch_delete(self, request, *args, **kwargs):
+        return super().batch_delete(request, *args, **kwargs)
 
     @action(methods=["get"], detail=False)
     def search(self, request, *args, **kwargs):
         return self.list(request, *args, **kwargs)
 
+    @action(methods=["get"], detail=False)
+    def export(self, request, *args, **kwargs):
+        return super().export(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         obj = serializer.save()
         NestedResource.objects.create(parent=obj, title=f"{obj.pk}의 중첩된 리소스")
 
+    def perform_batch_create(self, serializer):
+        objs = serializer.save()
+        resources = NestedResource.objects.bulk_create(
+            [NestedResource(parent=obj, title=f"{obj.pk}의 중첩된 리소스") for obj in objs]
+        )
+        model_changed(NestedResource)
+        objects_changed(NestedResource, [resource.pk for resource in resources])
+
 
 class NestedCollectionViewSet(
     mixins.CreateModelMixin,
@@ -70,13 +123,16 @@ class NestedCollectionViewSet(
     mixins.RetrieveModelMixin,
     mixins.PartialUpdateModelMixin,
     mixins.DestroyModelMixin,
+    mixins.BatchWriteMixin,
+    mixins.ExportModelMixin,
+    mixins.ConditionalRequestMixin,
     GenericViewSet,
 ):
     # Attributes
     path_variable_config = {
         "collection_pk": {
             "field": "parent",
-            "allow_wildcard_actions": ["list", "retrieve"],
+            "allow_wildcard_actions": ["list", "retrieve", "export"],
         }
     }
 
@@ -84,39 +140,141 @@ class NestedCollectionViewSet(
 
     @property
     def serializer_class(self):
-        if self.action == "move":
+        if self.action in ("move", "batch_move"):
             return MoveNestedCollectionSerializer
         return NestedCollectionSerializer
 
-    validate_only_actions = ["create", "partial_update", "move"]
+    validate_only_actions = ["create", "partial_update", "move", "batch_move"]
+    read_mask_actions = ["list", "retrieve", "export"]
+    fast_read_actions = ["list"]
+    etag_actions = ["list", "retrieve"]
+    etag_precondition_actions = ["partial_update", "move"]
 
     @property
     def filter_backends(self):
         map = {
             "list": [OrderingFilterBackend, PathVariableFilterBackend],
             "retrieve": [PathVariableFilterBackend],
+            "export": [OrderingFilterBackend, PathVariableFilterBackend],
         }
         if self.action in map:
             return map[self.action]
         return []
 
     ordering_fields = ["id", "title"]
+    ordering_tiebreaker = "id"
 
     pagination_class = SmallPageNumberPagination
 
+    move_conflict_message = "이동할 collection에 이미 해당 title의 nested collection 리소스가 존재합니다."
+
     # Actions
     @action(methods=["post"], detail=True)
     def move(self, request, *args, **kwargs):
-        return self.partial_update(request, *args, **kwargs)
+        instances = self.move_nested_collections([self.kwargs["pk"]])
+        if instances is None:
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return Response(self.get_serializer(instances[0]).data)
+
+    @action(methods=["post"], detail=False, url_path="batchMove")
+    def batch_move(self, request, *args, **kwargs):
+        param = self.batch_write_values_param
+        values = self.get_batch_write_data(param)
+        # 하나라도 이동할 수 없다면 아무것도 이동하지 않는다.
+        with transaction.atomic():
+            instances = self.move_nested_collections(values, param)
+        if instances is None:
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return Response({"results": self.get_serializer(instances, many=True).data})
+
+    @action(methods=["get"], detail=False)
+    def export(self, request, *args, **kwargs):
+        return super().export(request, *args, **kwargs)
 
     def perform_create(self, serializer):
-        parent = get_object_or_404(Collection, pk=self.kwargs["collection_pk"])
+        parent = self.get_path_variable_object("collection_pk")
         return serializer.save(parent=parent)
 
+    def move_nested_collections(self, values, param=None):
+        """
+        collection_pk의 하위 리소스(values)를 parent로 이동하고, 이동된 리소스를 요청된 순서대로 반환합니다.
+
+        객체를 조회하지 않고 하나의 UPDATE 문으로 이동하며,
+        parent에 같은 title의 리소스가 있는지는 UPDATE의 조건(NOT EXISTS)으로 데이터베이스에서 확인합니다.
+        이동되지 않은 리소스가 있을 때만 원인(404, 400)을 조회합니다.
+        validate_only가 활성화된 경우 이동할 수 있는지만 확인하고 None을 반환합니다.
+        """
+        pks = self.get_move_pks(values, param)
+        serializer = self.get_serializer(data=self.request.data)
+        if not serializer.is_valid():
+            raise ValidationError(serializer.errors)
+        parent = serializer.validated_data["parent"]
+        queryset = NestedCollection.objects.filter(
+            parent=self.get_move_source(), pk__in=pks
+        )
+        conflicts = NestedCollection.objects.filter(
+            parent=parent, title=OuterRef("title")
+        ).exclude(pk=OuterRef("pk"))
+        if self.validate_only:
+            self.check_move(queryset, conflicts, pks, param)
+            return None
+        try:
+            instances = update_returning(
+                queryset.filter(~Exists(conflicts)), parent=parent
+            )
+            if len(instances) != len(pks):
+                # 이동된 리소스를 제외한 리소스에서 원인을 확인한다. (batch_move는 트랜잭션이 rollback된다.)
+                moved = {instance.pk for instance in instances}
+                self.check_move(
+                    queryset, conflicts, [pk for pk in pks if pk not in moved], param
+                )
+                # 조회하는 사이에 다른 요청이 리소스를 변경한 경우
+                raise PreconditionFailed()
+        except IntegrityError:
+            # 동시에 같은 title의 리소스가 생성, 이동된 경우
+            raise ValidationError(detail={"parent": [self.move_conflict_message]})
+        # UPDATE 문은 signal을 발생시키지 않으므로 model, object version을 직접 증가시킨다.
+        model_changed(NestedCollection)
+        objects_changed(NestedCollection, pks)
+        instances = {instance.pk: instance for instance in instances}
+        return [instances[pk] for pk in pks]
+
+    def get_move_pks(self, values, param):
+        field = NestedCollection._meta.pk
+        try:
+            pks = [field.to_python(value) for value in values]
+        except django_exceptions.ValidationError:
+            if param is None:
+                raise NotFound()
+            raise ValidationError(detail={f"{param}": "invalid value."})
+        if len(set(pks)) != len(pks):
+            raise ValidationError(detail={f"{param}": "duplicated value."})
+        return pks
+
+    def get_move_source(self):
+        try:
+            return Collection._meta.pk.to_python(self.kwargs["collection_pk"])
+        except django_exceptions.ValidationError:
+            raise NotFound()
+
+    def check_move(self, queryset, conflicts, pks, param):
+        # 하나의 collection의 하위 리소스는 title이 중복되지 않으므로 parent의 리소스와의 충돌만 확인한다.
+        rows = dict(
+            queryset.annotate(conflict=Exists(conflicts)).values_list("pk", "conflict")
+        )
+        not_found = [pk for pk in pks if pk not in rows]
+        if not_found:
+            if param is None:
+                raise NotFound()
+            raise NotFound(detail={f"{param}": not_found})
+        if any(rows.values()):
+            raise ValidationError(detail={"parent": [self.move_conflict_message]})
+
 
 class NestedResourceViewSet(
     mixins.RetrieveModelMixin,
     mixins.PartialUpdateModelMixin,
+    mixins.ConditionalRequestMixin,
     GenericViewSet,
 ):
     # Attributes
@@ -127,3 +285,7 @@ class NestedResourceViewSet(
     serializer_class = NestedResourceSerializer
 
     validate_only_actions = ["partial_update"]
+    read_mask_actions = ["retrieve"]
+    etag_actions = ["retrieve"]
+    etag_precondition_actions = ["partial_update"]
+    retrieve_cache_timeout = 60 * 5
@@ -0,0 +1,125 @@
+"""
+WSGI(gevent) / ASGI(uvicorn) 워커 벤치마크
+
+    python -m benchmarks.asgi [--modes wsgi,asgi] [--workers 2] [--concurrency 32] [--duration 10]
+
+gunicorn.conf.py의 GUNICORN_SERVER_MODE별로 서버를 실행하여
+NestedCollectionViewSet에 대한 처리량과 응답 시간을 비교합니다.
+DJANGO_SETTINGS_MODULE, DJANGO_DEFAULT_DATABASE_URL 등 환경변수는 manage.py와 동일하게 필요하며,
+데이터베이스에 migrate 후 예제 데이터를 생성합니다.
+"""
+import argparse
+import django
+from .load import Request, run_load
+from .server import WORKER_CLASSES, GunicornServer
+
+
+def setup_django():
+    django.setup()
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def seed(collections, nested_collections):
+    from apps.example.models import Collection, NestedCollection
+
+    # 이전 실행에서 생성된 데이터를 재사용한다.
+    missing = collections - Collection.objects.count()
+    if missing > 0:
+        Collection.objects.bulk_create(
+            Collection(title=f"[{i}] Benchmark Collection") for i in range(missing)
+        )
+    parents = list(Collection.objects.order_by("id")[:collections])
+    for parent in parents:
+        missing = nested_collections - parent.nestedcollection_set.count()
+        NestedCollection.objects.bulk_create(
+            NestedCollection(parent=parent, title=f"[{i}] Benchmark N-Collection")
+            for i in range(max(missing, 0))
+        )
+    return list(
+        NestedCollection.objects.filter(parent__in=parents).values_list(
+            "parent_id", "id"
+        )
+    )
+
+
+def get_scenarios(nested_collections):
+    from django.urls import reverse
+
+    def detail(collection_pk, pk):
+        kwargs = {"collection_pk": collection_pk, "pk": pk}
+        return reverse("nested-collection-detail", kwargs=kwargs)
+
+    def list_path(collection_pk):
+        return reverse(
+            "nested-collection-list", kwargs={"collection_pk": collection_pk}
+        )
+
+    parents = sorted({collection_pk for collection_pk, _ in nested_collections})
+    return {
+        "list": [Request("GET", list_path(pk)) for pk in parents],
+        "list (wildcard)": [Request("GET", list_path("-"))],
+        "retrieve": [Request("GET", detail(*pks)) for pks in nested_collections],
+        "create (validate_only)": [
+            Request(
+                "POST",
+                f"{list_path(pk)}?validate_only=true",
+                body={"title": "Benchmark"},
+            )
+            for pk in parents
+        ],
+    }
+
+
+def run(modes, workers, concurrency, duration, scenarios):
+    results = {}
+    for mode in modes:
+        with GunicornServer(mode=mode, workers=workers) as server:
+            for name, requests in scenarios.items():
+                result = run_load(
+                    server.host,
+                    server.port,
+                    requests,
+                    concurrency=concurrency,
+                    duration=duration,
+                )
+                results[(name, mode)] = result.summary()
+    return results
+
+
+def print_results(modes, scenarios, results):
+    print(f"{'scenario':<24}{'mode':<8}{'req/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for name in scenarios:
+        for mode in modes:
+            summary = results[(name, mode)]
+            errors = f"  errors={summary['errors']}" if summary["errors"] else ""
+            print(
+                f"{name:<24}{mode:<8}{summary['rps']:>10,.1f}"
+                f"{summary['p50']:>8.1f}ms{summary['p95']:>8.1f}ms{summary['p99']:>8.1f}ms"
+                f"{errors}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modes", default=",".join(WORKER_CLASSES))
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--collections", type=int, default=20)
+    parser.add_argument("--nested-collections", type=int, default=20)
+    args = parser.parse_args()
+    modes = args.modes.split(",")
+    setup_django()
+    nested_collections = seed(args.collections, args.nested_collections)
+    scenarios = get_scenarios(nested_collections)
+    print(
+        f"workers={args.workers} concurrency={args.concurrency} duration={args.duration}s"
+    )
+    results = run(modes, args.workers, args.concurrency, args.duration, scenarios)
+    print_results(modes, scenarios, results)
+
+
+if __name__ == "__main__":
+    main()
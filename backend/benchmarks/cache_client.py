@@ -0,0 +1,137 @@
+"""
+memcached client 벤치마크
+
+    python -m benchmarks.cache_client [--location host:port] [--iterations 2000] [--threads 8]
+
+django.core.cache.backends.memcached.MemcachedCache(python-memcached)와
+utils.cache.backends.memcached.PyMemcacheCache(pymemcache, pooled)의 처리량을 비교합니다.
+--location이 지정되지 않으면 benchmarks.memcached의 stand-in 서버를 사용합니다.
+python-memcached는 requirements에서 제외되었으므로 비교하려면 별도로 설치해야 합니다.
+
+Django는 요청이 끝날 때마다 cache.close()를 호출하므로 "request" 항목은
+요청 하나(get 5회, get_many 1회, set 1회) 이후 close()를 호출한 처리량입니다.
+"""
+import argparse
+import threading
+import time
+import warnings
+import django
+from django.conf import settings
+
+
+BACKENDS = {
+    "python-memcached": "django.core.cache.backends.memcached.MemcachedCache",
+    "pymemcache (pooled)": "utils.cache.backends.memcached.PyMemcacheCache",
+}
+
+MANY_KEYS = [f"benchmark:many:{i}" for i in range(10)]
+
+
+def setup_django():
+    if not settings.configured:
+        settings.configure()
+        django.setup()
+    warnings.filterwarnings("ignore", module="django.core.cache.backends.memcached")
+
+
+def create_cache(backend, location):
+    from django.core.cache.backends.base import InvalidCacheBackendError
+    from django.utils.module_loading import import_string
+
+    try:
+        cache_class = import_string(backend)
+        return cache_class(location, {"TIMEOUT": 60})
+    except (ImportError, InvalidCacheBackendError) as e:
+        print(f"  skip {backend}: {e}")
+        return None
+
+
+def run_get(cache, iterations):
+    for _ in range(iterations):
+        cache.get("benchmark:key")
+
+
+def run_set(cache, iterations):
+    for i in range(iterations):
+        cache.set("benchmark:key", i)
+
+
+def run_get_many(cache, iterations):
+    for _ in range(iterations):
+        cache.get_many(MANY_KEYS)
+
+
+def run_set_many(cache, iterations):
+    for i in range(iterations):
+        cache.set_many({key: i for key in MANY_KEYS})
+
+
+def run_request(cache, iterations):
+    for i in range(iterations):
+        for _ in range(5):
+            cache.get("benchmark:key")
+        cache.get_many(MANY_KEYS)
+        cache.set("benchmark:request", i)
+        cache.close()
+
+
+SCENARIOS = {
+    "get": run_get,
+    "set": run_set,
+    "get_many(10)": run_get_many,
+    "set_many(10)": run_set_many,
+    "request": run_request,
+}
+
+
+def measure(backend, location, scenario, iterations, threads):
+    # Django와 동일하게 스레드마다 cache 객체를 생성한다.
+    caches = [create_cache(backend, location) for _ in range(threads)]
+    if caches[0] is None:
+        return None
+    caches[0].set("benchmark:key", 0)
+    caches[0].set_many({key: 0 for key in MANY_KEYS})
+    workers = [
+        threading.Thread(target=SCENARIOS[scenario], args=(cache, iterations))
+        for cache in caches
+    ]
+    started_at = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started_at
+    for cache in caches:
+        cache.close()
+    return iterations * threads / elapsed
+
+
+def run(location, iterations, threads):
+    print(f"location={location} iterations={iterations} threads={threads}")
+    print(f"{'scenario':<16}" + "".join(f"{name:>24}" for name in BACKENDS))
+    for scenario in SCENARIOS:
+        row = f"{scenario:<16}"
+        for backend in BACKENDS.values():
+            ops = measure(backend, location, scenario, iterations, threads)
+            row += f"{'-' if ops is None else f'{ops:,.0f} ops/s':>24}"
+        print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--location", default=None)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+    setup_django()
+    if args.location:
+        run(args.location, args.iterations, args.threads)
+        return
+    from utils.testing.memcached import MemcachedServer
+
+    with MemcachedServer() as server:
+        run(server.location, args.iterations, args.threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import http.client
+import itertools
+import json
+import threading
+import time
+from collections import namedtuple
+
+
+# Load Generator
+# =============================================================================
+# keep-alive 연결을 사용하는 스레드 기반 부하 생성기입니다.
+# 각 스레드는 requests를 순서대로 반복하여 요청하며, 응답 시간과 실패 수를 기록합니다.
+#
+# result = run_load("127.0.0.1", 8000, [Request("GET", "/v0/collections")], concurrency=16)
+# result.summary()  # {"requests", "errors", "rps", "p50", "p95", "p99"}
+class Request(namedtuple("Request", ["method", "path", "body", "headers"])):
+    def __new__(cls, method, path, body=None, headers=None):
+        if body is not None and not isinstance(body, (str, bytes)):
+            body = json.dumps(body)
+            headers = {"Content-Type": "application/json", **(headers or {})}
+        return super().__new__(cls, method, path, body, headers or {})
+
+
+def percentile(values, percent):
+    # values는 정렬되어 있어야 한다.
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+class LoadResult:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.errors = 0
+        self.elapsed = 0.0
+
+    def record(self, latencies, errors):
+        with self.lock:
+            self.latencies.extend(latencies)
+            self.errors += errors
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+        return {
+            "requests": len(latencies),
+            "errors": self.errors,
+            "rps": round(len(latencies) / self.elapsed, 1) if self.elapsed else 0.0,
+            # 단위: ms
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+        }
+
+
+def run_worker(host, port, requests, deadline, result):
+    latencies = []
+    errors = 0
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    for request in itertools.cycle(requests):
+        if time.monotonic() >= deadline:
+            break
+        started_at = time.perf_counter()
+        try:
+            connection.request(
+                request.method, request.path, body=request.body, headers=request.headers
+            )
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        if response.status >= 400:
+            errors += 1
+        latencies.append(time.perf_counter() - started_at)
+    connection.close()
+    result.record(latencies, errors)
+
+
+def run_load(host, port, requests, concurrency=16, duration=10.0, warmup=1.0):
+    if warmup:
+        run_load(host, port, requests, concurrency, warmup, warmup=0)
+    result = LoadResult()
+    deadline = time.monotonic() + duration
+    threads = []
+    for i in range(concurrency):
+        # 스레드마다 시작 위치를 다르게 하여 같은 요청이 동시에 몰리지 않도록 한다.
+        offset = i % len(requests)
+        rotated = requests[offset:] + requests[:offset]
+        threads.append(
+            threading.Thread(
+                target=run_worker, args=(host, port, rotated, deadline, result)
+            )
+        )
+    started_at = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.elapsed = time.perf_counter() - started_at
+    return result
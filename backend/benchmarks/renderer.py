@@ -0,0 +1,97 @@
+"""
+JSON renderer, parser 벤치마크
+
+    python -m benchmarks.renderer [--items 1000] [--iterations 200]
+
+CollectionSerializer로 직렬화한 --items개의 목록(한글 title)을 렌더링, 파싱하는 시간을
+DRF의 JSONRenderer, JSONParser와 utils.drf_custom.renderers.JSONRenderer, parsers.JSONParser로 비교합니다.
+"serializer"는 모델 인스턴스와 values_list()의 행(FastReadSerializerMixin)의 serializer.data 시간을,
+"response"는 serializer.data와 렌더링을 포함한 응답 하나의 직렬화 시간을 비교합니다.
+DJANGO_SETTINGS_MODULE 등 환경변수는 manage.py와 동일하게 필요하며, 데이터베이스는 사용하지 않습니다.
+"""
+import argparse
+import io
+import time
+import django
+
+
+def get_collections(items):
+    from apps.example.models import Collection
+
+    return [Collection(id=i, title=f"[{i}] 한글로 작성된 제목") for i in range(items)]
+
+
+def get_fast_read_data(serializer_class, rows):
+    serializer = serializer_class(many=True)
+    serializer.child.get_read_plan()
+    serializer.instance = rows
+    return serializer.data
+
+
+def measure(func, iterations):
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started_at) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    django.setup()
+    from rest_framework import parsers as rest_parsers
+    from rest_framework import renderers as rest_renderers
+    from apps.example.serializers import CollectionSerializer
+    from utils.drf_custom import parsers, renderers
+
+    collections = get_collections(args.items)
+    rows = [(collection.id, collection.title) for collection in collections]
+    data = CollectionSerializer(collections, many=True).data
+    content = rest_renderers.JSONRenderer().render(data)
+    assert renderers.JSONRenderer().render(data) == content
+    cases = {
+        "render": {
+            "rest_framework": lambda: rest_renderers.JSONRenderer().render(data),
+            "drf_custom": lambda: renderers.JSONRenderer().render(data),
+        },
+        # serializer.data: 모델 인스턴스 / values_list()의 행 (FastReadSerializerMixin)
+        "serializer": {
+            "rest_framework": lambda: CollectionSerializer(collections, many=True).data,
+            "drf_custom": lambda: get_fast_read_data(CollectionSerializer, rows),
+        },
+        # 응답 하나의 직렬화(serializer.data) + 렌더링
+        "response": {
+            "rest_framework": lambda: rest_renderers.JSONRenderer().render(
+                CollectionSerializer(collections, many=True).data
+            ),
+            "drf_custom": lambda: renderers.JSONRenderer().render(
+                CollectionSerializer(collections, many=True).data
+            ),
+        },
+        "parse": {
+            "rest_framework": lambda: rest_parsers.JSONParser().parse(
+                io.BytesIO(content), parser_context={}
+            ),
+            "drf_custom": lambda: parsers.JSONParser().parse(
+                io.BytesIO(content), parser_context={}
+            ),
+        },
+    }
+    print(
+        f"items={args.items} iterations={args.iterations} "
+        f"size={len(content):,} bytes orjson={renderers.orjson is not None}"
+    )
+    print(f"{'case':<10}{'rest_framework':>18}{'drf_custom':>18}{'speedup':>10}")
+    for name, funcs in cases.items():
+        results = {key: measure(func, args.iterations) for key, func in funcs.items()}
+        expected, actual = results["rest_framework"], results["drf_custom"]
+        print(
+            f"{name:<10}{expected * 1000:>16.3f}ms{actual * 1000:>16.3f}ms"
+            f"{expected / actual:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+url resolve 벤치마크
+
+    python -m benchmarks.resolver [--routes 500] [--iterations 20000]
+
+api/urls.py와 같은 방식(CustomSimpleRouter, CustomNestedSimpleRouter, trailing_slash "/?")으로
+--routes개 이상의 url pattern을 등록하고, Django의 URLResolver와
+utils.drf_custom.resolvers.CompiledURLResolver의 resolve() 처리량을 비교합니다.
+"""
+import argparse
+import time
+import django
+from django.conf import settings
+
+
+def setup_django():
+    if not settings.configured:
+        settings.configure()
+        django.setup()
+
+
+def create_viewset():
+    from rest_framework import viewsets
+    from rest_framework.decorators import action
+
+    class BenchmarkViewSet(viewsets.ViewSet):
+        def list(self, request, *args, **kwargs):
+            pass
+
+        def create(self, request, *args, **kwargs):
+            pass
+
+        def retrieve(self, request, *args, **kwargs):
+            pass
+
+        def partial_update(self, request, *args, **kwargs):
+            pass
+
+        @action(methods=["post"], detail=False, url_path="batchGet")
+        def batch_get(self, request, *args, **kwargs):
+            pass
+
+        @action(methods=["post"], detail=True)
+        def move(self, request, *args, **kwargs):
+            pass
+
+    return BenchmarkViewSet
+
+
+def create_urlpatterns(routes):
+    # 리소스마다 최상위 router 4개, nested router 4개의 pattern이 생성된다.
+    from utils.drf_custom import routers
+
+    viewset = create_viewset()
+    urlpatterns = []
+    index = 0
+    while len(urlpatterns) < routes:
+        router = routers.CustomSimpleRouter()
+        router.trailing_slash = "/?"
+        router.register(f"resources-{index}", viewset, basename=f"resource-{index}")
+        nested_router = routers.CustomNestedSimpleRouter(
+            router, f"resources-{index}", lookup="resource"
+        )
+        nested_router.register(
+            "children", viewset, basename=f"resource-{index}-children"
+        )
+        urlpatterns += [*router.urls, *nested_router.urls]
+        index += 1
+    return urlpatterns, index
+
+
+def get_paths(resources):
+    # 앞, 중간, 마지막에 등록된 리소스의 list, detail, 커스텀 메서드, nested detail
+    paths = {}
+    for label, index in (
+        ("first", 0),
+        ("middle", resources // 2),
+        ("last", resources - 1),
+    ):
+        prefix = f"resources-{index}"
+        paths[f"{label} list"] = f"{prefix}/"
+        paths[f"{label} custom method"] = f"{prefix}/12:move"
+        paths[f"{label} nested detail"] = f"{prefix}/12/children/34"
+    paths["not found"] = "unknown/12"
+    return paths
+
+
+def measure(resolver, path, iterations):
+    from django.urls import Resolver404
+
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        try:
+            resolver.resolve(path)
+        except Resolver404:
+            pass
+    return iterations / (time.perf_counter() - started_at)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--routes", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    setup_django()
+    from django.urls.resolvers import RegexPattern, URLResolver
+    from utils.drf_custom.resolvers import CompiledURLResolver
+
+    urlpatterns, resources = create_urlpatterns(args.routes)
+    resolvers = {
+        "URLResolver": URLResolver(RegexPattern(r"^"), urlpatterns),
+        "CompiledURLResolver": CompiledURLResolver(urlpatterns),
+    }
+    print(f"routes={len(urlpatterns)} iterations={args.iterations}")
+    print(f"{'path':<24}" + "".join(f"{name:>24}" for name in resolvers))
+    for label, path in get_paths(resources).items():
+        row = f"{label:<24}"
+        for resolver in resolvers.values():
+            ops = measure(resolver, path, args.iterations)
+            row += f"{f'{ops:,.0f} ops/s':>24}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+# Gunicorn Server
+# =============================================================================
+# gunicorn.conf.py로 gunicorn을 실행하는 벤치마크용 서버입니다.
+# 현재 환경변수(DJANGO_SETTINGS_MODULE, DJANGO_DEFAULT_DATABASE_URL 등)를 그대로 사용합니다.
+#
+# with GunicornServer(mode="asgi", workers=2) as server:
+#     server.host, server.port
+WORKER_CLASSES = {
+    # GUNICORN_SERVER_MODE: worker_class
+    "wsgi": "gevent",
+    "asgi": "uvicorn.workers.UvicornWorker",
+}
+
+
+def get_free_port(host="127.0.0.1"):
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class GunicornServer:
+    def __init__(self, mode="wsgi", workers=2, host="127.0.0.1", env=None):
+        self.mode = mode
+        self.workers = workers
+        self.host = host
+        self.port = None
+        self.env = env or {}
+        self.process = None
+        self.log_dir = None
+
+    @property
+    def address(self):
+        return f"{self.host}:{self.port}"
+
+    def get_env(self):
+        env = {
+            **os.environ,
+            "DEBUG": "False",
+            "GUNICORN_SERVER_MODE": self.mode,
+            "DJANGO_METRICS_DIR": os.path.join(self.log_dir, "metrics"),
+        }
+        env.setdefault("GUNICORN_FORWARDED_ALLOW_IPS", "*")
+        env.setdefault("GUNICORN_PROXY_ALLOW_IPS", "*")
+        env.update(self.env)
+        return env
+
+    def get_command(self):
+        # 로그 경로, bind 등 gunicorn.conf.py에서 DEBUG에 따라 결정되는 값은 명령행 인자로 덮어쓴다.
+        return [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--config",
+            "gunicorn.conf.py",
+            "--bind",
+            self.address,
+            "--workers",
+            str(self.workers),
+            "--worker-class",
+            WORKER_CLASSES[self.mode],
+            "--access-logfile",
+            os.devnull,
+            "--error-logfile",
+            os.path.join(self.log_dir, "error.log"),
+            "--log-level",
+            "warning",
+        ]
+
+    def start(self, timeout=30):
+        self.log_dir = tempfile.mkdtemp(prefix="benchmark_gunicorn_")
+        self.port = get_free_port(self.host)
+        self.process = subprocess.Popen(
+            self.get_command(), cwd=BACKEND_DIR, env=self.get_env()
+        )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"gunicorn exited, see {self.log_dir}/error.log")
+            try:
+                socket.create_connection((self.host, self.port), timeout=1).close()
+            except OSError:
+                time.sleep(0.2)
+                continue
+            return self
+        self.stop()
+        raise RuntimeError(f"gunicorn did not start within {timeout} seconds")
+
+    def stop(self):
+        if self.process is None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,242 @@
+"""
+엔드포인트 처리량(throughput) 벤치마크
+
+    python -m benchmarks.throughput [--mode wsgi] [--workers 2] [--concurrency 32] [--duration 10]
+                                    [--collections 2000] [--nested-collections 5]
+                                    [--scenarios list,batch-get,...] [--output result.json] [--compare previous.json]
+
+예제 데이터를 factory로 생성(bulk_create)한 뒤 gunicorn.conf.py로 gunicorn을 실행하고,
+시나리오(엔드포인트)별로 부하를 발생시켜 처리량(req/s)과 p50, p95, p99 응답 시간(ms)을 JSON 파일로 기록합니다.
+--compare로 이전 실행의 JSON 파일을 지정하면 시나리오별 변화율을 함께 출력합니다.
+
+DJANGO_SETTINGS_MODULE, DJANGO_DEFAULT_DATABASE_URL 등 환경변수는 manage.py와 동일하게 필요합니다.
+SQLite 또는 로컬 PostgreSQL에서 실행하며, --memcached를 지정하면 memcached stand-in 서버를 실행하여
+DJANGO_CACHALOT_CACHE_URL, DJANGO_DRF_CUSTOM_CACHE_URL로 전달합니다. (production 설정)
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import platform
+import random
+from urllib.parse import urlencode
+import django
+from utils.testing.memcached import MemcachedServer
+from .load import Request, run_load
+from .server import WORKER_CLASSES, GunicornServer
+
+
+SEED_BATCH_SIZE = 1000
+BATCH_GET_SIZE = 200
+# mixed 시나리오에서 각 시나리오의 요청 비율
+MIXED_WEIGHTS = {
+    "list": 4,
+    "batch-get": 2,
+    "search": 2,
+    "nested-list (wildcard)": 1,
+    "create (validate_only)": 1,
+}
+
+
+def setup_django():
+    django.setup()
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def seed(collections, nested_collections):
+    from django.db.models import Count
+    from apps.example.models import Collection, NestedCollection
+    from apps.example.tests.factories import CollectionFactory, NestedCollectionFactory
+    from utils.testing.factories import bulk_save
+
+    # 이전 실행에서 생성된 데이터를 재사용하며, factory의 sequence(title)는 이어서 생성한다.
+    CollectionFactory.reset_sequence(Collection.objects.count())
+    NestedCollectionFactory.reset_sequence(NestedCollection.objects.count())
+    missing = collections - Collection.objects.count()
+    if missing > 0:
+        CollectionFactory.bulk_create_batch(missing, batch_size=SEED_BATCH_SIZE)
+    parent_ids = list(
+        Collection.objects.order_by("id").values_list("id", flat=True)[:collections]
+    )
+    counts = dict(
+        NestedCollection.objects.filter(parent_id__in=parent_ids)
+        .values_list("parent_id")
+        .annotate(count=Count("id"))
+    )
+    objs = []
+    for parent_id in parent_ids:
+        missing = nested_collections - counts.get(parent_id, 0)
+        if missing > 0:
+            objs += NestedCollectionFactory.build_batch(missing, parent_id=parent_id)
+    bulk_save(objs, batch_size=SEED_BATCH_SIZE)
+    return parent_ids
+
+
+def get_path(name, kwargs=None, params=None):
+    from django.urls import reverse
+
+    path = reverse(name, kwargs=kwargs)
+    return f"{path}?{urlencode(params)}" if params else path
+
+
+def get_scenarios(parent_ids):
+    # 시나리오마다 요청을 미리 생성하며, 같은 시드를 사용하므로 실행 간에 요청이 동일하다.
+    rand = random.Random(0)
+    list_requests = [
+        Request(
+            "GET",
+            get_path("collection-list", params={"ordering": ordering, "page": page}),
+        )
+        for ordering in ["title desc", "id", "title"]
+        for page in range(1, 6)
+    ]
+    batch_get_requests = []
+    for _ in range(20):
+        ids = rand.sample(parent_ids, min(BATCH_GET_SIZE, len(parent_ids)))
+        params = {"valueList": ",".join(map(str, ids))}
+        batch_get_requests.append(
+            Request("GET", get_path("collection-batch-get", params=params))
+        )
+    search_requests = [
+        Request(
+            "GET",
+            get_path("collection-search", params={"title__contains": f"[{number}"}),
+        )
+        for number in rand.sample(range(1, 100), 20)
+    ]
+    wildcard_requests = [
+        Request(
+            "GET",
+            get_path(
+                "nested-collection-list",
+                kwargs={"collection_pk": "-"},
+                params={"page": page},
+            ),
+        )
+        for page in range(1, 6)
+    ]
+    create_requests = [
+        Request(
+            "POST",
+            get_path("collection-list", params={"validate_only": "true"}),
+            body={"title": f"Benchmark {i}"},
+        )
+        for i in range(10)
+    ]
+    scenarios = {
+        "list": list_requests,
+        "batch-get": batch_get_requests,
+        "search": search_requests,
+        "nested-list (wildcard)": wildcard_requests,
+        "create (validate_only)": create_requests,
+    }
+    mixed = []
+    for name, weight in MIXED_WEIGHTS.items():
+        for i in range(weight * 10):
+            requests = scenarios[name]
+            mixed.append(requests[i % len(requests)])
+    rand.shuffle(mixed)
+    scenarios["mixed"] = mixed
+    return scenarios
+
+
+def get_metadata(args):
+    from django.db import connection
+
+    return {
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "database": connection.vendor,
+        "mode": args.mode,
+        "workers": args.workers,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "collections": args.collections,
+        "nested_collections": args.nested_collections,
+        "memcached": args.memcached,
+    }
+
+
+def run(args, scenarios):
+    results = {}
+    with contextlib.ExitStack() as stack:
+        env = {}
+        if args.memcached:
+            location = stack.enter_context(MemcachedServer()).location
+            cache_url = f"memcache://{location}"
+            env["DJANGO_CACHALOT_CACHE_URL"] = cache_url
+            env["DJANGO_DRF_CUSTOM_CACHE_URL"] = f"{cache_url}?KEY_PREFIX=drf_custom"
+        server = stack.enter_context(
+            GunicornServer(mode=args.mode, workers=args.workers, env=env)
+        )
+        for name, requests in scenarios.items():
+            result = run_load(
+                server.host,
+                server.port,
+                requests,
+                concurrency=args.concurrency,
+                duration=args.duration,
+            )
+            results[name] = result.summary()
+            print_result(name, results[name])
+    return results
+
+
+def print_result(name, summary, previous=None):
+    row = (
+        f"{name:<24}{summary['rps']:>10,.1f}"
+        f"{summary['p50']:>8.1f}ms{summary['p95']:>8.1f}ms{summary['p99']:>8.1f}ms"
+    )
+    if previous and previous.get("rps"):
+        change = (summary["rps"] / previous["rps"] - 1) * 100
+        row += f"{change:>+9.1f}%"
+    if summary["errors"]:
+        row += f"  errors={summary['errors']}"
+    print(row)
+
+
+def print_comparison(results, previous):
+    print(f"\ncompared with {previous['metadata']['created_at']} (req/s)")
+    for name, summary in results.items():
+        print_result(name, summary, previous["results"].get(name))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=list(WORKER_CLASSES), default="wsgi")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--collections", type=int, default=2000)
+    parser.add_argument("--nested-collections", type=int, default=5)
+    parser.add_argument("--scenarios", default="")
+    parser.add_argument("--memcached", action="store_true")
+    parser.add_argument("--output", default="")
+    parser.add_argument("--compare", default="")
+    args = parser.parse_args()
+    setup_django()
+    parent_ids = seed(args.collections, args.nested_collections)
+    scenarios = get_scenarios(parent_ids)
+    if args.scenarios:
+        names = args.scenarios.split(",")
+        scenarios = {name: scenarios[name] for name in names}
+    print(
+        f"mode={args.mode} workers={args.workers} "
+        f"concurrency={args.concurrency} duration={args.duration}s"
+    )
+    print(f"{'scenario':<24}{'req/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    results = run(args, scenarios)
+    report = {"metadata": get_metadata(args), "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,17 @@
 import os
 
+from asgiref.sync import ThreadSensitiveContext
 from django.core.asgi import get_asgi_application
 
 assert "DJANGO_SETTINGS_MODULE" in os.environ, "DJANGO_SETTINGS_MODULE 환경변수가 필요합니다."
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+
+async def application(scope, receive, send):
+    # Django 3.2의 ASGIHandler는 모든 요청의 sync 작업(sync middleware, sync view, sync_to_async)을
+    # 하나의 스레드에서 실행하므로, 요청마다 별도의 스레드를 지정하여 데이터베이스 작업이 몰리지 않도록 한다.
+    # (Django 4.0 이상의 ASGIHandler와 동일)
+    # 연결은 요청 스레드마다 생성되며 요청이 끝나면 request_finished에서 닫히거나 풀에 반환된다. (CONN_MAX_AGE = 0)
+    async with ThreadSensitiveContext():
+        await django_application(scope, receive, send)
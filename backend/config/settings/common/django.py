@@ -50,6 +50,25 @@ MIDDLEWARE = [
 ]
 
 
+# Metrics
+# =============================================================================
+# utils.metrics, 라우트 단위의 요청 지표 (/metrics, Prometheus)
+METRICS = {
+    "DIR": env.str("DJANGO_METRICS_DIR", default=None),  # 워커 간 집계에 사용될 디렉토리
+    "FLUSH_INTERVAL": 5,
+    "STATSD_ADDRESS": env.str("DJANGO_METRICS_STATSD_ADDRESS", default=None),
+    "STATSD_PREFIX": "backend",
+    # MetricsMiddleware는 MIDDLEWARE_ENABLED일 때만 MIDDLEWARE의 가장 앞에 추가된다.
+    "MIDDLEWARE_ENABLED": env.bool("DJANGO_METRICS_MIDDLEWARE_ENABLED", default=False),
+    # /metrics는 ENDPOINT_ENABLED일 때만 등록되며, ALLOWED_IPS(CIDR) 또는 TOKEN(Bearer)이 일치해야 응답한다.
+    "ENDPOINT_ENABLED": env.bool("DJANGO_METRICS_ENDPOINT_ENABLED", default=False),
+    "ALLOWED_IPS": env.list("DJANGO_METRICS_ALLOWED_IPS", default=["127.0.0.1", "::1"]),
+    "TOKEN": env.str("DJANGO_METRICS_TOKEN", default=None),
+}
+if METRICS["MIDDLEWARE_ENABLED"]:
+    MIDDLEWARE = ["utils.metrics.middleware.MetricsMiddleware", *MIDDLEWARE]
+
+
 # Database
 # =============================================================================
 DATABASES = {"default": env.db("DJANGO_DEFAULT_DATABASE_URL")}
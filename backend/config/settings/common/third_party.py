@@ -10,6 +10,16 @@ REST_FRAMEWORK["DEFAULT_FILTER_BACKENDS"] = []
 REST_FRAMEWORK[
     "DEFAULT_VERSIONING_CLASS"
 ] = "rest_framework.versioning.URLPathVersioning"
+# orjson으로 직렬화, 파싱하는 JSONRenderer, JSONParser (utils.drf_custom.renderers, parsers)
+REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [
+    "utils.drf_custom.renderers.JSONRenderer",
+    "rest_framework.renderers.BrowsableAPIRenderer",
+]
+REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = [
+    "utils.drf_custom.parsers.JSONParser",
+    "rest_framework.parsers.FormParser",
+    "rest_framework.parsers.MultiPartParser",
+]
 
 
 # Django Filter
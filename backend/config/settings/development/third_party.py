@@ -30,7 +30,9 @@ SPECTACULAR_SETTINGS["SWAGGER_UI_SETTINGS"]["displayRequestDuration"] = True
 # =============================================================================
 # https://django-cachalot.readthedocs.io/en/latest/quickstart.html#settings
 INSTALLED_APPS += ["cachalot"]
-CACHES["cachalot"] = env.cache("DJANGO_CACHALOT_CACHE_URL")
+# 프로세스 단위로 연결을 재사용하는 pymemcache backend (utils.cache.backends.memcached)
+MEMCACHED_BACKEND = "utils.cache.backends.memcached.PyMemcacheCache"
+CACHES["cachalot"] = env.cache("DJANGO_CACHALOT_CACHE_URL", backend=MEMCACHED_BACKEND)
 CACHALOT_CACHE = "cachalot"
 CACHALOT_UNCACHABLE_TABLES = ["django_migrations"]
 PANELS_DEFAULTS += ["cachalot.panels.CachalotPanel"]
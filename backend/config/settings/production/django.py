@@ -1,6 +1,29 @@
 from config.settings.common import *
 
 
+# Database
+# =============================================================================
+# gevent 워커에서는 요청마다 greenlet이 생성되므로 CONN_MAX_AGE로 연결을 유지할 수 없습니다.
+# 요청이 끝나면 연결을 워커 프로세스의 풀에 반환하고 다음 요청에서 재사용합니다.
+# (gunicorn.conf.py의 post_fork에서 psycopg2를 gevent에 맞게 patch 합니다.)
+DATABASES["default"]["ENGINE"] = "utils.db.backends.postgresql"
+DATABASES["default"]["CONN_MAX_AGE"] = 0
+DATABASES["default"]["POOL"] = {
+    "MAX_SIZE": env.int("DJANGO_DEFAULT_DATABASE_POOL_MAX_SIZE", default=10),
+    "TIMEOUT": env.int("DJANGO_DEFAULT_DATABASE_POOL_TIMEOUT", default=30),
+    "MAX_LIFETIME": env.int("DJANGO_DEFAULT_DATABASE_POOL_MAX_LIFETIME", default=1800),
+    "HEALTH_CHECK_INTERVAL": env.int(
+        "DJANGO_DEFAULT_DATABASE_POOL_HEALTH_CHECK_INTERVAL", default=30
+    ),
+}
+
+
+# Metrics
+# =============================================================================
+# gunicorn.conf.py의 DJANGO_METRICS_DIR 기본값과 일치해야 합니다.
+METRICS["DIR"] = env.str("DJANGO_METRICS_DIR", default="/tmp/django-metrics")
+
+
 # Logging
 # =============================================================================
 LOGGING = {
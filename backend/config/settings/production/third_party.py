@@ -27,12 +27,26 @@ SPECTACULAR_SETTINGS["DESCRIPTION"] = "Backend Production api description..."
 SPECTACULAR_SETTINGS["VERSION"] = "0.0.1"
 # https://swagger.io/docs/open-source-tools/swagger-ui/usage/configuration/
 SPECTACULAR_SETTINGS["SWAGGER_UI_SETTINGS"]["supportedSubmitMethods"] = []
+# 배포 시 생성된 스키마 파일 경로 (utils.drf_custom.views.CachedSpectacularAPIView)
+DRF_CUSTOM_SCHEMA_DIR = BASE_DIR / "schema"
 
 
 # Django Cachalot
 # =============================================================================
 # https://django-cachalot.readthedocs.io/en/latest/quickstart.html#settings
 INSTALLED_APPS += ["cachalot"]
-CACHES["cachalot"] = env.cache("DJANGO_CACHALOT_CACHE_URL")
+# 프로세스 단위로 연결을 재사용하는 pymemcache backend (utils.cache.backends.memcached)
+MEMCACHED_BACKEND = "utils.cache.backends.memcached.PyMemcacheCache"
+CACHES["cachalot"] = env.cache("DJANGO_CACHALOT_CACHE_URL", backend=MEMCACHED_BACKEND)
 CACHALOT_CACHE = "cachalot"
 CACHALOT_UNCACHABLE_TABLES = ["django_migrations"]
+
+
+# DRF Custom
+# =============================================================================
+# 모델 version, count, 객체 단위 응답 캐시는 모든 워커가 공유해야 한다.
+CACHES["drf_custom"] = env.cache(
+    "DJANGO_DRF_CUSTOM_CACHE_URL", backend=MEMCACHED_BACKEND
+)
+DRF_CUSTOM_CACHE = "drf_custom"
+DRF_CUSTOM_RESPONSE_CACHE = "drf_custom"
@@ -1 +1,9 @@
 from config.settings.common import *
+
+
+# Metrics
+# =============================================================================
+METRICS["ENDPOINT_ENABLED"] = True
+if not METRICS["MIDDLEWARE_ENABLED"]:
+    METRICS["MIDDLEWARE_ENABLED"] = True
+    MIDDLEWARE = ["utils.metrics.middleware.MetricsMiddleware", *MIDDLEWARE]
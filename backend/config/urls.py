@@ -1,12 +1,10 @@
 from django.conf import settings
 from django.conf.urls.static import static
 from django.urls import path, include
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
 from api.urls import urlpatterns as api_urls
+from utils.drf_custom.views import CachedSpectacularAPIView
+from utils.metrics.views import prometheus_metrics_view
 
 
 # Common urls
@@ -15,7 +13,7 @@ urlpatterns = [
     path(f"{settings.API_VERSION}/", include(api_urls)),
     path(
         f"{settings.API_VERSION}/schema/",
-        SpectacularAPIView.as_view(api_version=settings.API_VERSION),
+        CachedSpectacularAPIView.as_view(api_version=settings.API_VERSION),
         name="schema",
     ),
     path(
@@ -31,6 +29,13 @@ urlpatterns = [
 ]
 
 
+# Metrics
+# =============================================================================
+# utils.metrics, settings.METRICS["ENDPOINT_ENABLED"]일 때만 등록된다.
+if settings.METRICS.get("ENDPOINT_ENABLED"):
+    urlpatterns.append(path("metrics", prometheus_metrics_view, name="metrics"))
+
+
 if settings.DEBUG:
     import debug_toolbar
 
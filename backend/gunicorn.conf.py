@@ -1,5 +1,6 @@
 from tempfile import mkdtemp
 import multiprocessing
+import os
 import environ
 
 
@@ -12,11 +13,22 @@ DEBUG = env.bool("DEBUG")
 FORWARDED_ALLOW_IPS = env.str("GUNICORN_FORWARDED_ALLOW_IPS")
 PROXY_ALLOW_IPS = env.str("GUNICORN_PROXY_ALLOW_IPS")
 
+# "wsgi": gevent 워커, "asgi": uvicorn 워커 (utils.drf_custom.viewsets.AsyncGenericViewSet 활용)
+SERVER_MODE = env.str("GUNICORN_SERVER_MODE", default="wsgi")
+
+# utils.metrics, 워커 간 지표 집계 디렉토리 (config.settings의 METRICS["DIR"]과 일치해야 합니다.)
+METRICS_DIR = (
+    None if DEBUG else env.str("DJANGO_METRICS_DIR", default="/tmp/django-metrics")
+)
+
 
 # Config
 # ==============================================================================
 config = "./gunicorn.conf.py"  # 설정파일 경로
-wsgi_app = "config.wsgi:application"  # wsgi_app 경로, 파이썬모듈:변수
+# wsgi_app = "config.wsgi:application"  # wsgi_app 경로, 파이썬모듈:변수
+wsgi_app = (
+    "config.asgi:application" if SERVER_MODE == "asgi" else "config.wsgi:application"
+)
 
 
 # Debugging
@@ -55,9 +67,10 @@ syslog_addr = "udp://localhost:514"  # syslog를 보낼 주소
 syslog_prefix = None  # syslog에서 사용될 프로그램 이름 매개변수, gunicorn.<prefix>
 syslog_facility = "user"  # syslog 기능 이름
 enable_stdio_inheritance = False  # stdio 상속 활성화
-statsd_host = None  # StatsD 서버의 host:port
+# statsd_host = None  # StatsD 서버의 host:port
+statsd_host = env.str("GUNICORN_STATSD_HOST", default=None)
 dogstatsd_tags = ""  # StatsD에서 활용될 태그 목록, ,로 구분
-statsd_prefix = ""  # StatsD에 전송될 때 사용될 접두사
+statsd_prefix = "gunicorn"  # StatsD에 전송될 때 사용될 접두사
 
 
 # Process Naming
@@ -82,7 +95,8 @@ ciphers = None  # 암호화 방식, None일 경우 ssl 모듈의 기본 암호 l
 
 # Security
 # ==============================================================================
-limit_request_line = 1024  # HTTP request 최대 바이트 크기
+# batchGet(?valueList=, 최대 200개)의 request line을 허용하는 크기 (gunicorn 기본값)
+limit_request_line = 4094  # HTTP request line 최대 바이트 크기
 limit_request_fields = 100  # HTTP request 헤더 최대 갯수 제한
 limit_request_field_size = 1024  # HTTP request 헤더 필드 허용 크기 제한
 
@@ -137,9 +151,11 @@ if DEBUG:
     workers = 1
 # worker_class = 'sync'  # 사용 worker 종류
 worker_class = "sync" if DEBUG else "gevent"
+if SERVER_MODE == "asgi":
+    worker_class = "uvicorn.workers.UvicornWorker"
 
 # threads = 1  # gthread 전용, 워커의 스레드 개수, 일반적으로 2-4 x $(NUM_CORES), gthread를 사용하지 않음.
-worker_connections = 1000  # eventlet, gevent 전용, 동시 클라이언트 최대 수
+worker_connections = 1000  # eventlet, gevent, uvicorn 전용, 동시 클라이언트 최대 수
 max_requests = 10000  # 워커 처리 최대 요청 수, 넘길 경우 reload, 0일 경우 worker reload 비활성
 max_requests_jitter = 1000  # worker의 max_request = randint(0, max_requests_jitter)
 timeout = 30  # 해당 초 동안 응답 없는 작업자는 리로드 트리거
@@ -153,6 +169,12 @@ def on_starting(server):
     """
     마스터 프로세스의 __init__ 직전 호출
     """
+    if METRICS_DIR:
+        # 이전 실행에서 남은 워커의 지표를 제거한다.
+        from utils.metrics.registry import clear_directory
+
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        clear_directory(METRICS_DIR)
 
 
 def on_reload(server):
@@ -177,6 +199,11 @@ def post_fork(server, worker):
     """
     워커가 fork된 직후 호출
     """
+    if server.cfg.worker_class_str == "gevent":
+        # 데이터베이스 응답을 기다리는 동안 워커 전체가 멈추지 않고 다른 greenlet이 실행되도록 한다.
+        from psycogreen.gevent import patch_psycopg
+
+        patch_psycopg()
 
 
 def post_worker_init(worker):
@@ -220,12 +247,21 @@ def child_exit(server, worker):
     """
     마스터 프로세스에서 워커가 종료된 직후 호출
     """
+    if METRICS_DIR:
+        # 종료된 워커의 지표가 사라지지 않도록 병합해둔다.
+        from utils.metrics.registry import archive_worker
+
+        archive_worker(METRICS_DIR, worker.pid)
 
 
 def worker_exit(server, worker):
     """
     워커 프로세스에서 워커가 종료된 직후 호출
     """
+    if METRICS_DIR:
+        from utils.metrics.middleware import get_registry
+
+        get_registry().flush()
 
 
 def nworkers_changed(server, new_value, old_value):
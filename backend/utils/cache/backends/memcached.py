@@ -0,0 +1,73 @@
+import os
+import threading
+from django.core.cache.backends import memcached
+
+
+# Pooled Memcached Backend (pymemcache)
+# =============================================================================
+# CACHES = {
+#     "cachalot": {
+#         "BACKEND": "utils.cache.backends.memcached.PyMemcacheCache",
+#         "LOCATION": "cachalot-cache:11211",
+#         "OPTIONS": {  # pymemcache.HashClient의 인자
+#             "max_pool_size": None,  # 서버 당 최대 연결 수, 초과 시 RuntimeError
+#             "pool_idle_timeout": 60,  # 해당 시간(초) 이상 쉬었던 연결은 정리
+#             "connect_timeout": 1,
+#             "timeout": 1,
+#         },
+#     }
+# }
+#
+# Django는 스레드(gevent 환경에서는 greenlet)마다 cache 객체를 생성하고 요청이 끝날 때마다
+# close()로 memcached 연결을 끊습니다. 해당 backend는 프로세스 단위로 하나의 pooled client를
+# 공유하고, close()에서 연결을 끊지 않습니다.
+#
+# get_many, set_many, delete_many는 서버 당 하나의 요청(get_multi, set_multi)으로 처리됩니다.
+# pymemcache는 순수 python 구현(socket, threading.Lock)이므로 gevent의 monkey patch 이후에는
+# greenlet 단위로 대기합니다.
+HASH_CLIENT_OPTIONS = frozenset(
+    ("hasher", "use_pooling", "retry_attempts", "retry_timeout", "dead_timeout")
+)
+
+
+class PyMemcacheCache(memcached.PyMemcacheCache):
+    _clients = {}
+    _clients_lock = threading.Lock()
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        self._options = {
+            "use_pooling": True,
+            "pool_idle_timeout": 60,
+            "no_delay": True,
+            **self._options,
+        }
+        self._client_key = (
+            tuple(self.client_servers),
+            repr(sorted((k, v) for k, v in self._options.items() if k != "serde")),
+        )
+
+    @property
+    def _cache(self):
+        # fork 이전에 생성된 연결은 자식 프로세스에서 사용하지 않는다.
+        key = (os.getpid(), self._client_key)
+        client = self._clients.get(key)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = self.create_client()
+        return client
+
+    def create_client(self):
+        if len(self.client_servers) > 1:
+            return self._class(self.client_servers, **self._options)
+        # 서버가 하나라면 키마다 서버를 고르는 hash(순수 python murmur3) 과정이 필요 없다.
+        options = {
+            k: v for k, v in self._options.items() if k not in HASH_CLIENT_OPTIONS
+        }
+        return self._lib.PooledClient(self.client_servers[0], **options)
+
+    def close(self, **kwargs):
+        # 요청이 끝나도 연결을 pool에 유지한다.
+        pass
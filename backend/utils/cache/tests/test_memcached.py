@@ -0,0 +1,79 @@
+import importlib.util
+import threading
+from unittest import mock, skipUnless
+from django.test import SimpleTestCase
+from utils.cache.backends.memcached import PyMemcacheCache
+from utils.testing.memcached import MemcachedServer
+
+
+@skipUnless(importlib.util.find_spec("pymemcache"), "pymemcache가 설치되지 않았습니다.")
+class PyMemcacheCacheTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = MemcachedServer().__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.__exit__()
+        super().tearDownClass()
+
+    def create_cache(self, **options):
+        return PyMemcacheCache(
+            self.server.location, {"KEY_PREFIX": self.id(), "OPTIONS": options}
+        )
+
+    def test_operations(self):
+        cache = self.create_cache()
+        cache.set("key", {"value": 1})
+        self.assertEqual(cache.get("key"), {"value": 1})
+        cache.set_many({"a": 1, "b": 2})
+        self.assertEqual(cache.get_many(["a", "b", "c"]), {"a": 1, "b": 2})
+        self.assertTrue(cache.add("counter", 1))
+        self.assertFalse(cache.add("counter", 1))
+        self.assertEqual(cache.incr("counter"), 2)
+        with self.assertRaises(ValueError):
+            cache.incr("unknown")
+        cache.delete("key")
+        self.assertIsNone(cache.get("key"))
+
+    def test_shared_client(self):
+        # Django는 스레드마다 cache 객체를 생성한다.
+        clients = []
+
+        def create_client():
+            cache = self.create_cache()
+            cache.get("key")
+            cache.close()
+            clients.append(cache._cache)
+
+        threads = [threading.Thread(target=create_client) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(client) for client in clients}), 1)
+        # close() 이후에도 연결이 pool에 유지된다.
+        self.assertGreaterEqual(len(clients[0].client_pool.free), 1)
+
+    def test_options(self):
+        cache = self.create_cache(timeout=5)
+        self.assertIsNot(cache._cache, self.create_cache()._cache)
+        self.assertFalse(cache._cache.client_pool.free)
+        cache.get("key")
+        self.assertEqual(cache._cache.client_pool.free[0].timeout, 5)
+
+    def test_fork(self):
+        client = self.create_cache()._cache
+        with mock.patch("os.getpid", return_value=-1):
+            self.assertIsNot(self.create_cache()._cache, client)
+
+    def test_multiple_servers(self):
+        with MemcachedServer() as other:
+            cache = PyMemcacheCache(
+                [self.server.location, other.location], {"KEY_PREFIX": self.id()}
+            )
+            cache.set_many({f"key-{i}": i for i in range(20)})
+            self.assertEqual(len(cache.get_many([f"key-{i}" for i in range(20)])), 20)
+            self.assertTrue(self.server.store.items)
+            self.assertTrue(other.store.items)
@@ -0,0 +1,84 @@
+from django.db.backends.postgresql import base
+from psycopg2 import extensions
+from utils.db.pool import get_pool
+
+
+# Pooled PostgreSQL Backend
+# =============================================================================
+# DATABASES = {
+#     "default": {
+#         "ENGINE": "utils.db.backends.postgresql",
+#         "CONN_MAX_AGE": 0,  # 요청이 끝나면 연결을 풀에 반환한다.
+#         "POOL": {
+#             "MAX_SIZE": 10,  # 워커 프로세스 당 최대 연결 수
+#             "TIMEOUT": 30,  # 연결을 기다리는 최대 시간(초)
+#             "MAX_LIFETIME": 1800,  # 연결의 최대 수명(초)
+#             "HEALTH_CHECK_INTERVAL": 30,  # 해당 시간(초) 이상 쉬었던 연결은 SELECT 1 확인
+#         },
+#         ...
+#     }
+# }
+#
+# Django는 스레드(gevent 환경에서는 greenlet)마다 연결을 생성하고 close()로 정리합니다.
+# 해당 backend는 연결 생성과 정리를 풀에서의 획득, 반환으로 대체합니다.
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_pool(self, conn_params):
+        options = self.settings_dict.get("POOL", {})
+        # 테스트 데이터베이스 생성 등 다른 데이터베이스에 연결하는 경우 별도의 풀을 사용한다.
+        key = (self.alias, repr(sorted(conn_params.items())))
+        return get_pool(
+            key,
+            connect=lambda: super(DatabaseWrapper, self).get_new_connection(
+                conn_params
+            ),
+            max_size=options.get("MAX_SIZE", 10),
+            timeout=options.get("TIMEOUT", 30),
+            max_lifetime=options.get("MAX_LIFETIME", None),
+            health_check_interval=options.get("HEALTH_CHECK_INTERVAL", None),
+            check=self.check_connection,
+        )
+
+    def get_new_connection(self, conn_params):
+        self._pool = self.get_pool(conn_params)
+        connection = self._pool.acquire()
+        # base.DatabaseWrapper.get_new_connection이 연결 생성 시에 기록하는 값을
+        # 재사용되는 연결에 대해서도 동일하게 기록한다.
+        options = self.settings_dict["OPTIONS"]
+        self.isolation_level = options.get(
+            "isolation_level", connection.isolation_level
+        )
+        return connection
+
+    def _close(self):
+        if self.connection is None:
+            return
+        pool = self.__dict__.pop("_pool", None)
+        if pool is None:
+            return super()._close()
+        # atomic 블록 안에서 close()가 호출되면 Django는 블록이 끝날 때까지 self.connection을 유지하므로
+        # (closed_in_transaction) 다른 스레드가 같은 연결을 획득하지 않도록 풀에 반환하지 않고 폐기한다.
+        discard = self.in_atomic_block or not self.reset_connection(self.connection)
+        pool.release(self.connection, discard=discard)
+
+    def reset_connection(self, connection):
+        # 풀에 반환하기 전, 진행 중인 트랜잭션을 정리한다.
+        # 정리할 수 없는 연결(끊어진 연결 등)은 폐기한다.
+        if connection.closed:
+            return False
+        status = connection.info.transaction_status
+        if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if status != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                connection.rollback()
+            except base.Database.Error:
+                return False
+        return True
+
+    @staticmethod
+    def check_connection(connection):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        if connection.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+            connection.rollback()
+        return True
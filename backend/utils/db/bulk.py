@@ -0,0 +1,46 @@
+import itertools
+from django.db import connections, router, transaction
+
+
+# Bulk Insert
+# =============================================================================
+# 모델 인스턴스를 생성하지 않고 값(tuple)을 그대로 여러 행의 INSERT 문으로 저장합니다.
+# 대량의 시드 데이터 생성 등 bulk_create의 인스턴스 생성, 값 변환 비용도 부담이 되는 경우에 사용합니다.
+#
+# 모델의 save, signal, 필드의 기본값과 값 변환(get_db_prep_save)이 적용되지 않으므로
+# rows는 데이터베이스에 저장될 값이어야 합니다.
+#
+# bulk_insert(Collection, ["title"], ((f"[{i}] Collection",) for i in range(1000000)))
+def get_batch_size(connection, fields, batch_size=None):
+    # 데이터베이스의 쿼리 인자 수 제한(SQLite 등)을 넘지 않는 행의 수
+    max_batch_size = connection.ops.bulk_batch_size(fields, [None] * 100000)
+    return min(batch_size, max_batch_size) if batch_size else max_batch_size
+
+
+def bulk_insert(model, field_names, rows, using=None, batch_size=None):
+    """
+    rows(iterable)를 batch_size개의 행 단위로 INSERT하고, 저장된 행의 수를 반환합니다.
+    """
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    opts = model._meta
+    fields = [opts.get_field(name) for name in field_names]
+    qn = connection.ops.quote_name
+    columns = ", ".join(qn(field.column) for field in fields)
+    placeholder = f"({', '.join(['%s'] * len(fields))})"
+    batch_size = get_batch_size(connection, fields, batch_size)
+    rows = iter(rows)
+    count = 0
+    with transaction.atomic(using=using, savepoint=False):
+        with connection.cursor() as cursor:
+            while True:
+                batch = list(itertools.islice(rows, batch_size))
+                if not batch:
+                    break
+                values = ", ".join([placeholder] * len(batch))
+                cursor.execute(
+                    f"INSERT INTO {qn(opts.db_table)} ({columns}) VALUES {values}",
+                    list(itertools.chain.from_iterable(batch)),
+                )
+                count += len(batch)
+    return count
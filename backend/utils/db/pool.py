@@ -0,0 +1,155 @@
+import os
+import threading
+import time
+from collections import deque
+
+
+# Connection Pool
+# =============================================================================
+# 워커 프로세스 단위로 데이터베이스 연결을 재사용하기 위한 풀입니다.
+#
+# threading의 Lock, Semaphore만을 사용하므로 gevent의 monkey patch 이후에는
+# greenlet 단위로 협력적으로 대기합니다. (연결을 기다리는 동안 워커 전체가 멈추지 않습니다.)
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+    Required
+
+      - "connect" : 새로운 연결을 생성하는 callable
+
+    Can Overwrite
+
+      - "max_size" : 10, 동시에 사용될 수 있는 최대 연결 수
+
+      - "timeout" : 30, 연결을 얻기 위해 기다리는 최대 시간(초), 넘길 경우 PoolTimeout
+
+      - "max_lifetime" : None, 생성된 지 해당 시간(초)이 지난 연결은 재사용하지 않음
+
+      - "health_check_interval" : None, 해당 시간(초) 이상 쉬었던 연결은 check를 통과해야 재사용
+
+      - "check" : 연결이 사용 가능한지 확인하는 callable, False 또는 에러일 경우 폐기
+
+      - "close" : 연결을 닫는 callable, default: conn.close()
+    """
+
+    def __init__(
+        self,
+        connect,
+        max_size=10,
+        timeout=30,
+        max_lifetime=None,
+        health_check_interval=None,
+        check=None,
+        close=None,
+    ):
+        self.connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self.check = check
+        self._close = close or (lambda conn: conn.close())
+        self._semaphore = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = deque()  # (conn, released_at)
+        self._created_at = {}  # id(conn): created_at
+
+    @property
+    def size(self):
+        # 현재 열려있는 연결 수 (사용 중 + 대기 중)
+        return len(self._created_at)
+
+    @property
+    def idle_size(self):
+        return len(self._idle)
+
+    def acquire(self):
+        if not self._semaphore.acquire(timeout=self.timeout):
+            raise PoolTimeout(
+                f"{self.timeout}초 동안 연결을 얻지 못했습니다. (max_size={self.max_size})"
+            )
+        try:
+            return self._get_or_connect()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(self, conn, discard=False):
+        try:
+            if discard or self._is_expired(conn):
+                self._discard(conn)
+            else:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+        finally:
+            self._semaphore.release()
+
+    def close(self):
+        # 대기 중인 연결을 모두 닫는다. 사용 중인 연결은 반환될 때 닫히지 않는다.
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def _get_or_connect(self):
+        while True:
+            with self._lock:
+                conn, released_at = self._idle.pop() if self._idle else (None, None)
+            if conn is None:
+                conn = self.connect()
+                self._created_at[id(conn)] = time.monotonic()
+                return conn
+            if self._is_expired(conn) or not self._is_healthy(conn, released_at):
+                self._discard(conn)
+                continue
+            return conn
+
+    def _is_expired(self, conn):
+        if self.max_lifetime is None:
+            return False
+        created_at = self._created_at.get(id(conn), 0)
+        return time.monotonic() - created_at >= self.max_lifetime
+
+    def _is_healthy(self, conn, released_at):
+        if self.check is None or self.health_check_interval is None:
+            return True
+        if time.monotonic() - released_at < self.health_check_interval:
+            return True
+        try:
+            return bool(self.check(conn))
+        except Exception:
+            return False
+
+    def _discard(self, conn):
+        self._created_at.pop(id(conn), None)
+        try:
+            self._close(conn)
+        except Exception:
+            pass
+
+
+# Registry
+# =============================================================================
+# fork 이전에 생성된 풀의 연결을 자식 프로세스가 공유하지 않도록 pid 단위로 관리합니다.
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key, **kwargs):
+    pid = os.getpid()
+    with _pools_lock:
+        pool = _pools.get((pid, key))
+        if pool is None:
+            pool = _pools[(pid, key)] = ConnectionPool(**kwargs)
+        return pool
+
+
+def close_pools():
+    pid = os.getpid()
+    with _pools_lock:
+        pools = [pool for (pool_pid, _), pool in _pools.items() if pool_pid == pid]
+    for pool in pools:
+        pool.close()
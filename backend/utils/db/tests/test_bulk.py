@@ -0,0 +1,21 @@
+from django.test import TestCase
+from apps.example.models import Collection, NestedCollection
+from utils.db.bulk import bulk_insert
+
+
+class BulkInsertTestCase(TestCase):
+    def test_bulk_insert(self):
+        rows = ((f"[{i}] Collection",) for i in range(1500))
+        # 데이터베이스의 쿼리 인자 수 제한에 맞추어 나누어 저장한다.
+        with self.assertNumQueries(3):
+            count = bulk_insert(Collection, ["title"], rows, batch_size=500)
+        self.assertEqual(count, 1500)
+        self.assertEqual(Collection.objects.count(), 1500)
+        self.assertTrue(Collection.objects.filter(title="[1499] Collection").exists())
+
+    def test_foreign_key(self):
+        collection = Collection.objects.create(title="상위 Collection")
+        rows = [(collection.pk, "하위 1"), (collection.pk, "하위 2")]
+        self.assertEqual(bulk_insert(NestedCollection, ["parent", "title"], rows), 2)
+        self.assertEqual(collection.nestedcollection_set.count(), 2)
+        self.assertEqual(bulk_insert(NestedCollection, ["parent", "title"], []), 0)
@@ -0,0 +1,263 @@
+import importlib.util
+import json
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+from django.conf import settings
+from django.db import connection
+from django.test import SimpleTestCase
+from utils.db.pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    def test_reuse(self):
+        pool = ConnectionPool(FakeConnection, max_size=2)
+        conn = pool.acquire()
+        pool.release(conn)
+        self.assertIs(pool.acquire(), conn)
+        self.assertEqual(pool.size, 1)
+
+    def test_timeout(self):
+        pool = ConnectionPool(FakeConnection, max_size=1, timeout=0.01)
+        pool.acquire()
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+
+    def test_max_lifetime(self):
+        pool = ConnectionPool(FakeConnection, max_size=1, max_lifetime=0)
+        conn = pool.acquire()
+        pool.release(conn)
+        self.assertTrue(conn.closed)
+        self.assertIsNot(pool.acquire(), conn)
+
+    def test_health_check(self):
+        pool = ConnectionPool(
+            FakeConnection,
+            max_size=1,
+            health_check_interval=0,
+            check=lambda conn: False,
+        )
+        conn = pool.acquire()
+        pool.release(conn)
+        self.assertIsNot(pool.acquire(), conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(pool.size, 1)
+
+    def test_discard(self):
+        pool = ConnectionPool(FakeConnection, max_size=1)
+        conn = pool.acquire()
+        pool.release(conn, discard=True)
+        self.assertTrue(conn.closed)
+        self.assertEqual(pool.size, 0)
+        self.assertIsNot(pool.acquire(), conn)
+
+    def test_bounded_threads(self):
+        pool = ConnectionPool(FakeConnection, max_size=3)
+        lock = threading.Lock()
+        state = {"active": 0, "max_active": 0}
+
+        def work():
+            conn = pool.acquire()
+            with lock:
+                state["active"] += 1
+                state["max_active"] = max(state["max_active"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            pool.release(conn)
+
+        threads = [threading.Thread(target=work) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(state["max_active"], 3)
+        self.assertEqual(pool.size, 3)
+
+
+# gevent의 monkey patch는 프로세스 전체에 영향을 주므로 별도의 프로세스에서 확인합니다.
+GREENLET_SCRIPT = """
+from gevent import monkey
+
+monkey.patch_all()
+
+import json
+import gevent
+from utils.db.pool import ConnectionPool
+
+
+class FakeConnection:
+    def close(self):
+        pass
+
+
+pool = ConnectionPool(FakeConnection, max_size=3)
+state = {"active": 0, "max_active": 0}
+
+
+def work():
+    conn = pool.acquire()
+    state["active"] += 1
+    state["max_active"] = max(state["max_active"], state["active"])
+    gevent.sleep(0.01)  # 데이터베이스 응답 대기
+    state["active"] -= 1
+    pool.release(conn)
+
+
+gevent.joinall([gevent.spawn(work) for _ in range(50)])
+print(json.dumps({"max_active": state["max_active"], "size": pool.size}))
+"""
+
+
+@unittest.skipUnless(importlib.util.find_spec("gevent"), "gevent is not installed.")
+class GreenletConnectionPoolTestCase(SimpleTestCase):
+    def test_bounded_greenlets(self):
+        output = subprocess.check_output(
+            [sys.executable, "-c", GREENLET_SCRIPT], cwd=settings.BASE_DIR, timeout=30
+        )
+        result = json.loads(output)
+        self.assertEqual(result["max_active"], 3)
+        self.assertEqual(result["size"], 3)
+
+
+class FakePsycopgConnection:
+    # DatabaseWrapper.get_new_connection, _close가 사용하는 psycopg2 연결의 속성
+    isolation_level = 1  # ISOLATION_LEVEL_READ_COMMITTED
+
+    def __init__(self):
+        self.closed = 0
+        self.info = mock.Mock(transaction_status=0)  # TRANSACTION_STATUS_IDLE
+        self.rollback = mock.Mock()
+
+    def close(self):
+        self.closed = 1
+
+
+class PooledDatabaseWrapperCloseTestCase(SimpleTestCase):
+    # 데이터베이스 없이 psycopg2의 연결 생성을 대체하여 close()의 풀 반환, 폐기를 확인한다.
+    def setUp(self):
+        from django.db.backends.postgresql import base
+        from utils.db.backends.postgresql.base import DatabaseWrapper
+
+        patcher = mock.patch.object(
+            base.DatabaseWrapper,
+            "get_new_connection",
+            side_effect=lambda conn_params: FakePsycopgConnection(),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        settings_dict = {
+            **connection.settings_dict,
+            "OPTIONS": {},
+            # 연결이 반환되지 않으면 다음 연결을 바로 얻을 수 없다.
+            "POOL": {"MAX_SIZE": 1, "TIMEOUT": 0},
+        }
+        # 테스트마다 별도의 풀을 사용한다.
+        self.wrapper = DatabaseWrapper(settings_dict, alias=self.id())
+
+    def connect(self):
+        self.wrapper.connection = self.wrapper.get_new_connection({})
+        return self.wrapper.connection
+
+    def test_release(self):
+        raw_connection = self.connect()
+        self.wrapper.close()
+        self.assertIsNone(self.wrapper.connection)
+        self.assertFalse(raw_connection.closed)
+        self.assertIs(self.connect(), raw_connection)
+        self.wrapper.close()
+
+    def test_rollback_on_release(self):
+        raw_connection = self.connect()
+        raw_connection.info.transaction_status = 2  # TRANSACTION_STATUS_INTRANS
+        self.wrapper.close()
+        raw_connection.rollback.assert_called_once_with()
+        self.assertFalse(raw_connection.closed)
+        self.assertIs(self.connect(), raw_connection)
+        self.wrapper.close()
+
+    def test_discard_broken_connection(self):
+        raw_connection = self.connect()
+        raw_connection.info.transaction_status = 4  # TRANSACTION_STATUS_UNKNOWN
+        self.wrapper.close()
+        self.assertTrue(raw_connection.closed)
+        self.assertIsNot(self.connect(), raw_connection)
+        self.wrapper.close()
+
+    def test_discard_in_atomic_block(self):
+        raw_connection = self.connect()
+        self.wrapper.in_atomic_block = True
+        self.wrapper.close()
+        # Django는 atomic 블록이 끝날 때까지 연결을 유지하므로 풀에 반환하지 않고 닫는다.
+        self.assertTrue(self.wrapper.closed_in_transaction)
+        self.assertIs(self.wrapper.connection, raw_connection)
+        self.assertTrue(raw_connection.closed)
+        raw_connection.rollback.assert_not_called()
+        self.wrapper.in_atomic_block = False
+        self.wrapper.closed_in_transaction = False
+        self.wrapper.connection = None
+        # 폐기된 연결의 자리는 반환되므로 새로운 연결을 획득할 수 있다. (MAX_SIZE=1)
+        self.assertIsNot(self.connect(), raw_connection)
+        self.wrapper.close()
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "postgresql only")
+class PooledDatabaseWrapperTestCase(SimpleTestCase):
+    databases = {"default"}
+
+    def setUp(self):
+        from utils.db.backends.postgresql.base import DatabaseWrapper
+
+        settings_dict = {
+            **connection.settings_dict,
+            "POOL": {"MAX_SIZE": 1, "HEALTH_CHECK_INTERVAL": 0},
+        }
+        self.wrapper = DatabaseWrapper(settings_dict, alias="pool_test")
+
+    def test_reuse_connection(self):
+        self.wrapper.ensure_connection()
+        raw_connection = self.wrapper.connection
+        with self.wrapper.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        self.wrapper.close()
+        self.assertFalse(raw_connection.closed)
+        self.wrapper.ensure_connection()
+        self.assertIs(self.wrapper.connection, raw_connection)
+        self.wrapper.close()
+
+    def test_rollback_on_release(self):
+        self.wrapper.ensure_connection()
+        self.wrapper.set_autocommit(False)
+        with self.wrapper.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        raw_connection = self.wrapper.connection
+        self.wrapper.close()
+        self.assertEqual(raw_connection.info.transaction_status, 0)  # IDLE
+
+    def test_discard_in_atomic_block(self):
+        self.wrapper.ensure_connection()
+        raw_connection = self.wrapper.connection
+        self.wrapper.in_atomic_block = True
+        self.wrapper.close()
+        # Django는 atomic 블록이 끝날 때까지 연결을 유지하므로 풀에 반환하지 않고 닫는다.
+        self.assertTrue(self.wrapper.closed_in_transaction)
+        self.assertTrue(raw_connection.closed)
+        self.wrapper.in_atomic_block = False
+        self.wrapper.closed_in_transaction = False
+        self.wrapper.needs_rollback = False
+        self.wrapper.connection = None
+        # 폐기된 연결의 자리는 반환되므로 새로운 연결을 획득할 수 있다. (MAX_SIZE=1)
+        self.wrapper.ensure_connection()
+        self.assertIsNot(self.wrapper.connection, raw_connection)
+        self.wrapper.close()
@@ -0,0 +1,57 @@
+from unittest import mock
+from django.db import connection
+from django.db.models import Exists, OuterRef
+from django.test import TestCase
+from apps.example.models import Collection, NestedCollection
+from utils.db import update
+from utils.db.update import can_return_rows_from_update, update_returning
+
+
+class UpdateReturningTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.source = Collection.objects.create(title="원래 Collection")
+        cls.target = Collection.objects.create(title="이동할 Collection")
+        cls.nested_collections = [
+            NestedCollection.objects.create(parent=cls.source, title=f"하위 {i}")
+            for i in range(3)
+        ]
+        NestedCollection.objects.create(parent=cls.target, title="하위 2")
+
+    def get_queryset(self):
+        # 이동할 Collection에 같은 title이 있는 행은 수정하지 않는다.
+        conflicts = NestedCollection.objects.filter(
+            parent=self.target, title=OuterRef("title")
+        ).exclude(pk=OuterRef("pk"))
+        return NestedCollection.objects.filter(
+            parent=self.source, pk__in=[obj.pk for obj in self.nested_collections]
+        ).filter(~Exists(conflicts))
+
+    def assertMoved(self, instances):
+        expected = {obj.pk: obj.title for obj in self.nested_collections[:2]}
+        self.assertEqual({obj.pk: obj.title for obj in instances}, expected)
+        for obj in instances:
+            self.assertEqual(obj.parent_id, self.target.pk)
+            self.assertFalse(obj._state.adding)
+        self.assertEqual(
+            set(self.target.nestedcollection_set.values_list("pk", flat=True)),
+            set(expected) | {self.target.nestedcollection_set.get(title="하위 2").pk},
+        )
+
+    def test_update_returning(self):
+        if not can_return_rows_from_update(connection):
+            self.skipTest("UPDATE ... RETURNING을 지원하지 않는 데이터베이스입니다.")
+        with self.assertNumQueries(1):
+            instances = update_returning(self.get_queryset(), parent=self.target)
+        self.assertMoved(instances)
+
+    def test_without_returning(self):
+        with mock.patch.object(
+            update, "can_return_rows_from_update", return_value=False
+        ):
+            instances = update_returning(self.get_queryset(), parent=self.target.pk)
+        self.assertMoved(instances)
+
+    def test_empty(self):
+        queryset = NestedCollection.objects.filter(pk__in=[])
+        self.assertEqual(update_returning(queryset, title="변경"), [])
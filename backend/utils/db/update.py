@@ -0,0 +1,83 @@
+from django.core.exceptions import EmptyResultSet
+from django.db import connections, transaction
+from django.db.models.sql import UpdateQuery
+
+
+# Update Returning
+# =============================================================================
+# queryset에 해당하는 행을 하나의 UPDATE 문으로 수정하고, 수정된 행을 RETURNING으로 돌려받습니다.
+# 조회, 수정, 재조회를 하나의 쿼리로 수행하며, 조건(filter, Exists 등)은 UPDATE의 WHERE에서 평가되므로
+# 조회와 수정 사이에 다른 요청이 행을 변경하는 경쟁 상태가 없습니다.
+#
+# RETURNING을 지원하지 않는 데이터베이스(MySQL, MariaDB, SQLite 3.35 미만)에서는
+# 트랜잭션 안에서 select_for_update로 대상 행을 잠근 뒤 수정하고 다시 조회합니다.
+#
+# 모델의 save, signal이 적용되지 않으므로 drf_custom의 model_changed, objects_changed는 직접 호출해야 합니다.
+#
+# update_returning(NestedCollection.objects.filter(pk__in=[1, 2]), parent=collection)  # [NestedCollection, ...]
+def can_return_rows_from_update(connection):
+    if connection.vendor == "postgresql":
+        return True
+    if connection.vendor == "sqlite":
+        return connection.Database.sqlite_version_info >= (3, 35)
+    return False
+
+
+def get_returning_converters(connection, fields, table):
+    converters = []
+    for field in fields:
+        col = field.get_col(table)
+        field_converters = connection.ops.get_db_converters(
+            col
+        ) + col.get_db_converters(connection)
+        converters.append((col, field_converters))
+    return converters
+
+
+def convert_row(connection, converters, row):
+    row = list(row)
+    for i, (col, field_converters) in enumerate(converters):
+        for converter in field_converters:
+            row[i] = converter(row[i], col, connection)
+    return row
+
+
+def update_returning(queryset, **values):
+    """
+    queryset에 해당하는 행을 values로 수정하고, 수정된 행을 모델 인스턴스 목록으로 반환합니다. (순서 없음)
+    """
+    model = queryset.model
+    using = queryset.db
+    connection = connections[using]
+    query = queryset.query.chain(UpdateQuery)
+    query.add_update_values(values)
+    query.annotations = {}
+    # 상위 모델(multi-table inheritance)의 필드를 수정하는 경우 UPDATE 문이 여러 개 필요하다.
+    if query.related_updates or not can_return_rows_from_update(connection):
+        manager = model._base_manager.using(using)
+        with transaction.atomic(using=using, savepoint=False):
+            pks = list(
+                queryset.select_for_update().order_by().values_list("pk", flat=True)
+            )
+            manager.filter(pk__in=pks).update(**values)
+            return list(manager.filter(pk__in=pks).order_by())
+    opts = model._meta
+    compiler = query.get_compiler(using)
+    try:
+        compiler.pre_sql_setup()
+        sql, params = compiler.as_sql()
+    except EmptyResultSet:
+        # pk__in=[] 등 조건을 만족하는 행이 없음이 명확한 경우
+        return []
+    qn = connection.ops.quote_name
+    fields = opts.concrete_fields
+    columns = ", ".join(qn(field.column) for field in fields)
+    converters = get_returning_converters(connection, fields, opts.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f"{sql} RETURNING {columns}", params)
+        rows = cursor.fetchall()
+    field_names = [field.attname for field in fields]
+    return [
+        model.from_db(using, field_names, convert_row(connection, converters, row))
+        for row in rows
+    ]
@@ -0,0 +1,129 @@
+import hashlib
+import time
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import router, transaction
+from django.db.models.signals import post_save, post_delete
+
+
+# Cache
+# =============================================================================
+# drf_custom에서 활용되는 캐시입니다.
+# 여러 워커가 동일한 값을 바라봐야 하므로 운영 환경에서는 공유 캐시(memcached)를 지정합니다.
+def get_cache():
+    return caches[getattr(settings, "DRF_CUSTOM_CACHE", "default")]
+
+
+def get_response_cache():
+    # 직렬화된 응답을 저장하는 캐시입니다. 지정되지 않으면 DRF_CUSTOM_CACHE를 사용합니다.
+    alias = getattr(settings, "DRF_CUSTOM_RESPONSE_CACHE", None)
+    return caches[alias] if alias else get_cache()
+
+
+# Model Version
+# =============================================================================
+# 모델(테이블)에 쓰기가 발생할 때마다 증가하는 값입니다.
+# count 캐시 등 테이블 단위로 무효화되어야 하는 값의 캐시 키에 포함시켜 사용합니다.
+#
+# post_save, post_delete를 통해 증가하므로 signal을 발생시키지 않는 쓰기 동작
+# (bulk_create, bulk_update, QuerySet.update 등) 이후에는 model_changed를 직접 호출해야 합니다.
+def get_model_version_key(model):
+    return f"drf_custom:version:{model._meta.label_lower}"
+
+
+def get_model_versions(models):
+    cache = get_cache()
+    keys = {get_model_version_key(model): model for model in models}
+    versions = cache.get_many(keys)
+    for key in keys.keys() - versions.keys():
+        # 캐시에서 제거된 뒤 다시 생성되더라도 이전 version과 겹치지 않도록 시간을 초기값으로 사용한다.
+        cache.add(key, time.time_ns(), timeout=None)
+        versions[key] = cache.get(key)
+    return {keys[key]: version for key, version in versions.items()}
+
+
+def get_model_version(model):
+    return get_model_versions([model])[model]
+
+
+def model_changed(model):
+    increment_versions(model, [get_model_version_key(model)])
+
+
+def increment_versions(model, keys):
+    cache = get_cache()
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 아직 version이 생성되지 않았다면 무효화할 캐시도 없다.
+            pass
+    # 트랜잭션 안에서 변경된 경우 commit 이전의 값을 읽어 캐시한 요청이 있을 수 있으므로
+    # commit 이후에 한 번 더 증가시킨다.
+    using = router.db_for_write(model)
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(lambda: increment_versions(model, keys), using=using)
+
+
+_table_models = {}
+
+
+def get_query_models(query):
+    # 쿼리에 사용된 테이블의 모델들
+    if not _table_models:
+        _table_models.update(
+            {model._meta.db_table: model for model in apps.get_models()}
+        )
+    tables = {join.table_name for join in query.alias_map.values()}
+    models = {_table_models[table] for table in tables if table in _table_models}
+    return models or {query.model}
+
+
+# Object Version
+# =============================================================================
+# 객체(행)에 쓰기가 발생할 때마다 증가하는 값입니다.
+# ETag 등 객체 단위로 무효화되어야 하는 값에 사용합니다.
+#
+# model version과 마찬가지로 signal을 발생시키지 않는 쓰기 동작 이후에는
+# objects_changed를 직접 호출해야 합니다.
+def get_object_version_key(model, pk):
+    # url에서 전달된 값("1")과 객체의 값(1)이 같은 키를 사용하도록 정규화한다.
+    value = str(model._meta.pk.to_python(pk))
+    return f"{get_model_version_key(model)}:{hashlib.md5(value.encode()).hexdigest()}"
+
+
+def get_object_version(model, pk):
+    cache = get_cache()
+    key = get_object_version_key(model, pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def objects_changed(model, pks):
+    keys = [get_object_version_key(model, pk) for pk in pks if pk is not None]
+    increment_versions(model, keys)
+
+
+def track_model_changes(*models):
+    # AppConfig.ready에서 호출하여 모든 프로세스에서 동일하게 등록되도록 합니다.
+    for model in models:
+        for signal_name, signal in (
+            ("post_save", post_save),
+            ("post_delete", post_delete),
+        ):
+            signal.connect(
+                _model_changed_receiver,
+                sender=model,
+                dispatch_uid=f"drf_custom:{model._meta.label_lower}:{signal_name}",
+            )
+
+
+def _model_changed_receiver(sender, instance, **kwargs):
+    increment_versions(
+        sender,
+        [get_model_version_key(sender), get_object_version_key(sender, instance.pk)],
+    )
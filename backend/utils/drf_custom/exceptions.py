@@ -13,3 +13,20 @@ class BlockedSideEffect(rest_exceptions.APIException):
     status_code = rest_status.HTTP_500_INTERNAL_SERVER_ERROR
     default_detail = "validate_only 동작 수행에서 부작용이 있는 동작은 금지됩니다."
     default_code = "validate_only"
+
+
+# ConditionalRequestMixin
+class NotModified(rest_exceptions.APIException):
+    status_code = rest_status.HTTP_304_NOT_MODIFIED
+    default_detail = "not modified."
+    default_code = "not_modified"
+
+    def __init__(self, etag, detail=None, code=None):
+        super().__init__(detail, code)
+        self.etag = etag
+
+
+class PreconditionFailed(rest_exceptions.APIException):
+    status_code = rest_status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "리소스가 변경되었습니다. 리소스를 다시 조회한 뒤 요청해주세요."
+    default_code = "precondition_failed"
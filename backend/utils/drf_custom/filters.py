@@ -1,4 +1,6 @@
 import re
+from functools import lru_cache
+from django.core import exceptions as django_exceptions
 from django.template import loader
 from django.utils.encoding import force_str
 from rest_framework import (
@@ -8,6 +10,59 @@ from rest_framework import (
 from rest_framework.compat import coreapi, coreschema
 
 
+class OrderingConfig:
+    """
+    view의 설정마다 한번만 계산되는 OrderingFilterBackend의 설정입니다. (compile_ordering_config)
+    """
+
+    def __init__(self, param, valid_fields, tiebreaker, description):
+        self.param = param
+        self.valid_fields = valid_fields
+        # "field", "-field"
+        self.valid_terms = frozenset(
+            term for field, _ in valid_fields for term in (field, f"-{field}")
+        )
+        self.tiebreaker = tiebreaker
+        self.description = description
+
+    def parse(self, params):
+        return parse_ordering(params, self.valid_terms, self.tiebreaker)
+
+
+@lru_cache(maxsize=1024)
+def parse_ordering(params, valid_terms, tiebreaker):
+    # "title desc,id" -> ("-title", "id"), 허용되지 않은 값은 무시된다.
+    ordering = []
+    for param in params.split(","):
+        param = param.strip()
+        term = "-" + param[:-5].strip() if param.endswith(" desc") else param
+        if term in valid_terms and term not in ordering:
+            ordering.append(term)
+    if ordering and tiebreaker is not None:
+        if not any(term.lstrip("-") in (tiebreaker, "pk") for term in ordering):
+            # 마지막 정렬 값과 방향을 맞춰 (field, tiebreaker) 인덱스를 활용할 수 있도록 한다.
+            descending = ordering[-1].startswith("-")
+            ordering.append(("-" if descending else "") + tiebreaker)
+    return tuple(ordering)
+
+
+@lru_cache(maxsize=None)
+def compile_ordering_config(backend_class, param, ordering_fields, tiebreaker):
+    # 요청을 처리하는 중에 view class를 변경하지 않도록 module 단위로 캐시한다.
+    backend = backend_class()
+    valid_fields = get_valid_ordering_fields(ordering_fields)
+    description = backend.get_ordering_description(valid_fields)
+    return OrderingConfig(param, valid_fields, tiebreaker, description)
+
+
+def get_valid_ordering_fields(ordering_fields):
+    # ["id", ("created_time", "생성 시간")] -> [("id", "id"), ("created_time", "생성 시간")]
+    return [
+        (item, item) if isinstance(item, str) else tuple(item)
+        for item in ordering_fields
+    ]
+
+
 class OrderingFilterBackend(rest_filters.BaseFilterBackend):
     """
     Required
@@ -17,9 +72,14 @@ class OrderingFilterBackend(rest_filters.BaseFilterBackend):
     Can Overwrite
 
       - "ordering_param" : "ordering"
+
+      - "ordering_tiebreaker" : None, 정렬 결과를 결정짓기 위해 마지막에 추가되는 필드 (unique, index가 존재하는 필드)
+
+    허용된 정렬 값, 정렬 파라미터의 해석 결과, 스키마 파라미터는 view의 설정마다 한번만 계산됩니다.
     """
 
     ordering_param = "ordering"
+    ordering_tiebreaker = None
     ordering_title = "정렬"
     ordering_description = "결과 정렬에 사용되는 필드입니다."
     template = "rest_framework/filters/ordering.html"
@@ -31,39 +91,46 @@ class OrderingFilterBackend(rest_filters.BaseFilterBackend):
         return queryset
 
     def get_ordering(self, request, queryset, view):
-        ordering_param = getattr(view, "ordering_param", self.ordering_param)
-        params = request.query_params.get(ordering_param)
+        config = self.get_ordering_config(view)
+        params = request.query_params.get(config.param)
         if params:
-            fields = [
-                "-" + param.strip()[:-5] if param.endswith(" desc") else param.strip()
-                for param in params.split(",")
-            ]
-            ordering = self.remove_invalid_fields(queryset, fields, view, request)
+            ordering = config.parse(params)
             if ordering:
-                return ordering
+                return list(ordering)
         return None
 
     def remove_invalid_fields(self, queryset, fields, view, request):
-        valid_fields = [
-            item[0]
-            for item in self.get_valid_fields(queryset, view, {"request": request})
-        ]
-
-        def term_valid(term):
-            if term.endswith(" desc"):
-                term = term[:-5]
-            return term in valid_fields
-
-        return [term for term in fields if term_valid(term)]
+        # rest_framework.filters.OrderingFilter와 같은 hook, "field desc"는 "-field"로 변환되어 전달된다.
+        config = self.get_ordering_config(view)
+        return [term for term in fields if term in config.valid_terms]
+
+    def get_ordering_config(self, view):
+        # view의 설정(ordering_param, ordering_fields, ordering_tiebreaker)마다 한번만 계산한다.
+        # (as_view(initkwargs) 등으로 설정이 달라진 경우에도 설정별로 재사용된다.)
+        ordering_fields = getattr(view, "ordering_fields", None) or ()
+        return compile_ordering_config(
+            type(self),
+            getattr(view, "ordering_param", self.ordering_param),
+            tuple(get_valid_ordering_fields(ordering_fields)),
+            getattr(view, "ordering_tiebreaker", self.ordering_tiebreaker),
+        )
 
     def get_valid_fields(self, queryset, view, context={}):
         valid_fields = getattr(view, "ordering_fields", None)
         if valid_fields is None:
             return []
-        valid_fields = [
-            (item, item) if isinstance(item, str) else item for item in valid_fields
-        ]
-        return valid_fields
+        return get_valid_ordering_fields(valid_fields)
+
+    def get_ordering_description(self, valid_fields):
+        useable_values = ", ".join(
+            [
+                *[f'"{field}"' for field, _ in valid_fields],
+                *[f'"{field} desc"' for field, _ in valid_fields],
+            ]
+        )
+        return force_str(
+            "{}\n\n사용 가능한 값들 = [{}]".format(self.ordering_description, useable_values)
+        )
 
     def to_html(self, request, queryset, view):
         if not getattr(view, "ordering_fields", None):
@@ -73,15 +140,16 @@ class OrderingFilterBackend(rest_filters.BaseFilterBackend):
         return template.render(context)
 
     def get_template_context(self, request, queryset, view):
+        config = self.get_ordering_config(view)
         current = self.get_ordering(request, queryset, view)
         current = None if not current else current[0]
         options = []
         context = {
             "request": request,
             "current": current,
-            "param": getattr(view, "ordering_param", self.ordering_param),
+            "param": config.param,
         }
-        for key, label in self.get_valid_fields(queryset, view, context):
+        for key, label in config.valid_fields:
             options.append((key, "%s - %s" % (label, "오름차순")))
             options.append((key + " desc", "%s - %s" % (label, "내림차순")))
         context["options"] = options
@@ -96,23 +164,15 @@ class OrderingFilterBackend(rest_filters.BaseFilterBackend):
         assert (
             coreschema is not None
         ), "coreschema must be installed to use `get_schema_fields()`"
-        useable_values = ", ".join(
-            [
-                *[f'"{field}"' for field in view.ordering_fields],
-                *[f'"{field} desc"' for field in view.ordering_fields],
-            ]
-        )
-        ordering_description = "{}\n\n사용 가능한 값들 = [{}]".format(
-            self.ordering_description, useable_values
-        )
+        config = self.get_ordering_config(view)
         return [
             coreapi.Field(
-                name=getattr(view, "ordering_param", self.ordering_param),
+                name=config.param,
                 required=False,
                 location="query",
                 schema=coreschema.String(
                     title=force_str(self.ordering_title),
-                    description=force_str(ordering_description),
+                    description=config.description,
                 ),
             )
         ]
@@ -120,22 +180,13 @@ class OrderingFilterBackend(rest_filters.BaseFilterBackend):
     def get_schema_operation_parameters(self, view):
         if not getattr(view, "ordering_fields", None):
             return []
-
-        useable_values = ", ".join(
-            [
-                *[f'"{field}"' for field in view.ordering_fields],
-                *[f'"{field} desc"' for field in view.ordering_fields],
-            ]
-        )
-        ordering_description = "{}\n\n사용 가능한 값들 = [{}]".format(
-            self.ordering_description, useable_values
-        )
+        config = self.get_ordering_config(view)
         return [
             {
-                "name": getattr(view, "ordering_param", self.ordering_param),
+                "name": config.param,
                 "required": False,
                 "in": "query",
-                "description": force_str(ordering_description),
+                "description": config.description,
                 "schema": {
                     "type": "string",
                 },
@@ -156,6 +207,8 @@ class BatchGetFilterBackend(rest_filters.BaseFilterBackend):
       - "batch_get_param" : ?valueList=1,2,3
 
       - "batch_get_limit" : over, raise ValidationError
+
+    요청된 식별자들(중복 제거, 요청 순서 유지)은 view.batch_get_values에 기록됩니다.
     """
 
     batch_get_param = "valueList"
@@ -168,11 +221,10 @@ class BatchGetFilterBackend(rest_filters.BaseFilterBackend):
     def filter_queryset(self, request, queryset, view):
 
         lookup_field = getattr(view, "batch_get_lookup_field", view.lookup_field)  # pk
-        lookup_value_regex = view.batch_get_value_regex  # required
         query_expr = f"{lookup_field}__in"  # "pk__in"
 
         batch_get_param = getattr(view, "batch_get_param", self.batch_get_param)
-        values = self.get_lookup_values(request, batch_get_param, lookup_value_regex)
+        values = self.get_request_values(request, batch_get_param)
         if not values:
             raise rest_exceptions.ValidationError(
                 detail={f"{batch_get_param}": f"required query string."},
@@ -181,23 +233,58 @@ class BatchGetFilterBackend(rest_filters.BaseFilterBackend):
         if len(values) > batch_get_limit:
             raise rest_exceptions.ValidationError(
                 detail={
-                    f"{batch_get_param}": f"Over batch get limit count. (input={len(values)}, allow={self.batch_get_limit})"
+                    f"{batch_get_param}": f"Over batch get limit count. (input={len(values)}, allow={batch_get_limit})"
                 },
             )
-        queryset = queryset.filter(**{query_expr: values})
+        lookup_values = self.get_lookup_values(
+            values, queryset.model, lookup_field, view
+        )
+        view.batch_get_values = [lookup_values.get(value) for value in values]
+        if not lookup_values:
+            return queryset.none()
+        queryset = queryset.filter(**{query_expr: list(lookup_values.values())})
         return queryset
 
-    def get_lookup_values(self, request, batch_get_param, lookup_value_regex):
+    def get_request_values(self, request, batch_get_param):
+        # 중복을 제거하되 요청된 순서는 유지한다.
         csv_value = request.query_params.get(batch_get_param)
         if csv_value:
-            lookup_values = [
-                value.strip()
-                for value in csv_value.split(",")
-                if re.match(lookup_value_regex, value.strip())
-            ]
-            return lookup_values
+            values = (value.strip() for value in csv_value.split(","))
+            return list(dict.fromkeys(value for value in values if value))
         return None
 
+    def get_lookup_values(self, values, model, lookup_field, view):
+        # {요청된 값: 모델 필드의 python 값}, 올바르지 않은 식별자는 제외된다.
+        pattern = self.get_lookup_value_pattern(view)
+        model_field = self.get_lookup_model_field(model, lookup_field)
+        lookup_values = {}
+        for value in values:
+            if not pattern.match(value):
+                continue
+            try:
+                lookup_values[value] = model_field.to_python(value)
+            except django_exceptions.ValidationError:
+                continue
+        return lookup_values
+
+    def get_lookup_value_pattern(self, view):
+        # view class마다 한번만 컴파일한다.
+        view_class = type(view)
+        lookup_value_regex = view.batch_get_value_regex  # required
+        pattern = view_class.__dict__.get("_batch_get_value_pattern")
+        if pattern is None or pattern.pattern != lookup_value_regex:
+            pattern = re.compile(lookup_value_regex)
+            view_class._batch_get_value_pattern = pattern
+        return pattern
+
+    def get_lookup_model_field(self, model, lookup_field):
+        field_names = lookup_field.split("__")
+        for field_name in field_names[:-1]:
+            model = model._meta.get_field(field_name).related_model
+        if field_names[-1] == "pk":
+            return model._meta.pk
+        return model._meta.get_field(field_names[-1])
+
     def get_schema_fields(self, view):
         return super().get_schema_fields(view)
 
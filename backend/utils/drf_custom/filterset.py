@@ -2,6 +2,7 @@ from django_filters.rest_framework import DjangoFilterBackend
 from django_filters import FilterSet as OriginFilterSet
 from django_filters import filters as django_filters  # has hint
 from django_filters import rest_framework as filters  # not has hint
+from . import lookups  # trigram_contains
 
 
 class FilterSet(OriginFilterSet):
@@ -10,3 +11,16 @@ class FilterSet(OriginFilterSet):
         filter = super().filter_for_field(f, name, lookup_expr)
         filter.extra["help_text"] = f.help_text
         return filter
+
+
+class TrigramContainsFilter(filters.CharFilter):
+    """
+    문자열 포함 여부를 trigram_contains lookup으로 조회합니다.
+
+    PostgreSQL에서는 trigram GIN 인덱스를 활용하여, 조회 시간이 테이블 크기가 아닌 결과 크기에 비례합니다.
+    (검색어가 3글자 미만인 경우 인덱스의 효과가 줄어듭니다.)
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("lookup_expr", "trigram_contains")
+        super().__init__(*args, **kwargs)
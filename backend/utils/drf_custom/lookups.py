@@ -0,0 +1,89 @@
+from django.contrib.postgres import operations as postgres_operations
+from django.db.models import CharField, TextField, lookups
+
+
+# Trigram Contains
+# =============================================================================
+# icontains는 PostgreSQL에서 UPPER("title"::text) LIKE UPPER('%x%')로 변환되어
+# 컬럼에 생성된 trigram GIN 인덱스(gin_trgm_ops)를 활용할 수 없습니다.
+#
+# trigram_contains는 PostgreSQL에서 "title" ILIKE '%x%'로 변환되어 인덱스를 활용하며,
+# 그 외의 데이터베이스에서는 icontains와 동일하게 동작합니다.
+#
+# 인덱스는 마이그레이션에서 생성합니다. (TrigramExtension, create_trigram_index 참고)
+@CharField.register_lookup
+@TextField.register_lookup
+class TrigramContains(lookups.IContains):
+    lookup_name = "trigram_contains"
+
+    def as_sql(self, compiler, connection):
+        return lookups.IContains(self.lhs, self.rhs).as_sql(compiler, connection)
+
+    def as_postgresql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql} ILIKE {rhs_sql}", [*lhs_params, *rhs_params]
+
+
+# Migration Operations
+# =============================================================================
+class TrigramExtension(postgres_operations.TrigramExtension):
+    """
+    pg_trgm 확장을 생성합니다. PostgreSQL이 아닌 데이터베이스에서는 아무것도 하지 않습니다.
+
+    CREATE EXTENSION은 superuser 권한(PostgreSQL 13 이상은 데이터베이스의 CREATE 권한)이 필요하며,
+    이미 존재하는 확장은 생성하지 않습니다. 마이그레이션을 실행하는 사용자에게 권한이 없다면
+    DBA가 미리 CREATE EXTENSION pg_trgm을 실행합니다.
+    되돌릴 때는 다른 인덱스가 확장을 사용할 수 있으므로 삭제하지 않습니다.
+    """
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        pass
+
+
+def create_trigram_index(model_label, field_name, index_name):
+    """
+    migrations.RunPython(*create_trigram_index("example.Collection", "title", "..."))
+
+    PostgreSQL에서만 GIN 인덱스를 생성하며, 그 외의 데이터베이스에서는 아무것도 하지 않습니다.
+    pg_trgm 확장이 필요하므로 TrigramExtension 이후에 실행합니다.
+    쓰기를 막지 않도록 CONCURRENTLY로 생성하므로 마이그레이션의 atomic은 False여야 합니다.
+    """
+
+    def forwards(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        model = apps.get_model(model_label)
+        quote_name = schema_editor.quote_name
+        column = model._meta.get_field(field_name).column
+        valid = get_index_valid(schema_editor, index_name)
+        if valid:
+            return
+        if valid is not None:
+            # CONCURRENTLY 생성이 실패하면 사용되지 않는(INVALID) 인덱스가 남으므로 삭제 후 다시 생성한다.
+            schema_editor.execute(f"DROP INDEX CONCURRENTLY {quote_name(index_name)}")
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY {quote_name(index_name)} "
+            f"ON {quote_name(model._meta.db_table)} "
+            f"USING gin ({quote_name(column)} gin_trgm_ops)"
+        )
+
+    def backwards(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        schema_editor.execute(
+            f"DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(index_name)}"
+        )
+
+    return forwards, backwards
+
+
+def get_index_valid(schema_editor, index_name):
+    # 인덱스가 없다면 None, 있다면 pg_index.indisvalid
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)",
+            [schema_editor.quote_name(index_name)],
+        )
+        row = cursor.fetchone()
+    return None if row is None else row[0]
@@ -1,7 +1,24 @@
-from django.http import Http404
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from django.core import exceptions as django_exceptions
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connections, transaction
+from django.http import Http404, StreamingHttpResponse
+from django.utils.http import parse_etags
 from rest_framework import status
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.permissions import BasePermission
 from rest_framework.response import Response
 from rest_framework.request import clone_request
+from rest_framework.utils.encoders import JSONEncoder
+from .cache import (
+    get_model_versions,
+    get_object_version,
+    get_query_models,
+    get_response_cache,
+)
+from .exceptions import NotModified, PreconditionFailed
 
 
 # 부작용, 멱등성
@@ -28,14 +45,28 @@ from rest_framework.request import clone_request
 # Upsert, 기존 자원이 없을 때 생성까지 해주는 경우
 
 
+# 커스텀 메서드
+# =============================================================================
+#                   HTTP Mapping        HTTP request body       HTTP response body
+# BatchGet          GET + collection    X                       resource list
+# BatchCreate       POST + collection   resource data list      resource list
+# BatchUpdate       POST + collection   resource data list      resource list
+# BatchDelete       POST + collection   resource id list        X
+# Export            GET + collection    X                       resource stream
+
+
 # Mixins
 # =============================================================================
 # List = GET + collection
 class ListModelMixin:
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        serializer = self.get_serializer(page, many=True)
+        serializer = self.get_serializer(many=True)
+        # viewsets.FastReadGenericViewSetMixin
+        read_plan = getattr(self, "get_read_plan", lambda serializer: None)(serializer)
+        if read_plan is not None:
+            queryset = queryset.values_list(*read_plan.columns)
+        serializer.instance = self.paginate_queryset(queryset)
         return self.get_paginated_response(serializer.data)
 
     def paginate_queryset(self, queryset):
@@ -53,7 +84,106 @@ from rest_framework.mixins import CreateModelMixin
 
 
 # Retrieve = GET + resource
-from rest_framework.mixins import RetrieveModelMixin
+def has_object_permission(permission):
+    # permission class, 인스턴스 모두 BasePermission.has_object_permission(항상 True)을 재정의했는지 확인한다.
+    method = getattr(permission, "has_object_permission", None)
+    return (
+        getattr(method, "__func__", method) is not BasePermission.has_object_permission
+    )
+
+
+class RetrieveModelMixin:
+    """
+    Can Overwrite
+
+      - "retrieve_cache_timeout" : None, 지정되면 직렬화된 응답을 객체 단위로 캐시
+
+      - "retrieve_cache_per_user" : True, 캐시 키에 요청한 사용자를 포함 (get_queryset이 요청에 의존하지 않는다면 False)
+
+    캐시는 settings.DRF_CUSTOM_RESPONSE_CACHE에 (url, 응답 형식, 사용자) 단위로 저장되며,
+    객체의 version(cache.get_object_version)이 저장 시점과 다르면 사용하지 않습니다.
+    track_model_changes로 등록된 모델의 객체가 수정, 삭제되면 해당 객체의 캐시만 무효화됩니다.
+
+    캐시된 응답을 사용할 때는 get_object를 호출하지 않으므로 객체 단위 권한 검사(has_object_permission)를
+    수행할 수 없습니다. permission_classes에 객체 단위 권한이 있다면 as_view에서 AssertionError가 발생하며,
+    get_permissions가 요청마다 반환하는 권한에 객체 단위 권한이 있다면 캐시를 사용하지 않습니다.
+    다른 객체에 의존하는 필드가 있는 serializer에는 사용할 수 없습니다.
+    """
+
+    retrieve_cache_per_user = True
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        retrieve_cache_timeout = initkwargs.get(
+            "retrieve_cache_timeout", getattr(cls, "retrieve_cache_timeout", None)
+        )
+        permission_classes = initkwargs.get(
+            "permission_classes", cls.permission_classes
+        )
+        assert retrieve_cache_timeout is None or not any(
+            has_object_permission(permission) for permission in permission_classes
+        ), (
+            "retrieve_cache_timeout은 객체 단위 권한(has_object_permission)과 함께 사용할 수 없습니다. "
+            f"({cls.__name__})"
+        )
+        return super().as_view(actions, **initkwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        if getattr(self, "retrieve_cache_timeout", None) is None or any(
+            has_object_permission(permission) for permission in self.get_permissions()
+        ):
+            instance = self.get_object()
+            serializer = self.get_serializer(instance)
+            return Response(serializer.data)
+        return Response(self.get_cached_retrieve_data())
+
+    def get_cached_retrieve_data(self):
+        model = self.get_queryset().model
+        cache = get_response_cache()
+        key = self.get_retrieve_cache_key()
+        entry = cache.get(key)
+        # 캐시를 채울 때는 조회 이전의 version을 사용하여, 조회 도중 수정된 객체가 캐시되지 않도록 한다.
+        pk = self.get_retrieve_cache_pk(entry)
+        version = get_object_version(model, pk) if pk is not None else None
+        if entry is not None and entry["version"] == version:
+            self.record_retrieve_cache(hit=True)
+            return entry["data"]
+        self.record_retrieve_cache(hit=False)
+        instance = self.get_object()
+        data = self.get_serializer(instance).data
+        if version is None:
+            version = get_object_version(model, instance.pk)
+        cache.set(
+            key,
+            {"pk": instance.pk, "version": version, "data": data},
+            self.retrieve_cache_timeout,
+        )
+        return data
+
+    def get_retrieve_cache_key(self):
+        representation = (
+            f"{self.request.get_full_path()}:{self.request.accepted_media_type}"
+        )
+        if self.retrieve_cache_per_user:
+            representation += f":{self.request.user.pk}"
+        return f"drf_custom:retrieve:{hashlib.md5(representation.encode()).hexdigest()}"
+
+    def get_retrieve_cache_pk(self, entry):
+        model = self.get_queryset().model
+        if self.lookup_field in ("pk", model._meta.pk.name):
+            pk = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+            try:
+                model._meta.pk.to_python(pk)
+            except django_exceptions.ValidationError:
+                return None
+            return pk
+        # pk가 아닌 필드로 조회하는 경우 이전에 캐시된 객체의 pk를 사용한다.
+        return entry["pk"] if entry is not None else None
+
+    def record_retrieve_cache(self, hit):
+        metrics = getattr(self.request, "metrics", None)
+        if metrics is not None:
+            metrics.record_cache(hit)
 
 
 # Update = PUT + resource (required)
@@ -119,3 +249,496 @@ class PartialUpdateModelMixin:
 
 # Destroy = DELETE + resource
 from rest_framework.mixins import DestroyModelMixin
+
+
+# Custom Mixins
+# =============================================================================
+# BatchGet = GET + collection (custom method)
+class BatchGetModelMixin:
+    """
+    BatchGetFilterBackend와 함께 사용됩니다.
+
+    요청된 식별자들을 하나의 "__in" 쿼리로 조회하며, 결과는 요청된 순서(중복 제거)를 따릅니다.
+    가져올 수 없는 식별자의 자리는 null로 채워집니다.
+    count 쿼리와 페이지네이션을 수행하지 않습니다.
+    """
+
+    def batch_get(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        lookup_field = getattr(self, "batch_get_lookup_field", self.lookup_field)
+        serializer = self.get_serializer(many=True)
+        # viewsets.FastReadGenericViewSetMixin
+        read_plan = getattr(self, "get_read_plan", lambda serializer: None)(serializer)
+        if read_plan is not None:
+            # 행의 마지막 값은 식별자이다.
+            rows = queryset.values_list(*read_plan.columns, lookup_field)
+            instances = {row[-1]: row[:-1] for row in rows}
+        else:
+            instances = {
+                self.get_batch_get_key(instance, lookup_field): instance
+                for instance in queryset
+            }
+        serializer.instance = [
+            instances[value] for value in self.batch_get_values if value in instances
+        ]
+        data = iter(serializer.data)
+        results = [
+            next(data) if value in instances else None
+            for value in self.batch_get_values
+        ]
+        return Response({"results": results})
+
+    def get_batch_get_key(self, instance, lookup_field):
+        value = instance
+        for attr in lookup_field.split("__"):
+            value = getattr(value, attr)
+        return value
+
+
+# BatchCreate, BatchUpdate, BatchDelete = POST + collection (custom method)
+class BatchWriteMixin:
+    """
+    batch_create, batch_update, batch_delete의 공통 동작입니다.
+
+    요청 본문의 리소스 목록은 하나의 트랜잭션 안에서 처리됩니다.
+
+    Can Overwrite
+
+      - "batch_write_resources_param" : {"resources": [...]}
+
+      - "batch_write_values_param" : {"valueList": [...]}
+
+      - "batch_write_limit" : over, raise ValidationError
+    """
+
+    batch_write_resources_param = "resources"
+    batch_write_values_param = "valueList"
+    batch_write_limit = 1000
+
+    def get_batch_write_data(self, param):
+        data = (
+            self.request.data.get(param) if hasattr(self.request.data, "get") else None
+        )
+        if not isinstance(data, list) or not data:
+            raise ValidationError(detail={f"{param}": "required non-empty list."})
+        if len(data) > self.batch_write_limit:
+            raise ValidationError(
+                detail={
+                    f"{param}": f"Over batch write limit count. (input={len(data)}, allow={self.batch_write_limit})"
+                },
+            )
+        return data
+
+    def get_batch_lookup_model_field(self):
+        opts = self.get_queryset().model._meta
+        if self.lookup_field == "pk":
+            return opts.pk
+        return opts.get_field(self.lookup_field)
+
+    def get_batch_objects(self, values, param):
+        # 요청된 순서대로 instance 목록을 반환한다.
+        # 중복되거나 올바르지 않은 식별자, 존재하지 않는 리소스는 에러를 일으킨다.
+        field = self.get_batch_lookup_model_field()
+        try:
+            values = [field.to_python(value) for value in values]
+        except django_exceptions.ValidationError:
+            raise ValidationError(detail={f"{param}": "invalid value."})
+        if len(set(values)) != len(values):
+            raise ValidationError(detail={f"{param}": "duplicated value."})
+        queryset = self.filter_queryset(self.get_queryset())
+        instances = queryset.in_bulk(values, field_name=field.name)
+        not_found = [value for value in values if value not in instances]
+        if not_found:
+            raise NotFound(detail={f"{param}": not_found})
+        return [instances[value] for value in values]
+
+    def is_batch_validate_only(self, serializer):
+        # 대량의 리소스를 검사하는 validate_only 요청은 예외(PerformValidateOnly)를 거치지 않고 바로 204로 응답한다.
+        # (is_valid(raise_exception=False)는 저장 동작만 금지한다.)
+        if not serializer.is_valid():
+            raise ValidationError(serializer.errors)
+        return getattr(self, "validate_only", False)
+
+
+class BatchCreateModelMixin(BatchWriteMixin):
+    """
+    Required
+
+      - serializer의 Meta.list_serializer_class : drf_custom.serializers.BulkListSerializer
+    """
+
+    def batch_create(self, request, *args, **kwargs):
+        resources = self.get_batch_write_data(self.batch_write_resources_param)
+        serializer = self.get_serializer(data=resources, many=True)
+        if self.is_batch_validate_only(serializer):
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        with transaction.atomic():
+            self.perform_batch_create(serializer)
+        return Response({"results": serializer.data}, status=status.HTTP_201_CREATED)
+
+    def perform_batch_create(self, serializer):
+        serializer.save()
+
+
+class BatchUpdateModelMixin(BatchWriteMixin):
+    """
+    Required
+
+      - serializer의 Meta.list_serializer_class : drf_custom.serializers.BulkListSerializer
+
+    각 리소스는 식별자 필드(lookup_field)를 포함해야 하며, 부분 수정(partial)으로 처리됩니다.
+    """
+
+    def batch_update(self, request, *args, **kwargs):
+        param = self.batch_write_resources_param
+        resources = self.get_batch_write_data(param)
+        field = self.get_batch_lookup_model_field()
+        if not all(isinstance(resource, dict) for resource in resources):
+            raise ValidationError(detail={f"{param}": "required list of objects."})
+        values = [resource.get(field.name) for resource in resources]
+        instances = self.get_batch_objects(values, param)
+        serializer = self.get_serializer(
+            instances, data=resources, many=True, partial=True
+        )
+        if self.is_batch_validate_only(serializer):
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        with transaction.atomic():
+            self.perform_batch_update(serializer)
+        return Response({"results": serializer.data})
+
+    def perform_batch_update(self, serializer):
+        serializer.save()
+
+
+class BatchDeleteModelMixin(BatchWriteMixin):
+    """
+    요청 본문의 식별자 목록에 해당하는 리소스를 하나의 쿼리로 제거합니다.
+
+    validate_only가 활성화된 경우 리소스의 존재 여부만 확인합니다.
+    """
+
+    def batch_delete(self, request, *args, **kwargs):
+        param = self.batch_write_values_param
+        values = self.get_batch_write_data(param)
+        instances = self.get_batch_objects(values, param)
+        if getattr(self, "validate_only", False):
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        with transaction.atomic():
+            self.perform_batch_delete(instances)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def perform_batch_delete(self, instances):
+        self.get_queryset().model.objects.filter(
+            pk__in=[instance.pk for instance in instances]
+        ).delete()
+
+
+# Export = GET + collection (custom method)
+class ThreadIterator:
+    """
+    iterator를 하나의 전용 스레드에서 순회하는 sync iterator입니다.
+
+    Django 3.2의 ASGIHandler는 StreamingHttpResponse를 event loop에서 순회하므로
+    쿼리를 실행하는 iterator는 SynchronousOnlyOperation이 발생합니다.
+    server-side cursor가 하나의 연결을 사용하도록 모든 next()는 같은 스레드에서 실행되며,
+    응답이 닫히면(close) 해당 스레드의 데이터베이스 연결도 닫습니다.
+    """
+
+    def __init__(self, iterator):
+        self.iterator = iterator
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.executor is None:
+            raise StopIteration
+        # next()가 발생시킨 StopIteration은 Future를 거치지 않도록 값으로 반환한다.
+        item = self.executor.submit(next, self.iterator, StopIteration).result()
+        if item is StopIteration:
+            raise StopIteration
+        return item
+
+    def close(self):
+        if self.executor is None:
+            return
+        self.executor.submit(self.close_iterator).result()
+        self.executor.shutdown()
+        self.executor = None
+
+    def close_iterator(self):
+        try:
+            if hasattr(self.iterator, "close"):
+                self.iterator.close()
+        finally:
+            connections.close_all()
+
+
+class ExportModelMixin:
+    """
+    필터링된 전체 리소스를 페이지네이션 없이 스트리밍합니다.
+
+    server-side cursor(QuerySet.iterator)로 export_chunk_size만큼 행을 읽어 직렬화하므로
+    결과의 크기와 관계없이 메모리 사용량이 일정합니다.
+    ASGI에서는 본문을 ThreadIterator로 생성합니다.
+
+    Can Overwrite
+
+      - "export_chunk_size" : 1000
+
+      - "export_format_param" : ?exportFormat=ndjson (ndjson, json)
+    """
+
+    export_chunk_size = 1000
+    export_format_param = "exportFormat"
+    export_content_types = {
+        "ndjson": "application/x-ndjson",
+        "json": "application/json",
+    }
+
+    def export(self, request, *args, **kwargs):
+        export_format = request.query_params.get(self.export_format_param, "ndjson")
+        if export_format not in self.export_content_types:
+            raise ValidationError(
+                detail={
+                    f"{self.export_format_param}": f"지원하지 않는 형식입니다. (allow={list(self.export_content_types)})"
+                },
+            )
+        queryset = self.filter_queryset(self.get_queryset())
+        chunks = self.get_export_chunks(queryset)
+        if export_format == "ndjson":
+            content = self.stream_ndjson(chunks)
+        else:
+            content = self.stream_json(chunks)
+        if isinstance(request._request, ASGIRequest):
+            content = ThreadIterator(content)
+        return StreamingHttpResponse(
+            content, content_type=self.export_content_types[export_format]
+        )
+
+    def get_export_chunks(self, queryset):
+        chunk = []
+        for instance in queryset.iterator(chunk_size=self.export_chunk_size):
+            chunk.append(instance)
+            if len(chunk) >= self.export_chunk_size:
+                yield self.get_serializer(chunk, many=True).data
+                chunk = []
+        if chunk:
+            yield self.get_serializer(chunk, many=True).data
+
+    def encode_export_row(self, row):
+        return json.dumps(row, cls=JSONEncoder, ensure_ascii=False).encode("utf-8")
+
+    def stream_ndjson(self, chunks):
+        for rows in chunks:
+            yield b"".join(self.encode_export_row(row) + b"\n" for row in rows)
+
+    def stream_json(self, chunks):
+        yield b"["
+        separator = b""
+        for rows in chunks:
+            yield separator + b",".join(self.encode_export_row(row) for row in rows)
+            separator = b","
+        yield b"]"
+
+
+# Conditional Request
+def etag_in_none_match(etag, if_none_match):
+    # If-None-Match는 weak 비교(W/ 접두사 무시)를 사용하며, "*"는 모든 ETag와 일치한다. (RFC 7232)
+    if "*" in if_none_match:
+        return True
+    return any(
+        (value[2:] if value.startswith("W/") else value) == etag
+        for value in if_none_match
+    )
+
+
+# =============================================================================
+# ETag = If-None-Match(304), If-Match(412)
+class ConditionalRequestMixin:
+    """
+    응답 본문을 직렬화하지 않고 계산할 수 있는 버전 값으로 ETag를 생성합니다.
+
+    - etag_actions의 GET 요청은 If-None-Match가 일치하면 본문 없이 304로 응답합니다.
+    - etag_precondition_actions의 요청은 If-Match가 일치하지 않으면 412로 응답합니다. (낙관적 동시성 제어)
+
+    버전 값은 다음 순서로 결정됩니다.
+
+    1. etag_field가 지정된 상세 요청 = 객체의 버전 필드 값 (version, updated_at 등)
+    2. pk로 조회하는 상세 요청 = 객체 단위 변경 카운터 (cache.get_object_version)
+    3. 그 외 = 테이블 단위 변경 카운터 (cache.get_model_version)
+
+    변경 카운터는 track_model_changes로 등록된 모델에서만 증가합니다.
+    ETag는 "{버전}-{표현}" 형식이며, If-Match는 버전 부분만 비교하므로
+    read_mask 등 다른 표현으로 조회한 ETag도 사용할 수 있습니다.
+    If-Match 검사와 수정은 하나의 연산이 아니므로 동시에 도착한 요청을 모두 막지는 못합니다.
+
+    Can Overwrite
+
+      - "etag_actions" : [], ETag와 If-None-Match를 적용할 action
+
+      - "etag_precondition_actions" : [], If-Match를 적용할 action
+
+      - "etag_field" : None, 객체의 버전 필드
+
+      - "etag_models" : None, 응답에 포함되는 다른 모델, default = queryset의 모델
+    """
+
+    etag_actions = []
+    etag_precondition_actions = []
+    etag_field = None
+    etag_models = None
+
+    _etag_safe_methods = frozenset(("GET", "HEAD"))
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.etag = None
+        if (
+            self.action in self.etag_actions
+            and request.method in self._etag_safe_methods
+        ):
+            self.etag = self.get_etag()
+            if self.etag is not None and self.etag_none_match_failed(self.etag):
+                raise NotModified(etag=self.etag)
+        elif self.action in self.etag_precondition_actions:
+            if_match = self.get_request_etags("If-Match")
+            if if_match and "*" not in if_match:
+                version = self.get_etag_version()
+                if version is not None and version not in {
+                    etag.strip('"').split("-")[0]
+                    for etag in if_match
+                    if not etag.startswith("W/")
+                }:
+                    raise PreconditionFailed()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=exc.status_code, headers={"ETag": exc.etag})
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            if self.action in self.etag_precondition_actions:
+                # 수정된 이후의 버전을 전달한다.
+                self.etag = self.get_etag()
+            if getattr(self, "etag", None) is not None:
+                response["ETag"] = self.etag
+        return response
+
+    def get_object(self):
+        # etag_field의 값을 읽기 위해 조회한 객체를 action에서 다시 조회하지 않는다.
+        if "_etag_object" not in self.__dict__:
+            self._etag_object = super().get_object()
+        return self._etag_object
+
+    def get_request_etags(self, header):
+        # parse_etags는 weak 여부를 나타내는 W/ 접두사를 유지한다.
+        return parse_etags(self.request.headers.get(header, ""))
+
+    def etag_none_match_failed(self, etag):
+        if_none_match = self.get_request_etags("If-None-Match")
+        if "*" in if_none_match and self.detail:
+            # "*"는 리소스가 존재할 때만 일치하며, 존재하지 않는다면 404로 응답한다.
+            self.get_object()
+        return etag_in_none_match(etag, if_none_match)
+
+    def get_etag(self):
+        version = self.get_etag_version()
+        if version is None:
+            return None
+        representation = (
+            f"{self.request.get_full_path()}:{self.request.accepted_media_type}"
+        )
+        return f'"{version}-{hashlib.md5(representation.encode()).hexdigest()[:8]}"'
+
+    def get_etag_version(self):
+        values = []
+        if self.detail:
+            model = self.get_queryset().model
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            if self.etag_field is not None:
+                values.append(getattr(self.get_object(), self.etag_field))
+            elif self.lookup_field in ("pk", model._meta.pk.name):
+                try:
+                    values.append(
+                        get_object_version(model, self.kwargs[lookup_url_kwarg])
+                    )
+                except django_exceptions.ValidationError:
+                    # 올바르지 않은 식별자는 action에서 404로 응답한다.
+                    return None
+        if values:
+            models = self.etag_models or []
+        else:
+            models = self.etag_models or get_query_models(self.get_queryset().query)
+        versions = get_model_versions(models)
+        values.extend(
+            f"{model._meta.label_lower}={versions[model]}"
+            for model in sorted(versions, key=lambda model: model._meta.label)
+        )
+        return hashlib.md5(":".join(map(str, values)).encode()).hexdigest()[:16]
+
+
+# Async Mixins
+# =============================================================================
+# viewsets.AsyncGenericViewSet과 함께 사용되는 async action입니다.
+#
+# Django 3.2에는 async ORM API가 없으므로 쿼리와 직렬화는 self.sync_to_async로 실행하며,
+# 스레드 전환을 줄이기 위해 연속된 sync 작업은 한 번의 sync_to_async로 묶습니다.
+# aperform_* hook은 기본적으로 perform_* hook을 호출하므로 기존의 perform_*를 그대로 재정의할 수 있고,
+# 외부 api 호출 등 다른 async 작업을 기다려야 할 때는 aperform_*를 재정의합니다.
+class AsyncListModelMixin(ListModelMixin):
+    async def list(self, request, *args, **kwargs):
+        return await self.sync_to_async(super().list)(request, *args, **kwargs)
+
+
+class AsyncCreateModelMixin(CreateModelMixin):
+    async def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        await self.sync_to_async(serializer.is_valid)(raise_exception=True)
+        await self.aperform_create(serializer)
+        data = await self.sync_to_async(lambda: serializer.data)()
+        headers = self.get_success_headers(data)
+        return Response(data, status=status.HTTP_201_CREATED, headers=headers)
+
+    async def aperform_create(self, serializer):
+        await self.sync_to_async(self.perform_create)(serializer)
+
+
+class AsyncRetrieveModelMixin(RetrieveModelMixin):
+    async def retrieve(self, request, *args, **kwargs):
+        return await self.sync_to_async(super().retrieve)(request, *args, **kwargs)
+
+
+class AsyncPartialUpdateModelMixin(PartialUpdateModelMixin):
+    async def partial_update(self, request, *args, **kwargs):
+        def validate():
+            instance = self.get_object()
+            serializer = self.get_serializer(instance, data=request.data, partial=True)
+            serializer.is_valid(raise_exception=True)
+            return serializer
+
+        def get_data(serializer):
+            instance = serializer.instance
+            if getattr(instance, "_prefetched_objects_cache", None):
+                instance._prefetched_objects_cache = {}
+            return serializer.data
+
+        serializer = await self.sync_to_async(validate)()
+        await self.aperform_partial_update(serializer)
+        return Response(await self.sync_to_async(get_data)(serializer))
+
+    async def aperform_partial_update(self, serializer):
+        await self.sync_to_async(self.perform_partial_update)(serializer)
+
+
+class AsyncDestroyModelMixin(DestroyModelMixin):
+    async def destroy(self, request, *args, **kwargs):
+        instance = await self.sync_to_async(self.get_object)()
+        await self.aperform_destroy(instance)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    async def aperform_destroy(self, instance):
+        await self.sync_to_async(self.perform_destroy)(instance)
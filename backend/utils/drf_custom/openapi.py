@@ -32,6 +32,13 @@ def get_pk_description(model, model_field):
 
 
 class CustomAutoSchema(AutoSchema):
+    def _get_paginator(self):
+        # view의 count_estimate_threshold에 따라 count_exact를 스키마에 포함한다. (pagination.CountPaginationMixin)
+        paginator = super()._get_paginator()
+        if paginator is not None:
+            paginator.view = self.view
+        return paginator
+
     def _get_filter_parameters(self):
         # filter_backends를 올바르게 불러오지 못하는 문제가 있어 수정
         # view.filter_backends가 프로퍼티이며 filter_backends 또는 None을 반환해야 한다.
@@ -50,7 +57,7 @@ class CustomAutoSchema(AutoSchema):
         return parameters
 
     def _get_parameters(self):
-        # _get_validate_only_parameters 과정을 추가하였다.
+        # _get_validate_only_parameters, _get_read_mask_parameters 과정을 추가하였다.
         def dict_helper(parameters):
             return {(p["name"], p["in"]): p for p in parameters}
 
@@ -66,6 +73,7 @@ class CustomAutoSchema(AutoSchema):
             **dict_helper(self._get_pagination_parameters()),
             **dict_helper(self._get_format_parameters()),
             **dict_helper(self._get_validate_only_parameters()),
+            **dict_helper(self._get_read_mask_parameters()),
         }
         for key, parameter in override_parameters.items():
             if parameter is None:
@@ -101,6 +109,29 @@ class CustomAutoSchema(AutoSchema):
             },
         ]
 
+    def _get_read_mask_parameters(self):
+        read_mask_actions = getattr(self.view, "read_mask_actions", None)
+        if read_mask_actions is None:
+            return []
+        if self.view.action not in read_mask_actions:
+            return []
+        description = "콤마(,)로 구분된 필드들만 응답에 포함합니다. 지정하지 않으면 모든 필드를 포함합니다."
+        serializer = self._get_serializer()
+        if hasattr(serializer, "fields"):
+            useable_values = ", ".join(f'"{field}"' for field in serializer.fields)
+            description = f"{description}\n\n사용 가능한 값들 = [{useable_values}]"
+        return [
+            {
+                "name": getattr(self.view, "read_mask_param", "read_mask"),
+                "required": False,
+                "in": "query",
+                "description": description,
+                "schema": {
+                    "type": "string",
+                },
+            },
+        ]
+
     def _resolve_path_parameters(self, variables):
         parameters = []
         for variable in variables:
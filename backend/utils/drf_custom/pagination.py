@@ -1,12 +1,167 @@
+import hashlib
+import json
+from collections import OrderedDict
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
 from rest_framework import pagination as rest_pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from .cache import get_cache, get_model_versions, get_query_models
 
 
-class PageNumberPaginationMixin:
+# Count
+# =============================================================================
+def estimate_count(queryset):
+    """
+    postgres 플래너의 추정치를 활용하여 queryset의 행 개수를 반환합니다.
+
+    필터가 없다면 pg_class.reltuples를, 있다면 EXPLAIN의 Plan Rows를 활용합니다.
+    추정할 수 없는 데이터베이스라면 None을 반환합니다.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    query = queryset.order_by().query
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            # 한번도 ANALYZE되지 않은 테이블의 reltuples는 -1(또는 0)이다.
+            if row is not None and row[0] > 0:
+                return row[0]
+        sql, params = query.get_compiler(using=queryset.db).as_sql()
+        cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_cached_count(queryset, timeout):
+    """
+    필터링된 queryset의 정확한 행 개수를 캐시하여 반환합니다.
+
+    캐시 키는 쿼리(sql, params)와 쿼리에 사용된 모든 모델의 version으로 구성되므로
+    해당 모델들에 쓰기가 발생하면 자연스럽게 무효화됩니다.
+    """
+    query = queryset.order_by().query
+    sql, params = query.get_compiler(using=queryset.db).as_sql()
+    fingerprint = hashlib.md5(f"{queryset.db}:{sql}:{params!r}".encode()).hexdigest()
+    versions = get_model_versions(get_query_models(query))
+    version = ".".join(
+        str(versions[model])
+        for model in sorted(versions, key=lambda model: model._meta.label)
+    )
+    key = f"drf_custom:count:{fingerprint}:{version}"
+    cache = get_cache()
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout)
+    return count
+
+
+class Paginator(DjangoPaginator):
+    # count 계산을 pagination class의 get_count에 위임한다.
+    def __init__(self, object_list, per_page, get_count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.get_count = get_count
+
+    @cached_property
+    def count(self):
+        if self.get_count is None:
+            return super().count
+        return self.get_count(self.object_list)
+
+
+class CountPaginationMixin:
+    """
+    응답의 count를 계산하는 방식을 결정합니다.
+
+    Can Overwrite (view에서 지정할 수 있습니다.)
+
+      - "count_estimate_threshold" : None, 추정치가 해당 값 이상일 경우 추정치를 사용합니다.
+
+      - "count_cache_timeout" : None, 정확한 count를 해당 초 동안 캐시합니다.
+
+    count_estimate_threshold가 지정되면 응답에 count_exact(추정치 여부)가 포함됩니다.
+    """
+
+    count_estimate_threshold = None
+    count_cache_timeout = None
+
+    view = None
+    count_exact = True
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_count_option(self, name):
+        return getattr(self.view, name, getattr(self, name))
+
+    def get_count(self, queryset):
+        self.count_exact = True
+        threshold = self.get_count_option("count_estimate_threshold")
+        if threshold is not None:
+            estimated_count = estimate_count(queryset)
+            if estimated_count is not None and estimated_count >= threshold:
+                self.count_exact = False
+                return estimated_count
+        timeout = self.get_count_option("count_cache_timeout")
+        if timeout:
+            return get_cached_count(queryset, timeout)
+        return queryset.count()
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data = self.add_count_exact(response.data)
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        return self.add_count_exact_schema(response_schema)
+
+    def add_count_exact(self, response_data):
+        if self.get_count_option("count_estimate_threshold") is None:
+            return response_data
+        items = list(response_data.items())
+        items.insert(1, ("count_exact", self.count_exact))
+        return OrderedDict(items)
+
+    def add_count_exact_schema(self, response_schema):
+        # 스키마를 생성할 때의 view는 utils.drf_custom.openapi.CustomAutoSchema가 지정한다.
+        if self.get_count_option("count_estimate_threshold") is None:
+            return response_schema
+        properties = list(response_schema["properties"].items())
+        count_exact_schema = {
+            "type": "boolean",
+            "description": "count가 정확한 값(true)인지 추정치(false)인지 나타냅니다.",
+        }
+        properties.insert(1, ("count_exact", count_exact_schema))
+        response_schema["properties"] = OrderedDict(properties)
+        return response_schema
+
+
+# PageNumberPagination
+# =============================================================================
+class PageNumberPaginationMixin(CountPaginationMixin):
     page_query_param = "page"
     page_size_query_param = "pageSize"
 
     page_query_description = "조회하려는 페이지 번호입니다."
 
+    def django_paginator_class(self, object_list, per_page):
+        return Paginator(object_list, per_page, get_count=self.get_count)
+
 
 class SmallPageNumberPagination(
     PageNumberPaginationMixin, rest_pagination.PageNumberPagination
@@ -33,3 +188,253 @@ class LargePageNumberPagination(
     max_page_size = 1000
 
     page_size_query_description = "페이지 크기를 조절합니다. (default=100, max=1000)"
+
+
+# CursorPagination
+# =============================================================================
+class CursorPaginationMixin(CountPaginationMixin):
+    """
+    keyset(seek) 방식의 페이지네이션입니다.
+
+    OFFSET을 사용하지 않고 마지막으로 조회한 행의 정렬 값을 기준으로 다음 페이지를 조회하므로
+    페이지가 깊어지더라도 조회 비용이 일정하게 유지됩니다.
+    전체 개수(count)는 첫 페이지(pageToken이 없는 요청)에서만 계산하여 응답에 포함합니다.
+
+    정렬 기준은 queryset에 적용된 order_by(OrderingFilterBackend 적용 결과) 또는
+    모델의 Meta.ordering을 따르며, 순서를 결정짓기 위해 tiebreaker_field가 자동으로 추가됩니다.
+    NULL은 keyset 조건으로 비교할 수 없으므로 NULL이 될 수 있는 필드(null=True, 역방향 관계 등)로는 정렬할 수 없습니다.
+
+    Can Overwrite
+
+      - "tiebreaker_field" : "id" (unique, index가 존재하는 필드)
+    """
+
+    cursor_query_param = "pageToken"
+    page_size_query_param = "pageSize"
+    tiebreaker_field = "id"
+
+    cursor_query_description = "조회하려는 페이지의 토큰입니다. 응답의 next, previous에 포함되어 있습니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.view = view
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            reverse, position = False, None
+        else:
+            reverse, position = self.cursor.reverse, self.cursor.position
+            position = self.decode_position(position, queryset.model)
+
+        # 이후의 페이지에서는 COUNT를 실행하지 않는다.
+        self.count = self.get_count(queryset) if self.cursor is None else None
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [self.flip_direction(field) for field in ordering]
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(ordering, position))
+
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        has_following_position = len(results) > len(self.page)
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = position is not None
+            self.has_previous = has_following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = position is not None
+
+        if (self.has_next or self.has_previous) and self.template is not None:
+            self.display_page_controls = True
+
+        self.request = request
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        ordering = list(queryset.query.order_by)
+        if not ordering and queryset.query.default_ordering:
+            ordering = list(queryset.model._meta.ordering)
+        assert all(isinstance(field, str) for field in ordering), (
+            "CursorPagination은 문자열 형식의 ordering만을 지원합니다. " f"(ordering={ordering})"
+        )
+        for field in ordering:
+            assert not self.is_nullable_field(queryset.model, field.lstrip("-")), (
+                "CursorPagination은 NULL이 될 수 있는 필드로 정렬할 수 없습니다. " f"(ordering={field})"
+            )
+        tiebreaker_names = {
+            self.tiebreaker_field,
+            "pk",
+            queryset.model._meta.pk.name,
+        }
+        if not any(field.lstrip("-") in tiebreaker_names for field in ordering):
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append(("-" if descending else "") + self.tiebreaker_field)
+        return ordering
+
+    def get_keyset_filter(self, ordering, position):
+        # (a, b, c) > (x, y, z)
+        # = (a > x) | (a = x & b > y) | (a = x & b = y & c > z)
+        keyset_filter = Q()
+        equal_filter = Q()
+        for field, value in zip(ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            keyset_filter |= equal_filter & Q(**{f"{name}__{lookup}": value})
+            equal_filter &= Q(**{name: value})
+        return keyset_filter
+
+    def flip_direction(self, field):
+        return field[1:] if field.startswith("-") else "-" + field
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        position = self._get_position_from_instance(self.page[-1], self.ordering)
+        cursor = Cursor(offset=0, reverse=False, position=position)
+        return self.encode_cursor(cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        position = self._get_position_from_instance(self.page[0], self.ordering)
+        cursor = Cursor(offset=0, reverse=True, position=position)
+        return self.encode_cursor(cursor)
+
+    def _get_position_from_instance(self, instance, ordering):
+        position = []
+        for field in ordering:
+            value = instance
+            for attr in field.lstrip("-").split("__"):
+                value = value[attr] if isinstance(value, dict) else getattr(value, attr)
+            position.append(value)
+        return json.dumps(position, cls=JSONEncoder)
+
+    def decode_position(self, position, model):
+        if position is None:
+            return None
+        try:
+            position = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        # cursor는 클라이언트가 조작할 수 있으므로 정렬 필드의 형식으로 변환한다.
+        try:
+            return [
+                self.to_position_value(model, field.lstrip("-"), value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def to_position_value(self, model, name, value):
+        if value is None or isinstance(value, (dict, list)):
+            raise ValueError(value)
+        try:
+            field = self.get_position_field(model, name)
+        except FieldDoesNotExist:
+            # annotate된 값 등 모델의 필드가 아닌 경우
+            return value
+        value = field.to_python(value)
+        if value is None:
+            raise ValueError(value)
+        return value
+
+    def get_position_field(self, model, name):
+        field = None
+        for attr in name.split("__"):
+            if field is not None:
+                if field.related_model is None:
+                    raise FieldDoesNotExist(name)
+                model = field.related_model
+            opts = model._meta
+            field = opts.pk if attr == "pk" else opts.get_field(attr)
+        return field
+
+    def is_nullable_field(self, model, name):
+        # 관계를 따라가는 중에 NULL이 될 수 있는 필드가 있다면 값도 NULL이 될 수 있다.
+        try:
+            field = None
+            for attr in name.split("__"):
+                if field is not None:
+                    if field.related_model is None:
+                        return False
+                    model = field.related_model
+                opts = model._meta
+                field = opts.pk if attr == "pk" else opts.get_field(attr)
+                if field.null:
+                    return True
+        except FieldDoesNotExist:
+            # annotate된 값 등 모델의 필드가 아닌 경우
+            return False
+        return False
+
+    def get_paginated_response(self, data):
+        response_data = OrderedDict()
+        if self.count is not None:
+            response_data["count"] = self.count
+        response_data["next"] = self.get_next_link()
+        response_data["previous"] = self.get_previous_link()
+        response_data["results"] = data
+        if self.count is None:
+            return Response(response_data)
+        return Response(self.add_count_exact(response_data))
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = {
+            "type": "object",
+            "properties": {
+                "count": {
+                    "type": "integer",
+                    "example": 123,
+                    "description": "첫 페이지(pageToken이 없는 요청)의 응답에만 포함됩니다.",
+                },
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                },
+                "previous": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                },
+                "results": schema,
+            },
+        }
+        return self.add_count_exact_schema(response_schema)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        for parameter in parameters:
+            if parameter["name"] == self.cursor_query_param:
+                parameter["schema"] = {"type": "string"}
+        return parameters
+
+
+class SmallCursorPagination(CursorPaginationMixin, rest_pagination.CursorPagination):
+    page_size = 10
+    max_page_size = 100
+
+    page_size_query_description = "페이지 크기를 조절합니다. (default=10, max=100)"
+
+
+class MiddleCursorPagination(CursorPaginationMixin, rest_pagination.CursorPagination):
+    page_size = 50
+    max_page_size = 500
+
+    page_size_query_description = "페이지 크기를 조절합니다. (default=50, max=500)"
+
+
+class LargeCursorPagination(CursorPaginationMixin, rest_pagination.CursorPagination):
+    page_size = 100
+    max_page_size = 1000
+
+    page_size_query_description = "페이지 크기를 조절합니다. (default=100, max=1000)"
@@ -0,0 +1,33 @@
+import codecs
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.utils import json
+from rest_framework.exceptions import ParseError
+from .renderers import JSONRenderer, orjson
+
+
+class JSONParser(parsers.JSONParser):
+    """
+    orjson이 설치되어 있다면 요청 본문(bytes)을 디코딩 없이 바로 파싱하는 JSONParser입니다.
+
+    orjson이 파싱하지 못한 본문(64bit를 넘는 정수, 잘못된 JSON 등)은 DRF의 JSONParser와 같이
+    표준 라이브러리 json으로 다시 파싱하므로, 결과와 오류 메시지가 기존과 동일합니다.
+    UTF-8 이외의 인코딩, STRICT_JSON=False(NaN 허용)에서는 DRF의 JSONParser로 동작합니다.
+    """
+
+    renderer_class = JSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+        content = stream.read()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+        try:
+            return json.loads(content.decode(encoding))
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
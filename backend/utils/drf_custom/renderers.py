@@ -0,0 +1,99 @@
+import decimal
+import math
+from rest_framework import renderers
+from rest_framework.utils import json
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # 표준 라이브러리 json으로 동작합니다.
+    orjson = None
+
+
+# JSON
+# =============================================================================
+# orjson이 설치되어 있다면 str을 거치지 않고 bytes로 바로 직렬화합니다.
+# orjson이 지원하지 않는 값(Decimal, lazy str 등)은 DRF의 JSONEncoder.default로 변환하며,
+# orjson이 직렬화할 수 없는 값(64bit를 넘는 정수 등)이 포함되어 있다면 표준 라이브러리 json으로 다시 직렬화합니다.
+# orjson은 NaN, ±Infinity를 null로 직렬화하므로, 결과에 null이 있고 데이터에 유한하지 않은 값이 있다면
+# 표준 라이브러리 json으로 다시 직렬화합니다. (allow_nan=False이면 ValueError, True이면 NaN, Infinity)
+# str이 아닌 dict key는 orjson이 직렬화하지 않으므로 표준 라이브러리 json으로 다시 직렬화합니다.
+#
+# 결과는 DRF의 JSONRenderer와 같은 값으로 파싱되지만 바이트 단위로 항상 같지는 않습니다.
+# 지수 표기 float는 orjson 형식으로 직렬화됩니다. (1e16 -> 1e16, DRF는 1e+16)
+#
+# dumps({"title": "제목"})  # b'{"title":"제목"}'
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    ORJSON_ERRORS = (orjson.JSONEncodeError,)
+else:
+    ORJSON_OPTIONS = 0
+    ORJSON_ERRORS = ()
+
+# JavaScript 문자열에서 허용되지 않는 문자는 DRF의 JSONRenderer와 같이 escape한다.
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+def std_dumps(data, encoder_class=JSONEncoder, allow_nan=False):
+    return json.dumps(
+        data,
+        cls=encoder_class,
+        ensure_ascii=False,
+        allow_nan=allow_nan,
+        separators=(",", ":"),
+    ).encode()
+
+
+def has_non_finite(data):
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, decimal.Decimal):
+        return not data.is_finite()
+    if isinstance(data, dict):
+        return any(has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(has_non_finite(value) for value in data)
+    return False
+
+
+def dumps(data, encoder_class=JSONEncoder, allow_nan=False):
+    """
+    ensure_ascii=False, 공백이 없는 JSON bytes를 반환합니다.
+
+    지수 표기 float의 형식은 orjson을 사용하는지에 따라 다를 수 있습니다. (1e16, 1e+16)
+    """
+    if orjson is None:
+        content = std_dumps(data, encoder_class, allow_nan)
+    else:
+        try:
+            content = orjson.dumps(
+                data, default=encoder_class().default, option=ORJSON_OPTIONS
+            )
+        except ORJSON_ERRORS:
+            content = std_dumps(data, encoder_class, allow_nan)
+        else:
+            if b"null" in content and has_non_finite(data):
+                content = std_dumps(data, encoder_class, allow_nan)
+    if LINE_SEPARATOR in content or PARAGRAPH_SEPARATOR in content:
+        content = content.replace(LINE_SEPARATOR, b"\\u2028")
+        content = content.replace(PARAGRAPH_SEPARATOR, b"\\u2029")
+    return content
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    dumps로 직렬화하는 JSONRenderer입니다.
+
+    들여쓰기(?indent, BrowsableAPIRenderer), UNICODE_JSON=False, COMPACT_JSON=False 등
+    dumps와 형식이 다른 설정에서는 DRF의 JSONRenderer로 동작합니다.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data, self.encoder_class, allow_nan=not self.strict)
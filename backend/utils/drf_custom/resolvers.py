@@ -0,0 +1,204 @@
+import re
+from django.urls.resolvers import (
+    RegexPattern,
+    ResolverMatch,
+    URLPattern,
+    URLResolver,
+)
+from django.urls.exceptions import Resolver404
+
+
+# Compiled URL Resolver
+# =============================================================================
+# Django의 URLResolver는 요청마다 url pattern의 정규식을 순서대로 하나씩 검사하므로
+# 등록된 리소스와 커스텀 메서드가 늘어날수록 resolve 비용이 선형으로 증가합니다.
+#
+# CompiledURLResolver는 router가 생성한 정규식 pattern들을 path의 첫 토큰("/" 또는 ":" 이전의 문자열)
+# 단위로 나누고, 각 토큰에 해당하는 pattern들을 등록 순서대로 하나의 정규식(alternation)으로 합칩니다.
+# 요청의 path는 첫 토큰으로 정규식 하나를 찾아 한 번만 검사하며, 결과는 Django의 URLResolver와 동일합니다.
+#
+# urlpatterns = compile_urlpatterns([*router.urls, *nested_router.urls])
+TOKEN_SEPARATORS = "/:"
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]|()")
+QUANTIFIERS = frozenset("*+?{")
+NAMED_GROUP_REGEX = re.compile(r"\(\?P(<|=)(\w+)")
+
+
+def get_path_token(path):
+    # "collections/1:move" -> "collections"
+    for index, char in enumerate(path):
+        if char in TOKEN_SEPARATORS:
+            return path[:index]
+    return path
+
+
+def get_literal_prefix(regex):
+    # 정규식의 시작 부분에서 항상 그대로 일치해야 하는 문자열과 나머지 정규식을 반환한다.
+    # "^collections/?$" -> ("collections", "/?$")
+    literal = []
+    index = 1
+    while index < len(regex):
+        char = regex[index]
+        if char == "\\":
+            escaped = regex[index + 1 : index + 2]
+            if not escaped or escaped.isalnum():
+                break
+            literal.append(escaped)
+            index += 2
+            continue
+        if char in REGEX_METACHARACTERS:
+            break
+        literal.append(char)
+        index += 1
+    if index < len(regex) and regex[index] in QUANTIFIERS and literal:
+        # 수량자는 바로 앞의 문자에 적용된다.
+        literal.pop()
+        index -= 2 if regex[index - 2 : index - 1] == "\\" else 1
+    return "".join(literal), regex[index:]
+
+
+def get_pattern_token(regex):
+    # pattern과 일치하는 모든 path의 첫 토큰을 반환한다. 알 수 없다면 None을 반환한다.
+    literal, rest = get_literal_prefix(regex)
+    token = get_path_token(literal)
+    if token != literal:
+        return token
+    if rest in ("$", r"\Z", "/?$", r"/?\Z"):
+        return token
+    if rest[:1] and rest[:1] in TOKEN_SEPARATORS and rest[1:2] not in QUANTIFIERS:
+        return token
+    return None
+
+
+def is_compilable(url_pattern):
+    if not isinstance(url_pattern, URLPattern):
+        return False
+    if not isinstance(url_pattern.pattern, RegexPattern):
+        return False
+    regex = str(url_pattern.pattern)
+    if not regex.startswith("^"):
+        return False
+    compiled = url_pattern.pattern.regex
+    # 이름이 없는 group(위치 인자)과 inline flag는 하나의 정규식으로 합칠 수 없다.
+    return compiled.groups == len(compiled.groupindex) and compiled.flags == re.UNICODE
+
+
+class CompiledPatterns:
+    """
+    연속된 정규식 URLPattern들을 첫 토큰 단위의 정규식으로 합친 결과입니다.
+    """
+
+    def __init__(self, url_patterns):
+        self.url_patterns = url_patterns
+        # 합쳐진 정규식의 group 이름과 kwargs 이름
+        self.kwarg_groups = [
+            [
+                (f"_{index}_{name}", name)
+                for name in url_pattern.pattern.regex.groupindex
+            ]
+            for index, url_pattern in enumerate(url_patterns)
+        ]
+        tokens = {}
+        wildcard = []
+        for index, url_pattern in enumerate(url_patterns):
+            token = get_pattern_token(str(url_pattern.pattern))
+            if token is None:
+                wildcard.append(index)
+            else:
+                tokens.setdefault(token, []).append(index)
+        # 첫 토큰을 알 수 없는 pattern은 모든 토큰의 정규식에 등록 순서대로 포함된다.
+        self.regexes = {
+            token: self.compile(sorted(indexes + wildcard))
+            for token, indexes in tokens.items()
+        }
+        self.default_regex = self.compile(wildcard)
+
+    def compile(self, indexes):
+        if not indexes:
+            return None
+        alternatives = []
+        for index in indexes:
+            regex = str(self.url_patterns[index].pattern)[1:]
+            # group 이름이 pattern 간에 중복되지 않도록 pattern의 index를 붙인다.
+            regex = NAMED_GROUP_REGEX.sub(rf"(?P\1_{index}_\2", regex)
+            alternatives.append(f"(?P<_{index}>{regex})")
+        return re.compile("|".join(alternatives))
+
+    def resolve(self, path):
+        regex = self.regexes.get(get_path_token(path), self.default_regex)
+        if regex is None:
+            return None
+        match = regex.match(path)
+        if match is None:
+            return None
+        index = int(match.lastgroup[1:])
+        url_pattern = self.url_patterns[index]
+        kwargs = {}
+        for group, name in self.kwarg_groups[index]:
+            value = match.group(group)
+            if value is not None:
+                kwargs[name] = value
+        kwargs.update(url_pattern.default_args)
+        return ResolverMatch(
+            url_pattern.callback,
+            (),
+            kwargs,
+            url_pattern.pattern.name,
+            route=str(url_pattern.pattern),
+        )
+
+
+class CompiledURLResolver(URLResolver):
+    """
+    url_patterns를 CompiledPatterns로 합쳐 resolve하는 URLResolver입니다.
+
+    reverse, drf-spectacular의 endpoint 탐색 등은 하위 pattern들을 그대로 사용하므로
+    prefix가 없는 include()와 동일하게 동작합니다.
+    하나의 정규식으로 합칠 수 없는 pattern(include, path() 등)은 등록된 위치에서 Django의 방식으로 resolve됩니다.
+    """
+
+    def __init__(self, url_patterns):
+        super().__init__(RegexPattern(r"^"), url_patterns)
+        self.resolvers = []
+        compilable = []
+        for url_pattern in url_patterns:
+            if is_compilable(url_pattern):
+                compilable.append(url_pattern)
+                continue
+            if compilable:
+                self.resolvers.append(CompiledPatterns(compilable))
+                compilable = []
+            self.resolvers.append(url_pattern)
+        if compilable:
+            self.resolvers.append(CompiledPatterns(compilable))
+
+    def resolve(self, path):
+        path = str(path)
+        for resolver in self.resolvers:
+            try:
+                sub_match = resolver.resolve(path)
+            except Resolver404:
+                continue
+            if sub_match:
+                if isinstance(resolver, URLResolver):
+                    return ResolverMatch(
+                        sub_match.func,
+                        sub_match.args,
+                        sub_match.kwargs,
+                        sub_match.url_name,
+                        sub_match.app_names,
+                        sub_match.namespaces,
+                        self._join_route(str(resolver.pattern), sub_match.route),
+                    )
+                return sub_match
+        # 404 응답(DEBUG)의 시도한 pattern 목록은 Django와 같은 형식으로 전달한다.
+        raise Resolver404(
+            {
+                "tried": [[url_pattern] for url_pattern in self.url_patterns],
+                "path": path,
+            }
+        )
+
+
+def compile_urlpatterns(urlpatterns):
+    return [CompiledURLResolver(urlpatterns)]
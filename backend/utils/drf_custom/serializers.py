@@ -1,5 +1,11 @@
+import threading
+from collections import namedtuple
+from contextlib import contextmanager, nullcontext
+from django.core.exceptions import FieldDoesNotExist
+from django.db import IntegrityError, connections, router, transaction
 from rest_framework import serializers as rest_serializers
 from rest_framework.fields import empty
+from .cache import model_changed, objects_changed
 from .exceptions import PerformValidateOnly, BlockedSideEffect
 
 
@@ -46,9 +52,321 @@ class ValidateOnlySerializerMixin:
         return super().update(instance, validated_data)
 
 
+# ValidateOnly Serializer Registry
+# =============================================================================
+# ValidateOnlySerializerMixin이 적용되지 않은 serializer class마다 ValidateOnly serializer class를 한 번만 생성합니다.
+# serializer class(이름이 아닌 class 자체)를 키로 사용하므로 다른 app의 같은 이름의 serializer와 충돌하지 않으며,
+# gevent, 스레드 워커에서 동시에 요청되더라도 lock으로 하나의 class만 생성됩니다.
+#
+# get_validate_only_serializer_class(CollectionSerializer)  # ValidateOnlyCollectionSerializer
+_validate_only_serializer_classes = {}
+_validate_only_serializer_classes_lock = threading.Lock()
+
+
+def get_validate_only_serializer_class(serializer_class):
+    if issubclass(serializer_class, ValidateOnlySerializerMixin):
+        return serializer_class
+    try:
+        return _validate_only_serializer_classes[serializer_class]
+    except KeyError:
+        pass
+    with _validate_only_serializer_classes_lock:
+        if serializer_class not in _validate_only_serializer_classes:
+            name = "ValidateOnly" + serializer_class.__name__
+            _validate_only_serializer_classes[serializer_class] = type(
+                name,
+                (ValidateOnlySerializerMixin, serializer_class),
+                {"__module__": serializer_class.__module__, "__qualname__": name},
+            )
+        return _validate_only_serializer_classes[serializer_class]
+
+
+class BulkListSerializerMixin:
+    """
+    many=True로 생성된 ListSerializer의 저장을 bulk_create, bulk_update로 수행합니다.
+
+    ModelSerializer의 Meta.list_serializer_class로 지정하여 사용합니다.
+    다대다 필드처럼 행 단위의 추가 쿼리가 필요한 필드는 지원하지 않습니다.
+
+    bulk_create, bulk_update는 signal을 발생시키지 않으므로 model_changed, objects_changed를 직접 호출합니다.
+    """
+
+    def to_internal_value(self, data):
+        # 수정의 경우 각 항목의 유효성 검사가 대응되는 instance를 기준으로 수행되도록 한다.
+        # (UniqueTogetherValidator 등은 child.instance를 참조한다.)
+        if self.instance is None or not isinstance(data, list):
+            return super().to_internal_value(data)
+        assert len(self.instance) == len(data), "instance와 data의 개수가 일치해야 합니다."
+        ret = []
+        errors = []
+        for instance, item in zip(self.instance, data):
+            self.child.instance = instance
+            try:
+                validated = self.child.run_validation(item)
+            except rest_serializers.ValidationError as exc:
+                errors.append(exc.detail)
+            else:
+                ret.append(validated)
+                errors.append({})
+        self.child.instance = None
+        if any(errors):
+            raise rest_serializers.ValidationError(errors)
+        return ret
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        instances = [model(**attrs) for attrs in validated_data]
+        connection = connections[router.db_for_write(model)]
+        if not connection.features.can_return_rows_from_bulk_insert:
+            # pk를 돌려받을 수 없는 데이터베이스에서는 행 단위로 저장한다.
+            for instance in instances:
+                instance.save(force_insert=True)
+            return instances
+        model.objects.bulk_create(instances)
+        model_changed(model)
+        objects_changed(model, [instance.pk for instance in instances])
+        return instances
+
+    def update(self, instances, validated_data):
+        model = self.child.Meta.model
+        fields = set()
+        for instance, attrs in zip(instances, validated_data):
+            for attr, value in attrs.items():
+                setattr(instance, attr, value)
+            fields.update(attrs)
+        if fields:
+            model.objects.bulk_update(instances, fields)
+            model_changed(model)
+            objects_changed(model, [instance.pk for instance in instances])
+        return instances
+
+
+# Unique Conflict
+# =============================================================================
+# 데이터베이스의 unique 제약조건 위반(IntegrityError)을 필드의 ValidationError로 변환합니다.
+#
+# 저장하기 전에 exists() 쿼리로 중복을 확인하지 않으므로 생성, 수정이 한 번의 쿼리로 수행되며,
+# 같은 값이 동시에 저장되는 경우에도 하나만 저장되고 나머지 요청은 400으로 응답합니다.
+# validate_only 요청은 저장하지 않으므로 validate에서 exists() 쿼리로 확인합니다.
+# (serializer의 docstring은 drf-spectacular에서 스키마의 description으로 사용되므로 mixin에 docstring을 작성하지 않습니다.)
+#
+# Required
+#
+#   - "unique_conflict_errors" : {("parent", "title"): {"title": "이미 존재하는 title입니다."}}
+#
+# Can Overwrite
+#
+#   - "get_unique_conflict_values(attrs)" : 중복을 확인할 필드의 값, default: instance의 값 + attrs
+class UniqueConflictSerializerMixin:
+    unique_conflict_errors = {}
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        if getattr(self, "_validate_only", False):
+            self.check_unique_conflict(self.get_unique_conflict_values(attrs))
+        return attrs
+
+    def create(self, validated_data):
+        with self.handle_unique_conflict(validated_data):
+            return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        with self.handle_unique_conflict(validated_data):
+            return super().update(instance, validated_data)
+
+    @contextmanager
+    def handle_unique_conflict(self, validated_data):
+        using = router.db_for_write(self.Meta.model)
+        # 트랜잭션 안에서는 IntegrityError 이후에도 트랜잭션을 사용할 수 있도록 savepoint로 감싼다.
+        # (autocommit에서는 실패한 쿼리만 취소되므로 추가 쿼리가 없다.)
+        if connections[using].in_atomic_block:
+            atomic = transaction.atomic(using=using)
+        else:
+            atomic = nullcontext()
+        try:
+            with atomic:
+                yield
+        except IntegrityError:
+            # 어떤 제약조건이 위반되었는지는 데이터베이스마다 오류 메시지가 다르므로 실패한 경우에만 조회하여 확인한다.
+            self.check_unique_conflict(self.get_unique_conflict_values(validated_data))
+            raise
+
+    def get_unique_conflict_values(self, attrs):
+        values = {}
+        if self.instance is not None:
+            opts = self.Meta.model._meta
+            for field_names in self.unique_conflict_errors:
+                for field_name in field_names:
+                    field = opts.get_field(field_name)
+                    values[field_name] = getattr(self.instance, field.attname)
+        values.update(attrs)
+        return values
+
+    def check_unique_conflict(self, values):
+        queryset = self.Meta.model._default_manager.all()
+        if self.instance is not None:
+            queryset = queryset.exclude(pk=self.instance.pk)
+        for field_names, detail in self.unique_conflict_errors.items():
+            if not all(field_name in values for field_name in field_names):
+                continue
+            lookups = {field_name: values[field_name] for field_name in field_names}
+            if queryset.filter(**lookups).exists():
+                # validate에서 발생한 ValidationError와 같은 형식({"title": ["..."]})으로 응답한다.
+                exc = rest_serializers.ValidationError(detail)
+                raise rest_serializers.ValidationError(
+                    rest_serializers.as_serializer_error(exc)
+                )
+
+
+class BulkListSerializer(
+    ValidateOnlySerializerMixin,
+    BulkListSerializerMixin,
+    rest_serializers.ListSerializer,
+):
+    pass
+
+
 class Serializer(ValidateOnlySerializerMixin, rest_serializers.Serializer):
     pass
 
 
 class ModelSerializer(ValidateOnlySerializerMixin, rest_serializers.ModelSerializer):
     pass
+
+
+# Fast Read
+# =============================================================================
+# 읽기 전용 응답(list 등)에서 모델 인스턴스를 생성하지 않고 queryset.values_list()의 행(tuple)을
+# 바로 dict로 변환합니다. 읽을 컬럼은 serializer class와 필드 구성마다 한 번만 확인하며,
+# 값의 변환 함수는 serializer마다 현재 필드에서 가져옵니다. (many=True라면 응답마다 한 번)
+#
+# 모든 필드가 모델의 컬럼과 1:1로 연결된 경우에만 ReadPlan이 생성되며,
+# SerializerMethodField, "a.b" 형식의 source, 중첩된 serializer, 재정의된 to_representation 등이 있다면
+# 기존과 같이 모델 인스턴스로 직렬화합니다.
+#
+# FastReadSerializerMixin은 FastReadGenericViewSetMixin(viewsets)의 fast_read_actions에서 사용되며,
+# get_read_plan()이 None이 아니라면 view는 queryset.values_list(*plan.columns)의 행을 전달합니다.
+# (serializer의 docstring은 drf-spectacular에서 스키마의 description으로 사용되므로 mixin에 docstring을 작성하지 않습니다.)
+ReadPlan = namedtuple("ReadPlan", ["columns", "to_dict"])
+
+# DB에서 읽은 값이 to_representation의 결과와 같은 (필드, 모델 필드의 internal type)
+IDENTITY_FIELDS = {
+    rest_serializers.IntegerField: frozenset(
+        (
+            "AutoField",
+            "BigAutoField",
+            "SmallAutoField",
+            "IntegerField",
+            "BigIntegerField",
+            "SmallIntegerField",
+            "PositiveIntegerField",
+            "PositiveBigIntegerField",
+            "PositiveSmallIntegerField",
+        )
+    ),
+    rest_serializers.CharField: frozenset(("CharField", "TextField")),
+}
+
+
+def get_field_column(serializer_field, model):
+    """
+    필드가 읽는 컬럼(attname)을 반환합니다.
+    모델의 컬럼과 1:1로 연결되지 않는 필드라면 None을 반환합니다.
+    """
+    if len(serializer_field.source_attrs) != 1:
+        return None
+    try:
+        model_field = model._meta.get_field(serializer_field.source)
+    except FieldDoesNotExist:
+        return None
+    if not model_field.concrete or model_field.many_to_many:
+        return None
+    if (
+        model_field.is_relation
+        and type(serializer_field) is not rest_serializers.PrimaryKeyRelatedField
+    ):
+        return None
+    return model_field.attname
+
+
+def get_field_converter(serializer_field, model):
+    """
+    컬럼의 값을 변환하는 함수를 반환합니다. (None이라면 그대로 사용)
+    필드의 인자(pk_field 등)와 context에 따라 달라질 수 있으므로 현재 serializer의 필드에서 가져옵니다.
+    """
+    model_field = model._meta.get_field(serializer_field.source)
+    if model_field.is_relation:
+        if serializer_field.pk_field is not None:
+            return serializer_field.pk_field.to_representation
+        return None
+    field_class = type(serializer_field)
+    if model_field.get_internal_type() in IDENTITY_FIELDS.get(field_class, ()):
+        return None
+    return serializer_field.to_representation
+
+
+def compile_read_plan(names, columns, converters):
+    if not any(converters):
+        return ReadPlan(columns, lambda row: dict(zip(names, row)))
+    items = tuple(zip(names, converters))
+
+    def to_dict(row):
+        # Serializer.to_representation과 같이 None은 변환하지 않는다.
+        return {
+            name: value if converter is None or value is None else converter(value)
+            for (name, converter), value in zip(items, row)
+        }
+
+    return ReadPlan(columns, to_dict)
+
+
+class FastReadSerializerMixin:
+    def get_read_plan(self):
+        if "_read_plan" not in self.__dict__:
+            self._read_plan = self.build_read_plan()
+        return self._read_plan
+
+    def build_read_plan(self):
+        if not self.has_default_to_representation():
+            return None
+        fields = list(self._readable_fields)
+        # 읽을 컬럼은 필드 구성(read_mask 등)이 같다면 serializer class 단위로 재사용한다.
+        # 변환 함수는 필드의 인자, context에 따라 달라지므로 재사용하지 않는다.
+        key = tuple((field.field_name, type(field), field.source) for field in fields)
+        read_columns = type(self).__dict__.get("_read_columns")
+        if read_columns is None:
+            read_columns = {}
+            setattr(type(self), "_read_columns", read_columns)
+        if key not in read_columns:
+            read_columns[key] = self.get_read_columns(fields)
+        columns = read_columns[key]
+        if columns is None:
+            return None
+        model = self.Meta.model
+        names = tuple(field.field_name for field in fields)
+        converters = tuple(get_field_converter(field, model) for field in fields)
+        return compile_read_plan(names, columns, converters)
+
+    def get_read_columns(self, fields):
+        columns = tuple(get_field_column(field, self.Meta.model) for field in fields)
+        if None in columns:
+            return None
+        return columns
+
+    def has_default_to_representation(self):
+        # mixin 이후의 class에서 to_representation을 재정의하지 않았는지 확인한다.
+        mro = type(self).__mro__
+        if (
+            type(self).to_representation
+            is not FastReadSerializerMixin.to_representation
+        ):
+            return False
+        for klass in mro[mro.index(FastReadSerializerMixin) + 1 :]:
+            if "to_representation" in klass.__dict__:
+                return klass is rest_serializers.Serializer
+        return False
+
+    def to_representation(self, instance):
+        if isinstance(instance, tuple):
+            return self.get_read_plan().to_dict(instance)
+        return super().to_representation(instance)
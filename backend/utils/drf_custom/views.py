@@ -0,0 +1,125 @@
+import gzip
+import hashlib
+import threading
+from collections import namedtuple
+from pathlib import Path
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import translation
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
+from drf_spectacular.views import SpectacularAPIView
+from .mixins import etag_in_none_match
+
+
+# Schema
+# =============================================================================
+SchemaArtifact = namedtuple(
+    "SchemaArtifact", ["content", "gzip_content", "etag", "content_type"]
+)
+
+
+def accepts_gzip(accept_encoding):
+    """
+    Accept-Encoding 헤더의 q 값을 해석하여 gzip 응답을 받을 수 있는지 반환합니다.
+
+    "gzip;q=0"처럼 명시적으로 거부한 경우는 허용하지 않으며,
+    gzip이 없으면 "*"의 q 값을 따릅니다.
+    """
+    qvalues = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        qvalue = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        qvalues[coding] = qvalue
+    return qvalues.get("gzip", qvalues.get("*", 0.0)) > 0
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    스키마를 요청마다 생성하지 않고 (버전, 형식, 언어) 단위로 한 번만 생성하여 재사용합니다.
+
+    배포 시 생성해둔 스키마 파일이 있다면 생성 과정 없이 해당 파일을 사용합니다.
+    (python manage.py spectacular --api-version v0 --file {schema_dir}/v0.yaml)
+
+    ETag(If-None-Match, 304)와 gzip(Accept-Encoding)을 지원합니다.
+
+    Can Overwrite
+
+      - "schema_dir" : settings.DRF_CUSTOM_SCHEMA_DIR, {version}.yaml, {version}.json 파일을 찾을 경로
+    """
+
+    schema_dir = getattr(settings, "DRF_CUSTOM_SCHEMA_DIR", None)
+
+    _schema_artifacts = {}
+    _schema_artifacts_lock = threading.Lock()
+
+    def _get_schema_response(self, request):
+        if not self.serve_public:
+            # 요청한 사용자의 권한에 따라 스키마가 달라지므로 캐시하지 않는다.
+            return super()._get_schema_response(request)
+        version = self.api_version or request.version
+        key = (version, request.accepted_renderer.format, translation.get_language())
+        artifact = self._schema_artifacts.get(key)
+        if artifact is None:
+            with self._schema_artifacts_lock:
+                artifact = self._schema_artifacts.get(key)
+                if artifact is None:
+                    artifact = self.build_schema_artifact(request, version)
+                    self._schema_artifacts[key] = artifact
+        return self.get_artifact_response(request, artifact)
+
+    def build_schema_artifact(self, request, version):
+        renderer = request.accepted_renderer
+        content = self.read_schema_file(request, version)
+        if content is None:
+            generator = self.generator_class(urlconf=self.urlconf, api_version=version)
+            schema = generator.get_schema(request=request, public=self.serve_public)
+            content = renderer.render(
+                schema, request.accepted_media_type, self.get_renderer_context()
+            )
+        content_type = request.accepted_media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+        return SchemaArtifact(
+            content=content,
+            gzip_content=gzip.compress(content, mtime=0),
+            etag=f'"{hashlib.md5(content).hexdigest()}"',
+            content_type=content_type,
+        )
+
+    def read_schema_file(self, request, version):
+        # 스키마 파일은 기본 언어로 생성되므로 lang이 지정된 경우에는 사용하지 않는다.
+        if self.schema_dir is None or request.GET.get("lang"):
+            return None
+        path = Path(self.schema_dir) / f"{version}.{request.accepted_renderer.format}"
+        if not path.is_file():
+            return None
+        return path.read_bytes()
+
+    def get_artifact_response(self, request, artifact):
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag_in_none_match(artifact.etag, if_none_match):
+            response = HttpResponseNotModified()
+        elif accepts_gzip(request.headers.get("Accept-Encoding", "")):
+            response = HttpResponse(
+                artifact.gzip_content, content_type=artifact.content_type
+            )
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(
+                artifact.content, content_type=artifact.content_type
+            )
+        response["ETag"] = artifact.etag
+        patch_cache_control(response, no_cache=True)
+        patch_vary_headers(response, ["Accept", "Accept-Encoding"])
+        return response
@@ -1,6 +1,26 @@
-from rest_framework import viewsets as rest_viewsets
-from rest_framework.exceptions import NotFound
-from .serializers import ValidateOnlySerializerMixin
+import asyncio
+import inspect
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import pagination as rest_pagination
+from rest_framework import status, viewsets as rest_viewsets
+from rest_framework.generics import get_object_or_404
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from .exceptions import PerformValidateOnly
+from .serializers import get_validate_only_serializer_class
+
+
+class _RequestUnavailable(Exception):
+    pass
+
+
+class _UnavailableRequest:
+    # URL conf를 불러올 때 view의 request, args, kwargs 대신 지정되며, 사용되면 _RequestUnavailable이 발생한다.
+    def _raise(self, *args, **kwargs):
+        raise _RequestUnavailable()
+
+    __getattr__ = __getitem__ = __iter__ = __len__ = __contains__ = __bool__ = _raise
 
 
 class ValidateOnlyGenericViewSetMixin:
@@ -10,7 +30,34 @@ class ValidateOnlyGenericViewSetMixin:
     validate_only_allow_param_values = frozenset(("true",))
 
     _validate_only_allow_request_methods = frozenset(("POST", "PUT", "PATCH"))
-    _validate_only_serializer_registry = {}
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        cls.prepare_validate_only_serializer_classes(actions, initkwargs)
+        return view
+
+    @classmethod
+    def prepare_validate_only_serializer_classes(cls, actions, initkwargs):
+        # 요청을 처리하는 중에 class를 생성하지 않도록 URL conf를 불러올 때 미리 생성한다.
+        # (action마다 serializer_class가 다를 수 있으므로 action을 지정한 view로 확인한다.)
+        # 요청이 없으므로 get_serializer_class가 self.request, self.kwargs 등을 사용한다면
+        # 미리 생성하지 않고 첫 요청에서 생성한다. (get_validate_only_serializer_class)
+        if not actions:
+            return
+        for action in cls.validate_only_actions:
+            if action not in actions.values():
+                continue
+            view = cls(**initkwargs)
+            view.action = action
+            view.request = view.args = view.kwargs = _UnavailableRequest()
+            try:
+                serializer_class = super(
+                    ValidateOnlyGenericViewSetMixin, view
+                ).get_serializer_class()
+            except _RequestUnavailable:
+                continue
+            get_validate_only_serializer_class(serializer_class)
 
     def get_serializer_class(self):
         serializer_class = super().get_serializer_class()
@@ -30,26 +77,155 @@ class ValidateOnlyGenericViewSetMixin:
         return False
 
     def get_validate_only_serializer_class(self, serializer_class):
-        validate_only_serializer_class_name = "ValidateOnly" + serializer_class.__name__
-        if (
-            validate_only_serializer_class_name
-            in self._validate_only_serializer_registry
-        ):
-            return self._validate_only_serializer_registry[
-                validate_only_serializer_class_name
+        return get_validate_only_serializer_class(serializer_class)
+
+    def handle_exception(self, exc):
+        # 204 응답은 본문을 가질 수 없으므로 (ASGI 서버는 본문이 있는 204 응답을 거부한다.) 빈 응답을 반환한다.
+        if isinstance(exc, PerformValidateOnly):
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return super().handle_exception(exc)
+
+
+class ReadMaskGenericViewSetMixin:
+
+    read_mask_param = "read_mask"
+    read_mask_actions = []
+
+    @property
+    def read_mask(self):
+        if self.action not in self.read_mask_actions:
+            return None
+        value = self.request.query_params.get(self.read_mask_param, "")
+        read_mask = frozenset(field.strip() for field in value.split(",")) - {""}
+        return read_mask or None
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        read_mask = self.read_mask
+        if read_mask is None:
+            return queryset
+        serializer = self.get_serializer_class()(context=self.get_serializer_context())
+        self.check_read_mask(serializer, read_mask)
+        return self.get_read_mask_queryset(queryset, serializer, read_mask)
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        read_mask = self.read_mask
+        if read_mask is not None:
+            self.apply_read_mask(getattr(serializer, "child", serializer), read_mask)
+        return serializer
+
+    def check_read_mask(self, serializer, read_mask):
+        invalid_fields = read_mask - serializer.fields.keys()
+        if invalid_fields:
+            raise ValidationError(
+                detail={
+                    f"{self.read_mask_param}": f"존재하지 않는 필드입니다. ({', '.join(sorted(invalid_fields))})"
+                },
+            )
+
+    def apply_read_mask(self, serializer, read_mask):
+        self.check_read_mask(serializer, read_mask)
+        for field_name in list(serializer.fields):
+            if field_name not in read_mask:
+                serializer.fields.pop(field_name)
+
+    def get_read_mask_queryset(self, queryset, serializer, read_mask):
+        # read_mask의 필드가 모두 모델의 컬럼과 연결된 경우에만 .only()를 적용한다.
+        # (SerializerMethodField, property 등은 어떤 컬럼이 필요한지 알 수 없다.)
+        if queryset.query.select_related is True:
+            return queryset
+        model = queryset.model
+        columns = {model._meta.pk.name}
+        for field_name in read_mask:
+            source = serializer.fields[field_name].source
+            if source == "*" or "." in source:
+                return queryset
+            try:
+                model_field = model._meta.get_field(source)
+            except FieldDoesNotExist:
+                return queryset
+            if not model_field.concrete or model_field.many_to_many:
+                return queryset
+            columns.add(model_field.name)
+        if queryset.query.select_related:
+            # 제외된 관계를 select_related에 남겨두면 deferred + traversed 에러가 발생한다.
+            select_related = [
+                path
+                for path in self.get_select_related_paths(queryset.query.select_related)
+                if path.split("__")[0] in columns
             ]
-        validate_only_serializer_class = type(
-            validate_only_serializer_class_name,
-            (ValidateOnlySerializerMixin, serializer_class),
-            {},
+            queryset = queryset.select_related(None).select_related(*select_related)
+        return queryset.only(*columns)
+
+    def get_select_related_paths(self, select_related, prefix=""):
+        for field_name, children in select_related.items():
+            path = prefix + field_name
+            if children:
+                yield from self.get_select_related_paths(children, path + "__")
+            else:
+                yield path
+
+
+class SerializerMetricsGenericViewSetMixin:
+    """
+    request.metrics(utils.metrics.middleware.MetricsMiddleware)가 있다면
+    serializer의 to_representation 시간을 request.metrics.serializer_time에 누적합니다.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        metrics = getattr(self.request, "metrics", None)
+        if metrics is not None:
+            # many=True인 경우에도 최상위 serializer만 감싸므로 중복 측정되지 않는다.
+            serializer.to_representation = metrics.timed(
+                "serializer_time", serializer.to_representation
+            )
+        return serializer
+
+
+class FastReadGenericViewSetMixin:
+    """
+    fast_read_actions에서 serializer(FastReadSerializerMixin)의 ReadPlan을 사용할 수 있다면
+    queryset.values_list(*plan.columns)의 행을 모델 인스턴스 없이 직렬화합니다.
+
+    Can Overwrite
+
+      - "fast_read_actions" : [], ex) ["list", "batch_get", "search"]
+
+    CursorPagination은 객체의 속성으로 cursor를 생성하므로 사용되지 않습니다.
+    """
+
+    fast_read_actions = []
+
+    def get_read_plan(self, serializer):
+        if self.action not in self.fast_read_actions:
+            return None
+        if isinstance(self.paginator, rest_pagination.CursorPagination):
+            return None
+        get_read_plan = getattr(
+            getattr(serializer, "child", serializer), "get_read_plan", None
         )
-        self._validate_only_serializer_registry[
-            validate_only_serializer_class_name
-        ] = validate_only_serializer_class
-        return validate_only_serializer_class
+        if get_read_plan is None:
+            return None
+        return get_read_plan()
 
 
 class CheckPathVariableViewSetMixin(rest_viewsets.GenericViewSet):
+    """
+    path_variable_config = {
+        "collection_pk": {
+            "field": "parent",
+            "allow_wildcard_actions": ["list", "retrieve"],
+            "model": Collection,  # Can Overwrite, default: field의 related_model
+        }
+    }
+
+    get_path_variable_object(lookup_url_kwarg)는 Path 변수가 가리키는 상위 리소스를
+    처음 호출될 때 한 번만 조회하고 요청이 끝날 때까지 재사용합니다.
+    (serializer에서는 self.context["view"]를 통해 활용합니다.)
+    """
+
     def initial(self, request, *args, **kwargs):
         super().initial(request, *args, **kwargs)
         self.check_path_variable()
@@ -64,10 +240,91 @@ class CheckPathVariableViewSetMixin(rest_viewsets.GenericViewSet):
             if lookup_value == "-" and self.action not in allow_wildcard_actions:
                 raise NotFound()
 
+    def get_path_variable_object(self, lookup_url_kwarg):
+        # view 인스턴스는 요청마다 생성되므로 인스턴스에 기록하여 요청 단위로 재사용한다.
+        path_variable_objects = self.__dict__.setdefault("_path_variable_objects", {})
+        if lookup_url_kwarg not in path_variable_objects:
+            lookup_value = self.kwargs[lookup_url_kwarg]
+            if lookup_value == "-":
+                raise NotFound()
+            options = self.path_variable_config[lookup_url_kwarg]
+            model = options.get("model")
+            if model is None:
+                model = (
+                    self.get_queryset()
+                    .model._meta.get_field(options["field"])
+                    .related_model
+                )
+            path_variable_objects[lookup_url_kwarg] = get_object_or_404(
+                model._default_manager.all(), pk=lookup_value
+            )
+        return path_variable_objects[lookup_url_kwarg]
+
 
 class GenericViewSet(
     ValidateOnlyGenericViewSetMixin,
+    ReadMaskGenericViewSetMixin,
+    SerializerMetricsGenericViewSetMixin,
+    FastReadGenericViewSetMixin,
     CheckPathVariableViewSetMixin,
     rest_viewsets.GenericViewSet,
 ):
     pass
+
+
+class AsyncViewSetMixin:
+    """
+    action을 async def로 작성할 수 있는 ViewSet입니다. (mixins.Async*ModelMixin)
+
+    as_view가 반환하는 view는 coroutine function으로 표시되므로 Django가 async view로 처리합니다.
+    - ASGI: event loop에서 실행되며, sync 작업은 config.asgi가 요청마다 지정한 스레드에서 실행됩니다.
+    - WSGI: Django가 요청마다 async_to_sync로 실행합니다. gevent 워커에서는 사용하지 않습니다.
+
+    Django 3.2에는 async ORM API가 없으므로 데이터베이스 작업은 self.sync_to_async로 실행됩니다.
+    initial(권한, path 변수 검사 등), handle_exception, finalize_response 등
+    기존의 sync hook은 그대로 사용할 수 있으며, sync action은 self.sync_to_async로 실행됩니다.
+    """
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        # Django는 asyncio.iscoroutinefunction(view)로 view를 await할지 결정한다.
+        return markcoroutinefunction(super().as_view(actions, **initkwargs))
+
+    def sync_to_async(self, func):
+        return sync_to_async(func)
+
+    async def dispatch(self, request, *args, **kwargs):
+        # rest_framework.views.APIView.dispatch와 동일한 흐름
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await self.sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+            # extend_schema_view 등으로 감싸진 action은 sync 함수가 coroutine을 반환한다.
+            if asyncio.iscoroutinefunction(inspect.unwrap(handler)):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await self.sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = exc
+        self.response = await self.sync_to_async(self.sync_finalize_response)(
+            request, response, *args, **kwargs
+        )
+        return self.response
+
+    def sync_finalize_response(self, request, response, *args, **kwargs):
+        if isinstance(response, Exception):
+            response = self.handle_exception(response)
+        return self.finalize_response(request, response, *args, **kwargs)
+
+
+class AsyncGenericViewSet(AsyncViewSetMixin, GenericViewSet):
+    pass
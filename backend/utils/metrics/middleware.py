@@ -0,0 +1,213 @@
+import asyncio
+import socket
+import time
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from .registry import Registry
+
+
+# Settings
+# =============================================================================
+# METRICS = {
+#     "DIR": None,  # 워커 간 집계를 위해 지표 파일을 기록할 디렉토리
+#     "FLUSH_INTERVAL": 5,  # 지표 파일을 기록하는 주기(초)
+#     "STATSD_ADDRESS": None,  # "host:port", 요청마다 UDP로 지표를 전송
+#     "STATSD_PREFIX": "backend",
+#     "MIDDLEWARE_ENABLED": False,  # MetricsMiddleware를 MIDDLEWARE에 추가 (config.settings)
+# }
+def get_metrics_settings():
+    return getattr(settings, "METRICS", {})
+
+
+@lru_cache(maxsize=None)
+def get_registry():
+    options = get_metrics_settings()
+    return Registry(
+        directory=options.get("DIR"), flush_interval=options.get("FLUSH_INTERVAL", 5)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_statsd_client():
+    options = get_metrics_settings()
+    address = options.get("STATSD_ADDRESS")
+    if not address:
+        return None
+    host, port = address.rsplit(":", 1)
+    return StatsdClient(host, int(port), prefix=options.get("STATSD_PREFIX", ""))
+
+
+class StatsdClient:
+    def __init__(self, host, port, prefix=""):
+        self.address = (host, port)
+        self.prefix = f"{prefix}." if prefix else ""
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+
+    def send(self, route, method, metrics):
+        # 하나의 요청에 대한 지표를 하나의 패킷으로 전송한다. 전송 실패는 무시한다.
+        name = f"{self.prefix}{route.replace(':', '_')}.{method.lower()}"
+        lines = [
+            f"{name}.requests:1|c",
+            f"{name}.duration:{metrics.duration * 1000:.3f}|ms",
+            f"{name}.queries:{metrics.queries}|h",
+            f"{name}.db:{metrics.db_time * 1000:.3f}|ms",
+            f"{name}.serializer:{metrics.serializer_time * 1000:.3f}|ms",
+            f"{name}.bytes:{metrics.response_bytes}|h",
+        ]
+        if metrics.cache_hits or metrics.cache_misses:
+            lines.append(f"{name}.cache_hits:{metrics.cache_hits}|c")
+            lines.append(f"{name}.cache_misses:{metrics.cache_misses}|c")
+        try:
+            self.socket.sendto("\n".join(lines).encode(), self.address)
+        except OSError:
+            pass
+
+
+# Request Metrics
+# =============================================================================
+class RequestMetrics:
+    """
+    하나의 요청에 대한 지표입니다. MetricsMiddleware에 의해 request.metrics에 기록됩니다.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.duration = 0.0
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.response_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        # connection.execute_wrapper로 등록되어 쿼리 수와 시간을 누적한다.
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - started_at
+
+    @contextmanager
+    def timer(self, name):
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, name, getattr(self, name) + time.perf_counter() - started_at)
+
+    def record_cache(self, hit):
+        # drf_custom의 응답 캐시 적중 여부를 기록한다.
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def timed(self, name, func):
+        def wrapper(*args, **kwargs):
+            with self.timer(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+class MetricsMiddleware:
+    """
+    라우트(url name) 단위로 요청 시간, 쿼리 수, 쿼리 시간, 직렬화 시간, 응답 크기를 기록합니다.
+
+    MIDDLEWARE의 가장 앞에 위치해야 전체 요청 시간을 측정할 수 있습니다.
+    직렬화 시간은 drf_custom의 GenericViewSet이 request.metrics를 통해 기록합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(self.get_response):
+            # async middleware로 표시한다. (Django 4.1 이상의 MiddlewareMixin과 동일)
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        metrics = request.metrics = RequestMetrics()
+        stack = self.enter_wrappers(metrics)
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            stack.close()
+            raise
+        if response.streaming:
+            # 스트리밍 응답은 본문을 모두 전송한 뒤에 기록한다.
+            response.streaming_content = self.stream(
+                request, response.streaming_content, metrics, stack
+            )
+        else:
+            stack.close()
+            metrics.response_bytes = len(response.content)
+            self.record(request, metrics)
+        return response
+
+    async def __acall__(self, request):
+        # execute_wrapper는 스레드 단위의 연결에 등록되므로 sync 작업이 실행되는 스레드에서 등록하고 해제한다.
+        # (요청마다 sync 작업을 실행할 스레드는 config.asgi에서 지정한다.)
+        metrics = request.metrics = RequestMetrics()
+        stack = await sync_to_async(self.enter_wrappers)(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        if response.streaming:
+            # 스트리밍 응답은 요청 스레드 밖에서 전송되므로 쿼리 지표는 포함되지 않는다.
+            response.streaming_content = self.stream(
+                request, response.streaming_content, metrics, ExitStack()
+            )
+        else:
+            metrics.response_bytes = len(response.content)
+            self.record(request, metrics)
+        return response
+
+    def enter_wrappers(self, metrics):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics.query_wrapper))
+        return stack
+
+    def stream(self, request, content, metrics, stack):
+        try:
+            for chunk in content:
+                metrics.response_bytes += len(chunk)
+                yield chunk
+        finally:
+            stack.close()
+            self.record(request, metrics)
+
+    def record(self, request, metrics):
+        metrics.duration = time.perf_counter() - metrics.started_at
+        route = self.get_route(request)
+        get_registry().record(
+            route,
+            request.method,
+            metrics.duration,
+            queries=metrics.queries,
+            db_time=metrics.db_time,
+            serializer_time=metrics.serializer_time,
+            response_bytes=metrics.response_bytes,
+            cache_hits=metrics.cache_hits,
+            cache_misses=metrics.cache_misses,
+        )
+        statsd = get_statsd_client()
+        if statsd is not None:
+            statsd.send(route, request.method, metrics)
+
+    def get_route(self, request):
+        resolver_match = getattr(request, "resolver_match", None)
+        if resolver_match is None or not resolver_match.view_name:
+            return "<unmatched>"
+        return resolver_match.view_name
@@ -0,0 +1,173 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+# Route Metrics
+# =============================================================================
+# 라우트(url name) 단위로 요청 지표를 누적합니다.
+#
+# 워커 프로세스는 각자의 지표를 메모리에 누적하고, 설정된 디렉토리가 있다면
+# 주기적으로 {pid}.json 파일에 기록합니다. 지표를 조회할 때는 모든 워커의 파일을 합산합니다.
+# 종료된 워커의 파일은 마스터 프로세스(gunicorn child_exit)에서 archived.json으로 병합합니다.
+#
+# gunicorn 마스터 프로세스에서도 사용되므로 Django에 의존하지 않습니다.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+FIELDS = (
+    "count",
+    "duration_seconds",
+    "queries",
+    "db_seconds",
+    "serializer_seconds",
+    "response_bytes",
+    "cache_hits",
+    "cache_misses",
+)
+
+ARCHIVE_FILE_NAME = "archived.json"
+
+
+def empty_stats():
+    return {**{field: 0 for field in FIELDS}, "buckets": [0] * len(DURATION_BUCKETS)}
+
+
+def merge_stats(target, source):
+    # {(route, method): stats} 형식의 두 지표를 합산하여 target에 기록한다.
+    for key, stats in source.items():
+        merged = target.setdefault(key, empty_stats())
+        for field in FIELDS:
+            # 이전 버전에서 기록된 파일에는 없는 필드가 있을 수 있다.
+            merged[field] += stats.get(field, 0)
+        merged["buckets"] = [a + b for a, b in zip(merged["buckets"], stats["buckets"])]
+    return target
+
+
+def dump_stats(stats):
+    return [
+        {"route": route, "method": method, **value}
+        for (route, method), value in stats.items()
+    ]
+
+
+def load_stats(rows):
+    return {(row.pop("route"), row.pop("method")): row for row in rows}
+
+
+def read_stats_file(path):
+    try:
+        with open(path) as f:
+            return load_stats(json.load(f))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def write_stats_file(path, stats):
+    # 다른 프로세스가 쓰는 도중의 파일을 읽지 않도록 임시 파일을 교체하는 방식으로 기록한다.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(dump_stats(stats), f)
+    os.replace(tmp_path, path)
+
+
+class Registry:
+    """
+    Can Overwrite
+
+      - "directory" : None, 워커 간 집계를 위해 지표 파일을 기록할 디렉토리
+
+      - "flush_interval" : 5, 지표 파일을 기록하는 주기(초)
+    """
+
+    def __init__(self, directory=None, flush_interval=5):
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        # fork 이후 부모 프로세스의 지표를 이어받지 않도록 초기화한다.
+        with self._lock:
+            self._pid = os.getpid()
+            self._stats = {}
+            self._flushed_at = time.monotonic()
+
+    def record(
+        self,
+        route,
+        method,
+        duration,
+        queries=0,
+        db_time=0.0,
+        serializer_time=0.0,
+        response_bytes=0,
+        cache_hits=0,
+        cache_misses=0,
+    ):
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid, self._stats = os.getpid(), {}
+            stats = self._stats.get((route, method))
+            if stats is None:
+                stats = self._stats[(route, method)] = empty_stats()
+            stats["count"] += 1
+            stats["duration_seconds"] += duration
+            stats["queries"] += queries
+            stats["db_seconds"] += db_time
+            stats["serializer_seconds"] += serializer_time
+            stats["response_bytes"] += response_bytes
+            stats["cache_hits"] += cache_hits
+            stats["cache_misses"] += cache_misses
+            for i, bucket in enumerate(DURATION_BUCKETS):
+                if duration <= bucket:
+                    stats["buckets"][i] += 1
+        if (
+            self.directory is not None
+            and time.monotonic() - self._flushed_at >= self.flush_interval
+        ):
+            self.flush()
+
+    def snapshot(self):
+        with self._lock:
+            return merge_stats({}, self._stats)
+
+    def flush(self):
+        if self.directory is None:
+            return
+        self._flushed_at = time.monotonic()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        write_stats_file(self.directory / f"{os.getpid()}.json", self.snapshot())
+
+    def collect(self):
+        # 모든 워커(종료된 워커 포함)의 지표를 합산한다.
+        if self.directory is None:
+            return self.snapshot()
+        self.flush()
+        stats = {}
+        for path in self.directory.glob("*.json"):
+            merge_stats(stats, read_stats_file(path))
+        return stats
+
+
+# Worker Lifecycle (gunicorn hooks)
+# =============================================================================
+def clear_directory(directory):
+    # 서버 시작 시 이전 실행의 지표를 제거한다. (on_starting)
+    for path in Path(directory).glob("*.json"):
+        path.unlink()
+
+
+def archive_worker(directory, pid):
+    # 종료된 워커의 지표를 archived.json에 병합한다. (child_exit)
+    directory = Path(directory)
+    path = directory / f"{pid}.json"
+    stats = read_stats_file(path)
+    if stats:
+        archive_path = directory / ARCHIVE_FILE_NAME
+        write_stats_file(
+            archive_path, merge_stats(read_stats_file(archive_path), stats)
+        )
+    if path.exists():
+        path.unlink()
@@ -0,0 +1,133 @@
+import socket
+import tempfile
+from pathlib import Path
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from apps.example.tests.factories import CollectionFactory
+from utils.metrics.middleware import RequestMetrics, StatsdClient, get_registry
+from utils.metrics.registry import (
+    Registry,
+    archive_worker,
+    empty_stats,
+    read_stats_file,
+    write_stats_file,
+)
+from utils.metrics.views import render_prometheus
+
+
+class RegistryTestCase(SimpleTestCase):
+    def test_record(self):
+        registry = Registry()
+        registry.record("collection-list", "GET", 0.02, queries=2, response_bytes=10)
+        registry.record("collection-list", "GET", 0.2, queries=3, response_bytes=20)
+        stats = registry.snapshot()[("collection-list", "GET")]
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["queries"], 5)
+        self.assertEqual(stats["response_bytes"], 30)
+        self.assertAlmostEqual(stats["duration_seconds"], 0.22)
+        # 0.025 이하 1건, 0.25 이하 2건 (누적)
+        self.assertEqual(stats["buckets"][2], 1)
+        self.assertEqual(stats["buckets"][5], 2)
+
+    def test_collect_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            registry = Registry(directory=directory)
+            registry.record("collection-list", "GET", 0.1, queries=2)
+            other_worker = {("collection-list", "GET"): empty_stats()}
+            other_worker[("collection-list", "GET")].update(count=3, queries=6)
+            write_stats_file(Path(directory) / "99999.json", other_worker)
+            stats = registry.collect()[("collection-list", "GET")]
+            self.assertEqual(stats["count"], 4)
+            self.assertEqual(stats["queries"], 8)
+
+            archive_worker(directory, 99999)
+            self.assertFalse((Path(directory) / "99999.json").exists())
+            archived = read_stats_file(Path(directory) / "archived.json")
+            self.assertEqual(archived[("collection-list", "GET")]["count"], 3)
+            self.assertEqual(registry.collect()[("collection-list", "GET")]["count"], 4)
+
+    def test_render_prometheus(self):
+        stats = {("collection-batch-get", "GET"): empty_stats()}
+        stats[("collection-batch-get", "GET")].update(count=1, queries=1)
+        text = render_prometheus(stats)
+        labels = 'route="collection-batch-get",method="GET"'
+        self.assertIn(
+            f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1', text
+        )
+        self.assertIn(f"http_request_queries_total{{{labels}}} 1", text)
+
+
+class StatsdClientTestCase(SimpleTestCase):
+    def test_send(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(server.close)
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(5)
+        client = StatsdClient(*server.getsockname(), prefix="backend")
+        self.addCleanup(client.socket.close)
+        metrics = RequestMetrics()
+        metrics.duration = 0.02
+        metrics.queries = 3
+        metrics.response_bytes = 120
+        client.send("collection-list", "GET", metrics)
+        lines = server.recv(4096).decode().split("\n")
+        # 시간은 timer(ms), 쿼리 수와 응답 크기는 histogram(h)으로 전송한다.
+        self.assertIn("backend.collection-list.get.duration:20.000|ms", lines)
+        self.assertIn("backend.collection-list.get.queries:3|h", lines)
+        self.assertIn("backend.collection-list.get.bytes:120|h", lines)
+        self.assertIn("backend.collection-list.get.requests:1|c", lines)
+
+
+class MetricsMiddlewareTestCase(TestCase):
+    def setUp(self) -> None:
+        CollectionFactory.create_batch(3)
+
+    def get_stats(self, route, method="GET"):
+        return get_registry().snapshot().get((route, method), empty_stats())
+
+    def test_record(self):
+        before = self.get_stats("collection-list")
+        response = self.client.get(reverse("collection-list"))
+        after = self.get_stats("collection-list")
+        self.assertEqual(after["count"] - before["count"], 1)
+        self.assertGreaterEqual(after["queries"] - before["queries"], 2)
+        self.assertGreater(after["db_seconds"] - before["db_seconds"], 0)
+        self.assertGreater(
+            after["serializer_seconds"] - before["serializer_seconds"], 0
+        )
+        self.assertEqual(
+            after["response_bytes"] - before["response_bytes"], len(response.content)
+        )
+
+    def test_record_streaming(self):
+        before = self.get_stats("collection-export")
+        response = self.client.get(reverse("collection-export"))
+        self.assertEqual(self.get_stats("collection-export")["count"], before["count"])
+        content = b"".join(response.streaming_content)
+        response.close()
+        after = self.get_stats("collection-export")
+        self.assertEqual(after["count"] - before["count"], 1)
+        self.assertEqual(
+            after["response_bytes"] - before["response_bytes"], len(content)
+        )
+
+    def test_prometheus_view(self):
+        self.client.get(reverse("collection-list"))
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('route="collection-list"', response.content.decode())
+
+    def test_prometheus_view_access(self):
+        url = reverse("metrics")
+        options = {"ALLOWED_IPS": ["10.0.0.0/8"], "TOKEN": "metrics-token"}
+        with self.settings(METRICS=options):
+            self.assertEqual(self.client.get(url).status_code, 403)
+            response = self.client.get(url, REMOTE_ADDR="10.1.2.3")
+            self.assertEqual(response.status_code, 200)
+            response = self.client.get(url, HTTP_AUTHORIZATION="Bearer metrics-token")
+            self.assertEqual(response.status_code, 200)
+            response = self.client.get(url, HTTP_AUTHORIZATION="Bearer other")
+            self.assertEqual(response.status_code, 403)
+        with self.settings(METRICS={"ALLOWED_IPS": []}):
+            response = self.client.get(url, HTTP_AUTHORIZATION="Bearer ")
+            self.assertEqual(response.status_code, 403)
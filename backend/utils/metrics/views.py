@@ -0,0 +1,104 @@
+import hmac
+import ipaddress
+from django.http import HttpResponse, HttpResponseForbidden
+from .middleware import get_metrics_settings, get_registry
+from .registry import DURATION_BUCKETS
+
+
+# Prometheus
+# =============================================================================
+# https://prometheus.io/docs/instrumenting/exposition_formats/
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+PROMETHEUS_METRICS = (
+    # (이름, 타입, 설명, 지표 필드)
+    ("http_request_queries", "counter", "실행된 쿼리 수", "queries"),
+    ("http_request_db_seconds", "counter", "쿼리 실행 시간", "db_seconds"),
+    (
+        "http_request_serializer_seconds",
+        "counter",
+        "직렬화 시간",
+        "serializer_seconds",
+    ),
+    ("http_response_bytes", "counter", "응답 크기", "response_bytes"),
+    ("http_response_cache_hits", "counter", "응답 캐시 적중 수", "cache_hits"),
+    ("http_response_cache_misses", "counter", "응답 캐시 실패 수", "cache_misses"),
+)
+
+
+def escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(stats):
+    lines = [
+        "# HELP http_request_duration_seconds 요청 처리 시간",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for (route, method), value in sorted(stats.items()):
+        labels = f'route="{escape_label(route)}",method="{method}"'
+        for bucket, count in zip(DURATION_BUCKETS, value["buckets"]):
+            lines.append(
+                f'http_request_duration_seconds_bucket{{{labels},le="{bucket}"}} {count}'
+            )
+        lines.append(
+            f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {value["count"]}'
+        )
+        lines.append(
+            f'http_request_duration_seconds_sum{{{labels}}} {value["duration_seconds"]}'
+        )
+        lines.append(
+            f'http_request_duration_seconds_count{{{labels}}} {value["count"]}'
+        )
+    for name, metric_type, description, field in PROMETHEUS_METRICS:
+        lines.append(f"# HELP {name}_total {description}")
+        lines.append(f"# TYPE {name}_total {metric_type}")
+        for (route, method), value in sorted(stats.items()):
+            labels = f'route="{escape_label(route)}",method="{method}"'
+            lines.append(f"{name}_total{{{labels}}} {value[field]}")
+    return "\n".join(lines) + "\n"
+
+
+# Access
+# =============================================================================
+# settings.METRICS["ALLOWED_IPS"](ip, CIDR)의 주소 또는 settings.METRICS["TOKEN"]과 일치하는
+# Authorization: Bearer {TOKEN} 헤더가 있는 요청만 지표를 조회할 수 있습니다.
+# REMOTE_ADDR을 사용하므로 proxy를 거치는 경우 proxy의 주소가 사용됩니다.
+def is_allowed_ip(address, allowed_ips):
+    try:
+        address = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    for allowed in allowed_ips:
+        try:
+            if address in ipaddress.ip_network(allowed, strict=False):
+                return True
+        except ValueError:
+            continue
+    return False
+
+
+def has_valid_token(request, token):
+    if not token:
+        return False
+    authorization = request.META.get("HTTP_AUTHORIZATION", "")
+    scheme, _, credentials = authorization.partition(" ")
+    if scheme.lower() != "bearer":
+        return False
+    return hmac.compare_digest(credentials.strip().encode(), token.encode())
+
+
+def has_metrics_access(request):
+    options = get_metrics_settings()
+    if is_allowed_ip(
+        request.META.get("REMOTE_ADDR", ""), options.get("ALLOWED_IPS", ())
+    ):
+        return True
+    return has_valid_token(request, options.get("TOKEN"))
+
+
+def prometheus_metrics_view(request):
+    if not has_metrics_access(request):
+        return HttpResponseForbidden()
+    stats = get_registry().collect()
+    return HttpResponse(render_prometheus(stats), content_type=PROMETHEUS_CONTENT_TYPE)
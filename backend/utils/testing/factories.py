@@ -0,0 +1,88 @@
+import factory
+from django.db import connections
+from django.db.models import Max
+from utils.drf_custom.cache import model_changed, objects_changed
+
+
+# Bulk Factory
+# =============================================================================
+# factory로 생성(build)한 객체들을 모델 단위의 bulk_create로 저장합니다.
+# 저장되지 않은 상위 객체(ForeignKey, SubFactory)가 있다면 상위 모델부터 순서대로 저장하므로
+# 객체 그래프 전체가 모델의 수만큼의 bulk_create로 저장됩니다.
+#
+# NestedCollectionFactory.bulk_create_batch(10)  # Collection 10개, NestedCollection 10개 (bulk_create 2번)
+# NestedCollectionFactory.bulk_create_batch(10, parent=collection)
+def get_unsaved_parents(model, objs):
+    parents = {}
+    for field in model._meta.concrete_fields:
+        if not field.many_to_one:
+            continue
+        for obj in objs:
+            if not field.is_cached(obj):
+                continue
+            parent = field.get_cached_value(obj)
+            if parent is not None and parent._state.adding:
+                parents[id(parent)] = parent
+    return list(parents.values())
+
+
+def bulk_save(objs, using="default", batch_size=None):
+    """
+    저장되지 않은 객체들을 상위 객체부터 모델 단위로 bulk_create합니다.
+
+    bulk_create는 signal을 발생시키지 않으므로 drf_custom의 model, object version을 직접 증가시킵니다.
+    """
+    groups = {}
+    for obj in objs:
+        if obj._state.adding:
+            groups.setdefault(type(obj), {})[id(obj)] = obj
+    for model, group in groups.items():
+        # 다른 모델의 상위 객체로 먼저 저장되었을 수 있다.
+        group = [obj for obj in group.values() if obj._state.adding]
+        if not group:
+            continue
+        bulk_save(get_unsaved_parents(model, group), using, batch_size)
+        bulk_create(model, group, using, batch_size)
+    return objs
+
+
+def bulk_create(model, objs, using="default", batch_size=None):
+    connection = connections[using]
+    queryset = model._default_manager.using(using)
+    if connection.features.can_return_rows_from_bulk_insert:
+        queryset.bulk_create(objs, batch_size=batch_size)
+    else:
+        # SQLite(Django 3.2) 등 bulk_create에서 pk를 반환하지 않는 데이터베이스는
+        # 이전 최대값 이후에 추가된 pk를 순서대로 할당한다. (테스트, 시드 데이터 생성용)
+        last_pk = queryset.aggregate(last_pk=Max("pk"))["last_pk"] or 0
+        queryset.bulk_create(objs, batch_size=batch_size)
+        pks = list(
+            queryset.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)
+        )
+        assert len(pks) == len(objs), "bulk_create 중 다른 쓰기가 발생하였습니다."
+        for obj, pk in zip(objs, pks):
+            obj.pk = pk
+            obj._state.adding = False
+            obj._state.db = using
+    model_changed(model)
+    objects_changed(model, [obj.pk for obj in objs])
+
+
+class BulkDjangoModelFactory(factory.django.DjangoModelFactory):
+    """
+    bulk_create로 저장하는 bulk_create_batch를 제공하는 DjangoModelFactory입니다.
+
+    Can Overwrite
+
+      - "Meta.database" : "default"
+
+    _create, post_generation 등 객체 단위로 저장하는 동작은 실행되지 않습니다.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def bulk_create_batch(cls, size, batch_size=None, **kwargs):
+        objs = cls.build_batch(size, **kwargs)
+        return bulk_save(objs, using=cls._meta.database, batch_size=batch_size)
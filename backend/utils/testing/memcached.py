@@ -0,0 +1,129 @@
+import socketserver
+import threading
+import time
+
+
+# Memcached Stand-in
+# =============================================================================
+# memcached가 설치되지 않은 환경에서 테스트와 벤치마크(benchmarks)에 사용하는 memcached text protocol 서버입니다.
+# python-memcached, pymemcache가 사용하는 명령만 구현되어 있습니다.
+#
+# with MemcachedServer() as server:
+#     server.location  # "127.0.0.1:{port}"
+class MemcachedStore:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.items = {}
+
+    def get(self, key):
+        item = self.items.get(key)
+        if item is None:
+            return None
+        flags, value, expires_at = item
+        if expires_at and expires_at <= time.time():
+            del self.items[key]
+            return None
+        return flags, value
+
+    def set(self, key, flags, exptime, value):
+        # exptime이 30일을 넘으면 unix time으로 해석한다. (memcached와 동일)
+        if exptime and exptime <= 60 * 60 * 24 * 30:
+            exptime = time.time() + exptime
+        self.items[key] = (flags, value, exptime)
+
+
+class MemcachedHandler(socketserver.StreamRequestHandler):
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        store = self.server.store
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command, *args = line.split()
+            reply = None
+            noreply = bool(args) and args[-1] == b"noreply"
+            if noreply:
+                args = args[:-1]
+            with store.lock:
+                if command in (b"get", b"gets"):
+                    reply = b""
+                    for key in args:
+                        item = store.get(key)
+                        if item is not None:
+                            flags, value = item
+                            cas = b" 0" if command == b"gets" else b""
+                            reply += b"VALUE %s %d %d%s\r\n%s\r\n" % (
+                                key,
+                                flags,
+                                len(value),
+                                cas,
+                                value,
+                            )
+                    reply += b"END\r\n"
+                elif command in (b"set", b"add", b"replace", b"cas"):
+                    key, flags, exptime, length = args[:4]
+                    value = self.rfile.read(int(length) + 2)[:-2]
+                    exists = store.get(key) is not None
+                    if (command == b"add" and exists) or (
+                        command in (b"replace", b"cas") and not exists
+                    ):
+                        reply = b"NOT_STORED\r\n"
+                    else:
+                        store.set(key, int(flags), int(exptime), value)
+                        reply = b"STORED\r\n"
+                elif command == b"delete":
+                    if store.items.pop(args[0], None) is None:
+                        reply = b"NOT_FOUND\r\n"
+                    else:
+                        reply = b"DELETED\r\n"
+                elif command in (b"incr", b"decr"):
+                    item = store.get(args[0])
+                    if item is None:
+                        reply = b"NOT_FOUND\r\n"
+                    else:
+                        delta = int(args[1]) * (1 if command == b"incr" else -1)
+                        value = b"%d" % max(int(item[1]) + delta, 0)
+                        store.items[args[0]] = (item[0], value, 0)
+                        reply = value + b"\r\n"
+                elif command == b"touch":
+                    item = store.get(args[0])
+                    if item is None:
+                        reply = b"NOT_FOUND\r\n"
+                    else:
+                        store.set(args[0], item[0], int(args[1]), item[1])
+                        reply = b"TOUCHED\r\n"
+                elif command == b"flush_all":
+                    store.items.clear()
+                    reply = b"OK\r\n"
+                elif command == b"version":
+                    reply = b"VERSION stand-in\r\n"
+                elif command == b"quit":
+                    return
+                else:
+                    reply = b"ERROR\r\n"
+            if not noreply:
+                self.wfile.write(reply)
+
+
+class MemcachedServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host="127.0.0.1", port=0):
+        super().__init__((host, port), MemcachedHandler)
+        self.store = MemcachedStore()
+
+    @property
+    def location(self):
+        host, port = self.server_address
+        return f"{host}:{port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
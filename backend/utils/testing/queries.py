@@ -0,0 +1,100 @@
+import difflib
+import json
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+
+# Query Baseline
+# =============================================================================
+# 요청마다 실행된 쿼리를 기록하고, 저장소에 포함된 기준(baseline) 파일과 비교합니다.
+# 쿼리 수가 기준보다 많아지면 기준 쿼리와 실행된 쿼리의 diff와 함께 실패합니다.
+#
+# UPDATE_QUERY_BASELINE=1 python manage.py test 로 실행하면 기준 파일을 다시 기록합니다.
+UPDATE_ENV = "UPDATE_QUERY_BASELINE"
+
+# 값이 달라지더라도 같은 쿼리로 취급되도록 SQL을 정규화한다.
+STRING_REGEX = re.compile(r"'(?:[^']|'')*'")
+NUMBER_REGEX = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?(?![\w\"])")
+IN_REGEX = re.compile(r"IN \((?:\?, )*\?\)")
+# savepoint의 이름은 스레드와 순번(s{thread_id}_x{n})을 포함한다.
+SAVEPOINT_REGEX = re.compile(r"\bs\d+_x\d+\b")
+
+
+def normalize_sql(sql):
+    sql = STRING_REGEX.sub("?", sql)
+    sql = NUMBER_REGEX.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    sql = SAVEPOINT_REGEX.sub("?", sql)
+    return IN_REGEX.sub("IN (...)", sql)
+
+
+def read_baseline(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def write_baseline(path, baseline):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+
+
+class QueryBaselineMixin:
+    """
+    TestCase에 추가하여 assertQueryBaseline을 사용합니다.
+
+    Required
+
+      - "query_baseline_file" : 기준 파일 경로, {route: {"count": 3, "queries": [...]}}
+
+    Can Overwrite
+
+      - "query_baseline_using" : "default"
+
+    with self.assertQueryBaseline("collection-list"):
+        self.client.get(url)
+
+    쿼리 수가 기준보다 적어진 경우는 실패하지 않으며, 기준 파일을 다시 기록하여 반영합니다.
+    """
+
+    query_baseline_file = None
+    query_baseline_using = "default"
+
+    @contextmanager
+    def assertQueryBaseline(self, route):
+        path = Path(self.query_baseline_file)
+        with CaptureQueriesContext(connections[self.query_baseline_using]) as context:
+            yield context
+        queries = [normalize_sql(query["sql"]) for query in context.captured_queries]
+        baseline = read_baseline(path)
+        if os.environ.get(UPDATE_ENV):
+            baseline[route] = {"count": len(queries), "queries": queries}
+            write_baseline(path, baseline)
+            return
+        expected = baseline.get(route)
+        if expected is None:
+            self.fail(
+                f"{path.name}에 {route}의 기준이 없습니다. "
+                f"{UPDATE_ENV}=1 환경변수와 함께 테스트를 실행하여 기록하세요."
+            )
+        if len(queries) > expected["count"]:
+            diff = "\n".join(
+                difflib.unified_diff(
+                    expected["queries"],
+                    queries,
+                    fromfile=f"{route} (baseline)",
+                    tofile=f"{route} (actual)",
+                    lineterm="",
+                )
+            )
+            self.fail(
+                f"{route}의 쿼리 수가 증가하였습니다. "
+                f"({expected['count']} -> {len(queries)})\n{diff}"
+            )
@@ -0,0 +1,42 @@
+from django.test import TestCase
+from apps.example.models import Collection, NestedCollection
+from apps.example.tests.factories import CollectionFactory, NestedCollectionFactory
+from utils.drf_custom.cache import get_model_version
+from utils.testing.factories import bulk_save
+
+
+class BulkFactoryTestCase(TestCase):
+    def test_bulk_create_batch(self):
+        version = get_model_version(Collection)
+        collections = CollectionFactory.bulk_create_batch(5)
+        self.assertEqual(
+            [collection.pk for collection in collections],
+            list(Collection.objects.order_by("pk").values_list("pk", flat=True)),
+        )
+        self.assertEqual(
+            [collection.title for collection in collections],
+            [collection.title for collection in Collection.objects.order_by("pk")],
+        )
+        self.assertFalse(any(collection._state.adding for collection in collections))
+        self.assertNotEqual(get_model_version(Collection), version)
+
+    def test_object_graph(self):
+        # 상위 객체(SubFactory)부터 모델 단위로 저장된다.
+        with self.assertNumQueries(6):
+            nested_collections = NestedCollectionFactory.bulk_create_batch(4)
+        self.assertEqual(Collection.objects.count(), 4)
+        for nested_collection in nested_collections:
+            self.assertEqual(
+                NestedCollection.objects.get(pk=nested_collection.pk).parent_id,
+                nested_collection.parent.pk,
+            )
+
+    def test_existing_parent(self):
+        collection = CollectionFactory()
+        objs = NestedCollectionFactory.build_batch(3, parent=collection)
+        shared = CollectionFactory.build()
+        objs += NestedCollectionFactory.build_batch(2, parent=shared)
+        bulk_save([*objs, shared])
+        self.assertEqual(Collection.objects.count(), 2)
+        self.assertEqual(collection.nestedcollection_set.count(), 3)
+        self.assertEqual(shared.nestedcollection_set.count(), 2)
@@ -0,0 +1,49 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+from django.test import TestCase
+from apps.example.models import Collection
+from utils.testing.queries import QueryBaselineMixin, normalize_sql
+
+
+class QueryBaselineTestCase(QueryBaselineMixin, TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.query_baseline_file = Path(directory.name) / "baseline.json"
+
+    def test_normalize_sql(self):
+        sql = 'SELECT * FROM "t1" WHERE "id" IN (1, 2, 3) AND "title" = \'it\'\'s\' LIMIT 21'
+        self.assertEqual(
+            normalize_sql(sql),
+            'SELECT * FROM "t1" WHERE "id" IN (...) AND "title" = ? LIMIT ?',
+        )
+        self.assertEqual(
+            normalize_sql('RELEASE SAVEPOINT "s140512233245568_x5"'),
+            'RELEASE SAVEPOINT "?"',
+        )
+
+    def test_baseline(self):
+        with mock.patch.dict("os.environ", {"UPDATE_QUERY_BASELINE": "1"}):
+            with self.assertQueryBaseline("route"):
+                list(Collection.objects.all())
+        baseline = json.loads(self.query_baseline_file.read_text())
+        self.assertEqual(baseline["route"]["count"], 1)
+
+        # 쿼리 수가 같거나 적다면 통과한다.
+        with self.assertQueryBaseline("route"):
+            list(Collection.objects.filter(id__in=[1, 2]))
+        with self.assertQueryBaseline("route"):
+            pass
+
+        with self.assertRaisesMessage(AssertionError, "(1 -> 2)") as context:
+            with self.assertQueryBaseline("route"):
+                list(Collection.objects.all())
+                Collection.objects.count()
+        self.assertIn('+SELECT COUNT(*) AS "__count"', str(context.exception))
+
+    def test_missing_baseline(self):
+        with self.assertRaisesMessage(AssertionError, "UPDATE_QUERY_BASELINE=1"):
+            with self.assertQueryBaseline("unknown"):
+                pass